@@ -5,13 +5,26 @@ Token-efficient: extracts key sections before sending to the model.
 20-30 Seiten Gutachten: ~40.000 Zeichen Kontext + 5.000 Output-Token für Cloud, 8.000 für Ollama.
 """
 
+import asyncio
+import hashlib
+import importlib
+import io
 import json
 import logging
+import multiprocessing
+import os
 import re
+import shutil
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 import config
+import storage
 
 logger = logging.getLogger(__name__)
 
@@ -119,48 +132,536 @@ Risiken (Pfandrechte, Sanierungsstau, schwierige Mieter). Wenn der Verkehrswert
 Mindestgebot liegt, ist das eine Chance – erwähne den Abschlag in % in der Zusammenfassung."""
 
 
-def extract_pdf_text(pdf_path: Path) -> str:
-    """Extract text from PDF using pdfplumber (primary) or pypdf2 (fallback)."""
-    text = ""
+# ── PDF text ──────────────────────────────────────────────────────────────────
+
+# Bump whenever the extraction output changes – cached texts of other
+# versions are then ignored and replaced on the next extraction.  (Which
+# engine produced a cached text is not part of the key.)
+EXTRACTOR_VERSION = 3
+
+_PAGE_SEP = "\n\n"
+
+
+class PdfText(NamedTuple):
+    """Full Gutachten text plus the offset at which each page starts in it."""
+    text: str
+    page_starts: list[int]
+
+    def page(self, i: int) -> str:
+        end = self.page_starts[i + 1] - len(_PAGE_SEP) if i + 1 < len(self.page_starts) else len(self.text)
+        return self.text[self.page_starts[i]:end]
+
+    def pages(self) -> list[str]:
+        return [self.page(i) for i in range(len(self.page_starts))]
+
+
+# ── PDF engines ───────────────────────────────────────────────────────────────
+#
+# Every engine turns a page range into one string per page; they differ a lot
+# in speed and output (benchmarks/pdf_extractors.py).  Per document, the first
+# installed engine – config.PDF_ENGINE, then PDF_ENGINES order – whose probe
+# finds a text layer is used; the others are fallbacks.
+
+class PdfEngine(ABC):
+    """
+    A text extraction library; `modules` are tried in order on first use.
+    Engines with `renders` can also rasterise a page (PNG) for OCR – the
+    only ones whose render_page is called.
+    """
+    name = ""
+    modules: tuple[str, ...] = ()
+    renders = False
+
+    def __init__(self):
+        self._module = None
+        self._loaded = False
+
+    def module(self):
+        # _loaded only after the import: threads probing at the same time must
+        # not see a half-loaded engine as "not installed" (imports are locked)
+        if not self._loaded:
+            for name in self.modules:
+                try:
+                    self._module = importlib.import_module(name)
+                    break
+                except ImportError:
+                    continue
+            self._loaded = True
+        return self._module
+
+    def available(self) -> bool:
+        return self.module() is not None
+
+    @abstractmethod
+    def page_count(self, pdf_path: str) -> int:
+        ...
+
+    @abstractmethod
+    def page_texts(self, pdf_path: str, start: int, stop: int) -> list[str]:
+        ...
+
+    def render_page(self, pdf_path: str, index: int, dpi: int) -> Optional[bytes]:
+        """Grayscale PNG of one page; optional – None unless the engine `renders`."""
+        return None
+
+
+def _png(image) -> bytes:
+    """PIL image → grayscale PNG bytes."""
+    buf = io.BytesIO()
+    image.convert("L").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class _PyMuPdfEngine(PdfEngine):
+    name = "pymupdf"
+    modules = ("pymupdf", "fitz")
+    renders = True
+
+    def page_count(self, pdf_path: str) -> int:
+        with self.module().open(pdf_path) as doc:
+            return doc.page_count
+
+    def page_texts(self, pdf_path: str, start: int, stop: int) -> list[str]:
+        with self.module().open(pdf_path) as doc:
+            return [doc[i].get_text() for i in range(start, stop)]
+
+    def render_page(self, pdf_path: str, index: int, dpi: int) -> bytes:
+        with self.module().open(pdf_path) as doc:
+            return doc[index].get_pixmap(dpi=dpi, colorspace=self.module().csGRAY).tobytes("png")
+
+
+class _PdfiumEngine(PdfEngine):
+    name = "pdfium"
+    modules = ("pypdfium2",)
+    renders = True
+
+    def page_count(self, pdf_path: str) -> int:
+        pdf = self.module().PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    def page_texts(self, pdf_path: str, start: int, stop: int) -> list[str]:
+        pdf = self.module().PdfDocument(pdf_path)
+        try:
+            texts = []
+            for i in range(start, stop):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                texts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return texts
+        finally:
+            pdf.close()
+
+    def render_page(self, pdf_path: str, index: int, dpi: int) -> bytes:
+        pdf = self.module().PdfDocument(pdf_path)
+        try:
+            page = pdf[index]
+            image = page.render(scale=dpi / 72, grayscale=True).to_pil()
+            page.close()
+            return _png(image)
+        finally:
+            pdf.close()
+
+
+class _PdfplumberEngine(PdfEngine):
+    name = "pdfplumber"
+    modules = ("pdfplumber",)
+    renders = True   # via pypdfium2, which pdfplumber ≥ 0.11 depends on
+
+    def page_count(self, pdf_path: str) -> int:
+        with self.module().open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def page_texts(self, pdf_path: str, start: int, stop: int) -> list[str]:
+        with self.module().open(pdf_path) as pdf:
+            return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
+
+    def render_page(self, pdf_path: str, index: int, dpi: int) -> bytes:
+        with self.module().open(pdf_path) as pdf:
+            return _png(pdf.pages[index].to_image(resolution=dpi).original)
+
+
+class _PyPdf2Engine(PdfEngine):
+    name = "pypdf2"
+    modules = ("PyPDF2",)
+
+    def page_count(self, pdf_path: str) -> int:
+        with open(pdf_path, "rb") as f:
+            return len(self.module().PdfReader(f).pages)
+
+    def page_texts(self, pdf_path: str, start: int, stop: int) -> list[str]:
+        with open(pdf_path, "rb") as f:
+            pages = self.module().PdfReader(f).pages
+            return [pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+PDF_ENGINES: dict[str, PdfEngine] = {
+    e.name: e for e in (_PyMuPdfEngine(), _PdfiumEngine(), _PdfplumberEngine(), _PyPdf2Engine())
+}
+
+
+def register_engine(engine: PdfEngine, first: bool = False):
+    """Add (or replace) an engine; `first` puts it at the top of the auto order.
+    Register at import time – the extraction worker processes import this module."""
+    global PDF_ENGINES
+    rest = {name: e for name, e in PDF_ENGINES.items() if name != engine.name}
+    PDF_ENGINES = {engine.name: engine, **rest} if first else {**rest, engine.name: engine}
+
+
+def available_engines() -> list[str]:
+    return [name for name, e in PDF_ENGINES.items() if e.available()]
+
+
+def _engine_order() -> list[str]:
+    names = available_engines()
+    if config.PDF_ENGINE in names:
+        names.remove(config.PDF_ENGINE)
+        names.insert(0, config.PDF_ENGINE)
+    elif config.PDF_ENGINE != "auto":
+        logger.warning("PDF engine %s is not installed – using %s", config.PDF_ENGINE, names[:1])
+    return names
+
+
+def _clean_page(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def _garbage(text: str) -> int:
+    """Characters of undecodable glyphs ("(cid:12)", U+FFFD)."""
+    return 6 * text.count("(cid:") + text.count("\ufffd")
+
+
+def _has_text_layer(sample: str) -> bool:
+    """Readable text, not empty (scan) and not undecodable glyphs."""
+    chars = "".join(sample.split())
+    if len(chars) < 20:
+        return False
+    letters = sum(c.isalpha() for c in chars)
+    return _garbage(sample) < 0.1 * len(chars) and letters > 0.3 * len(chars)
+
+
+def _needs_ocr(page: str) -> bool:
+    """No text layer on this page: (nearly) empty, or mostly undecodable glyphs."""
+    chars = "".join(page.split())
+    return len(chars) < 20 or _garbage(page) >= 0.1 * len(chars)
+
+
+class PdfProbe(NamedTuple):
+    engine: str
+    pages: int
+    has_text: bool
+
+
+def probe_pdf(pdf_path: Path) -> Optional[PdfProbe]:
+    """
+    Pick the engine for one document: page count plus the text of the first,
+    middle and last page, engine by engine (config.PDF_ENGINE first), until
+    one finds a text layer.  Without any text layer (scan) the first engine that
+    could open the file is used.  None if no engine can open it.
+    """
+    fallback = None
+    for name in _engine_order():
+        engine = PDF_ENGINES[name]
+        try:
+            n = engine.page_count(str(pdf_path))
+            sample = "".join(t for i in sorted({0, n // 2, n - 1}) if 0 <= i < n
+                             for t in engine.page_texts(str(pdf_path), i, i + 1))
+        except Exception as e:
+            logger.debug("%s cannot read %s: %s", name, Path(pdf_path).name, e)
+            continue
+        probe = PdfProbe(name, n, _has_text_layer(sample))
+        if probe.has_text:
+            return probe
+        fallback = fallback or probe
+    return fallback
+
+
+def _extract_page_range(engine: str, pdf_path: str, start: int, stop: int) -> list[str]:
+    """Pages [start, stop) with one engine – runs in a worker process."""
+    return [_clean_page(t) for t in PDF_ENGINES[engine].page_texts(pdf_path, start, stop)]
+
+
+def _extract_pages(pdf_path: Path, skip: str = "") -> Optional[list[str]]:
+    """All pages in this thread, engine by engine until one works; None if all fail."""
+    for name in _engine_order():
+        if name == skip:
+            continue
+        try:
+            n = PDF_ENGINES[name].page_count(str(pdf_path))
+            pages = _extract_page_range(name, str(pdf_path), 0, n)
+        except Exception as e:
+            logger.warning("%s failed on %s (%s)", name, Path(pdf_path).name, e)
+            continue
+        logger.info("Extracted %d pages via %s", len(pages), name)
+        return pages
+    logger.error("PDF extraction failed for %s", Path(pdf_path).name)
+    return None
+
+
+# Worker processes shared by all extractions (created on first use)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _pdf_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = config.PDF_WORKERS or os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs Qt / asyncio threads is unsafe
+            _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pdf_pool():
+    """Stop the extraction worker processes (pending extractions are cancelled)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _page_runs(indices: list[int], size: int) -> list[tuple[int, int]]:
+    """Sorted page indices as [start, stop) ranges of consecutive pages, at most `size` long."""
+    runs: list[list[int]] = []
+    for i in indices:
+        if runs and runs[-1][1] == i and i - runs[-1][0] < size:
+            runs[-1][1] += 1
+        else:
+            runs.append([i, i + 1])
+    return [(a, b) for a, b in runs]
+
+
+def _map_page_ranges(fn, engine: str, pdf_path: Path, ranges: list[tuple[int, int]], *args):
+    """
+    Yield fn(engine, path, start, stop, *args) for each range, in range order –
+    on the worker processes when there is more than one range.  Closing the
+    generator early cancels the ranges that have not started yet.
+    """
+    global _pool
+    pool = _pdf_pool() if len(ranges) > 1 else None
+    if pool is None:
+        for a, b in ranges:
+            yield fn(engine, str(pdf_path), a, b, *args)
+        return
+    futures = [pool.submit(fn, engine, str(pdf_path), a, b, *args) for a, b in ranges]
     try:
-        import pdfplumber
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            pages = []
-            for page in pdf.pages:
-                t = page.extract_text() or ""
-                pages.append(t)
-            text = "\n\n".join(pages)
-        logger.info("Extracted %d chars via pdfplumber", len(text))
+        for f in futures:
+            yield f.result()
+    except BrokenProcessPool:
+        logger.error("PDF worker process died on %s – restarting the pool", Path(pdf_path).name)
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        raise
+    finally:
+        for f in futures:
+            f.cancel()
+
+
+def _extract_pages_parallel(pdf_path: Path) -> Optional[list[str]]:
+    """
+    Text per page with the engine probe_pdf() picks.  Documents longer than
+    PDF_PAGES_PER_TASK are fanned out over the worker processes in chunks of
+    that many pages and put back in page order.  Blocks the calling thread
+    (not the event loop – see extract_pdf_async).
+    """
+    probe = probe_pdf(pdf_path)
+    if probe is None:
+        logger.error("No PDF engine can open %s", Path(pdf_path).name)
+        return None
+    ranges = _page_runs(list(range(probe.pages)), max(1, config.PDF_PAGES_PER_TASK))
+    try:
+        pages = [text for chunk in _map_page_ranges(_extract_page_range, probe.engine, pdf_path, ranges)
+                 for text in chunk]
+        logger.info("Extracted %d pages via %s (%d tasks)", probe.pages, probe.engine, len(ranges))
+        return pages
+    except BrokenProcessPool:
+        pass
     except Exception as e:
-        logger.warning("pdfplumber failed (%s), trying pypdf2", e)
+        logger.warning("%s failed on %s (%s)", probe.engine, Path(pdf_path).name, e)
+    return _extract_pages(pdf_path, skip=probe.engine)
+
+
+# ── OCR ───────────────────────────────────────────────────────────────────────
+#
+# Scanned Gutachten have pages without a text layer.  Those pages (only those)
+# are rendered and read by Tesseract, one page per task on the PDF worker
+# processes.  The result is cached per page image (storage.get_ocr_text), so a
+# page is OCR'd once.
+
+# done, total pages of the running OCR
+OcrProgress = Callable[[int, int], None]
+
+_OCR_TIMEOUT = 300  # s per page
+
+
+def tesseract_command() -> Optional[str]:
+    """Path of the Tesseract binary, None if OCR is off or Tesseract is not installed."""
+    if not config.OCR_LANGUAGES:
+        return None
+    if config.OCR_COMMAND:
+        return shutil.which(config.OCR_COMMAND)
+    windows_default = Path(os.environ.get("ProgramFiles", r"C:\Program Files")) / "Tesseract-OCR" / "tesseract.exe"
+    return shutil.which("tesseract") or shutil.which(str(windows_default))
+
+
+def _ocr_page_range(renderer: str, pdf_path: str, start: int, stop: int,
+                    dpi: int, languages: str, command: str) -> list[tuple[str, str]]:
+    """(text, error) per page [start, stop) – runs in a worker process."""
+    results = []
+    for i in range(start, stop):
         try:
-            import PyPDF2
-            with open(pdf_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                text = "\n\n".join(
-                    page.extract_text() or "" for page in reader.pages
-                )
-            logger.info("Extracted %d chars via PyPDF2", len(text))
-        except Exception as e2:
-            logger.error("PDF extraction failed: %s", e2)
+            image = PDF_ENGINES[renderer].render_page(pdf_path, i, dpi)
+            digest = hashlib.sha256(image).hexdigest()
+            text = storage.get_ocr_text(digest, languages)
+            if text is None:
+                proc = subprocess.run(
+                    [command, "stdin", "stdout", "-l", languages, "--dpi", str(dpi)],
+                    input=image, capture_output=True, timeout=_OCR_TIMEOUT,
+                    # one thread per Tesseract – the pages already run in parallel
+                    env={**os.environ, "OMP_THREAD_LIMIT": "1"},
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+                if proc.returncode != 0:
+                    raise RuntimeError(proc.stderr.decode(errors="replace").strip()[-300:])
+                text = _clean_page(proc.stdout.decode("utf-8", errors="replace"))
+                storage.put_ocr_text(digest, languages, text)
+            results.append((text, ""))
+        except Exception as e:
+            results.append(("", f"page {i + 1}: {e}"))
+    return results
+
+
+def _ocr_pages(pdf_path: Path, pages, indices, progress: Optional[OcrProgress] = None) -> bool:
+    """
+    Replace the pages[i] (i in indices) without a text layer by their OCR text.
+    False if some of them stay without text – OCR unavailable or failed.
+    """
+    todo = [i for i in indices if _needs_ocr(pages[i])]
+    if not todo:
+        return True
+    command = tesseract_command()
+    renderer = next((name for name in _engine_order() if PDF_ENGINES[name].renders), None)
+    if command is None or renderer is None:
+        logger.warning("%d pages of %s have no text layer – OCR unavailable (%s)",
+                       len(todo), Path(pdf_path).name,
+                       "no PDF renderer" if command else "Tesseract not found / OCR off")
+        return False
+    errors = []
+    ranges = [(i, i + 1) for i in todo]
+    results = _map_page_ranges(_ocr_page_range, renderer, pdf_path, ranges,
+                               config.OCR_DPI, config.OCR_LANGUAGES, command)
+    for done, ((i, _), [(text, error)]) in enumerate(zip(ranges, results), 1):
+        if text:
+            pages[i] = text
+        if error:
+            errors.append(error)
+        if progress:
+            progress(done, len(todo))
+    logger.info("OCR of %d pages of %s via %s (%d failed%s)", len(todo), Path(pdf_path).name,
+                renderer, len(errors), f", first: {errors[0]}" if errors else "")
+    return not errors
+
+
+def _cached_pdf(pdf_path: Path) -> tuple[str, Optional[PdfText]]:
+    """(SHA-256 of the PDF, its cached text or None); digest "" if the file is unreadable."""
+    try:
+        digest = storage.file_sha256(pdf_path)
+    except OSError as e:
+        logger.error("Cannot read %s: %s", pdf_path, e)
+        return "", None
+    cached = storage.get_pdf_text(pdf_path, digest, EXTRACTOR_VERSION)
+    if cached is None:
+        return digest, None
+    logger.info("Using cached text of %s (%d chars)", Path(pdf_path).name, len(cached[0]))
+    return digest, PdfText(*cached)
+
+
+def extract_pdf(pdf_path: Path, progress: Optional[OcrProgress] = None) -> PdfText:
+    """
+    Text of a Gutachten PDF, pages without a text layer OCR'd.  Extracted
+    once per PDF content: the result is cached by the file's SHA-256 +
+    EXTRACTOR_VERSION, so download, analysis and every re-analysis share one
+    extraction.  `progress` reports the OCR pages, if any.
+    """
+    digest, cached = _cached_pdf(pdf_path)
+    if cached is not None or not digest:
+        return cached or PdfText("", [])
+    return _extract_and_cache(pdf_path, digest, progress)
+
+
+def _extract_and_cache(pdf_path: Path, digest: str, progress: Optional[OcrProgress] = None) -> PdfText:
+    pages = _extract_pages_parallel(pdf_path)
+    if pages is None:
+        return PdfText("", [])   # not cached – a later attempt may succeed
+    complete = _ocr_pages(pdf_path, pages, range(len(pages)), progress)
+    starts, pos = [], 0
+    for t in pages:
+        starts.append(pos)
+        pos += len(t) + len(_PAGE_SEP)
+    result = PdfText(_PAGE_SEP.join(pages), starts)
+    if complete:   # else retried next time – Tesseract may be installed by then
+        storage.put_pdf_text(pdf_path, digest, EXTRACTOR_VERSION, result.text, result.page_starts)
+    return result
+
+
+def extract_pdf_text(pdf_path: Path) -> str:
+    """Full text of a Gutachten PDF (cached, see extract_pdf)."""
+    return extract_pdf(pdf_path).text
+
 
-    return text
+async def extract_pdf_async(pdf_path: Path, progress: Optional[OcrProgress] = None) -> PdfText:
+    """extract_pdf() without blocking the event loop; many PDFs may run at once."""
+    return await asyncio.get_running_loop().run_in_executor(None, extract_pdf, pdf_path, progress)
 
 
-def smart_truncate(text: str, max_chars: int = config.MAX_CONTEXT_CHARS) -> str:
+# Shares of max_chars that smart_truncate takes from the start, around the
+# value keywords and from the end of a text
+_INTRO_SHARE, _VALUE_SHARE, _CONCLUSION_SHARE = 0.30, 0.25, 0.45
+# Characters _extract_value_section keeps before a value / Baujahr / fallback keyword
+_VALUE_LOOKBEHIND, _AGE_LOOKBEHIND, _FALLBACK_LOOKBEHIND = 300, 100, 200
+
+_ELISION = "\n\n[...]\n\n"
+
+# Tier 1 – value terms (most important for investment scoring)
+_VALUE_KEYWORDS = (
+    "Verkehrswert", "Gesamtverkehrswert", "Marktwert", "Gesamtmarktwert",
+    "Schätzwert", "Gesamtschätzwert", "Liegenschaftswert", "Sachwert",
+    "Wertermittlung", "Bewertung", "Wert der Liegenschaft", "Mindestgebot",
+)
+# Tier 2 – age / construction terms
+_AGE_KEYWORDS = (
+    "Baujahr", "Errichtungsjahr", "erbaut", "Bauperiode", "Baualtersklasse",
+    "Herstellungsjahr", "Herstellungszeitraum",
+)
+# Tier 3 – generic fallback
+_FALLBACK_KEYWORDS = ("EUR", "Sanierungskosten", "Instandsetzung")
+
+
+def smart_truncate(text: str, max_chars: Optional[int] = None) -> str:
     """
     Token-efficient: keep the most relevant sections of a long document.
     Strategy: first 30% + middle 20% + last 50% (intro + values + conclusion)
+    max_chars defaults to the current config.MAX_CONTEXT_CHARS (the setting
+    can change at runtime, like the excerpt budget read from it).
     """
+    max_chars = max_chars or config.MAX_CONTEXT_CHARS
     if len(text) <= max_chars:
         return text
 
-    intro  = text[: int(max_chars * 0.30)]
+    intro  = text[: int(max_chars * _INTRO_SHARE)]
     # Find "Verkehrswert", "Schätzwert", "Mindestgebot" sections
-    value_section = _extract_value_section(text, int(max_chars * 0.25))
-    conclusion = text[-int(max_chars * 0.45):]
+    value_section = _extract_value_section(text, int(max_chars * _VALUE_SHARE))
+    conclusion = text[-int(max_chars * _CONCLUSION_SHARE):]
 
-    combined = "\n\n[...]\n\n".join(filter(None, [intro, value_section, conclusion]))
+    combined = _ELISION.join(filter(None, [intro, value_section, conclusion]))
     return combined[: max_chars + 500]  # slight buffer
 
 
@@ -170,38 +671,24 @@ def _extract_value_section(text: str, max_len: int) -> str:
     Priority order: Verkehrswert-related terms first (most critical for scoring),
     then Baujahr terms, then generic EUR/Bewertung as fallback.
     """
-    # Tier 1 – value terms (most important for investment scoring)
-    value_keywords = [
-        "Verkehrswert", "Gesamtverkehrswert", "Marktwert", "Gesamtmarktwert",
-        "Schätzwert", "Gesamtschätzwert", "Liegenschaftswert", "Sachwert",
-        "Wertermittlung", "Bewertung", "Wert der Liegenschaft", "Mindestgebot",
-    ]
-    # Tier 2 – age / construction terms
-    age_keywords = [
-        "Baujahr", "Errichtungsjahr", "erbaut", "Bauperiode", "Baualtersklasse",
-        "Herstellungsjahr", "Herstellungszeitraum",
-    ]
-    # Tier 3 – generic fallback
-    fallback_keywords = ["EUR", "Sanierungskosten", "Instandsetzung"]
-
     text_lower = text.lower()
     half = max_len // 2
 
     # Try to grab one value section + one age section and combine them
     value_chunk = ""
-    for kw in value_keywords:
+    for kw in _VALUE_KEYWORDS:
         idx = text_lower.find(kw.lower())
         if idx != -1:
-            start = max(0, idx - 300)
+            start = max(0, idx - _VALUE_LOOKBEHIND)
             end = min(len(text), idx + max_len)
             value_chunk = text[start:end]
             break
 
     age_chunk = ""
-    for kw in age_keywords:
+    for kw in _AGE_KEYWORDS:
         idx = text_lower.find(kw.lower())
         if idx != -1:
-            start = max(0, idx - 100)
+            start = max(0, idx - _AGE_LOOKBEHIND)
             end = min(len(text), idx + half)
             age_chunk = text[start:end]
             break
@@ -214,10 +701,10 @@ def _extract_value_section(text: str, max_len: int) -> str:
         return age_chunk
 
     # Fallback
-    for kw in fallback_keywords:
+    for kw in _FALLBACK_KEYWORDS:
         idx = text_lower.find(kw.lower())
         if idx != -1:
-            start = max(0, idx - 200)
+            start = max(0, idx - _FALLBACK_LOOKBEHIND)
             end = min(len(text), idx + max_len)
             return text[start:end]
     return ""
@@ -232,6 +719,187 @@ def make_summary(text: str, max_chars: int = 3000) -> str:
     return "\n---\n".join(filter(None, [intro, value, outro]))[:max_chars]
 
 
+# ── Lazy extraction ───────────────────────────────────────────────────────────
+#
+# smart_truncate() keeps ~MAX_CONTEXT_CHARS of a Gutachten: the start, the
+# end and the sections around the first value / Baujahr keywords.  For long
+# documents only those pages are extracted; the pages in between are merely
+# scanned for the keywords (in the worker processes, text discarded there).
+
+class PdfExcerpt(NamedTuple):
+    """
+    Prompt text of a Gutachten: the full text (budget 0), or the pages
+    smart_truncate(text, budget) needs, runs of pages joined by _ELISION.
+    """
+    text: str
+    budget: int
+
+
+def _scan_page_range(engine: str, pdf_path: str, start: int, stop: int,
+                     keywords: list[str]) -> list[tuple[int, list[int]]]:
+    """(page, indices of the keywords on it) for pages [start, stop) with hits – runs in a worker process."""
+    hits = []
+    for i, text in enumerate(PDF_ENGINES[engine].page_texts(pdf_path, start, stop), start):
+        low = text.lower()
+        found = [k for k, kw in enumerate(keywords) if kw in low]
+        if found:
+            hits.append((i, found))
+    return hits
+
+
+def _lazy_excerpt(pdf_path: Path, probe: PdfProbe, max_chars: int,
+                  progress: Optional[OcrProgress] = None) -> str:
+    n, size = probe.pages, max(1, config.PDF_PAGES_PER_TASK)
+    pages: dict[int, str] = {}
+
+    def read(indices):
+        ranges = _page_runs(sorted(set(indices) - pages.keys()), size)
+        for (a, b), texts in zip(ranges, _map_page_ranges(_extract_page_range, probe.engine, pdf_path, ranges)):
+            pages.update(zip(range(a, b), texts))
+
+    # Start and end: grow both until the intro / conclusion shares are covered
+    head, tail = 0, n   # pages [0, head) and [tail, n) are read
+    while head < tail:
+        more_head = sum(len(pages[i]) for i in range(head)) < _INTRO_SHARE * max_chars
+        more_tail = sum(len(pages[i]) for i in range(tail, n)) < _CONCLUSION_SHARE * max_chars
+        if not (more_head or more_tail):
+            break
+        wanted = []
+        if more_head:
+            wanted += range(head, min(head + size, tail))
+            head = min(head + size, tail)
+        if more_tail:
+            wanted += range(max(tail - size, head), tail)
+            tail = max(tail - size, head)
+        read(wanted)
+
+    # First page of every keyword, in page order: start, scanned middle, end.
+    # The scan stops once the top value and Baujahr keywords turned up – no
+    # later page can change what _extract_value_section picks then.
+    tiers = (_VALUE_KEYWORDS, _AGE_KEYWORDS, _FALLBACK_KEYWORDS)
+    keywords = [kw.lower() for tier in tiers for kw in tier]
+    first_page: dict[int, int] = {}
+
+    def done():
+        return 0 in first_page and len(_VALUE_KEYWORDS) in first_page
+
+    def note(i, found):
+        for k in found:
+            first_page.setdefault(k, i)
+
+    for i in range(head):
+        note(i, [k for k, kw in enumerate(keywords) if kw in pages[i].lower()])
+    scanned = 0
+    if not done() and head < tail:
+        ranges = _page_runs(list(range(head, tail)), size)
+        scan = _map_page_ranges(_scan_page_range, probe.engine, pdf_path, ranges, keywords)
+        try:
+            for (a, b), hits in zip(ranges, scan):
+                scanned += b - a
+                for i, found in hits:
+                    note(i, found)
+                if done():
+                    break
+        finally:
+            scan.close()
+    for i in range(tail, n):
+        note(i, [k for k, kw in enumerate(keywords) if kw in pages[i].lower()])
+
+    # Pages of the sections _extract_value_section will cut out
+    def first_hit(t):   # page of the tier's top keyword present
+        lo = sum(map(len, tiers[:t]))
+        return next((first_page[k] for k in range(lo, lo + len(tiers[t])) if k in first_page), None)
+
+    sections = [(first_hit(0), _VALUE_SHARE, _VALUE_LOOKBEHIND),
+                (first_hit(1), _VALUE_SHARE / 2, _AGE_LOOKBEHIND)]
+    if all(p is None for p, _, _ in sections):
+        sections = [(first_hit(2), _VALUE_SHARE, _FALLBACK_LOOKBEHIND)]
+    sections = [(p, int(share * max_chars), back) for p, share, back in sections if p is not None]
+    # A section starts `back` characters before its keyword – possibly on the
+    # previous page(s) – and may run past the end of its page: read back until
+    # the pages before the keyword hold `back`, and on until the pages after it
+    # hold its length (first guess from the mean page length, all at once)
+    per_page = max(1, sum(map(len, pages.values())) // len(pages))
+    starts = [max(0, p - 1) for p, _, _ in sections]
+    stops = [min(n, p + 1 + length // per_page) for p, length, _ in sections]
+    while True:
+        read([i for start, stop in zip(starts, stops) for i in range(start, stop)])
+        grown = False
+        for k, (p, length, back) in enumerate(sections):
+            if starts[k] > 0 and sum(len(pages[i]) for i in range(starts[k], p)) < back:
+                starts[k] -= 1
+                grown = True
+            if stops[k] < n and sum(len(pages[i]) for i in range(p + 1, stops[k])) < length:
+                stops[k] = min(n, stops[k] + size)
+                grown = True
+        if not grown:
+            break
+
+    def joined():
+        parts, prev = [], None
+        for i in sorted(pages):
+            if prev is not None:
+                parts.append(_PAGE_SEP if i == prev + 1 else _ELISION)
+            parts.append(pages[i])
+            prev = i
+        return "".join(parts)
+
+    # smart_truncate passes a text of up to max_chars through whole – the
+    # excerpt must stay longer than that, like the document, or the surplus
+    # page text and elision marks would reach the prompt.  No unread page
+    # holds a keyword ahead of the ones found, so extra pages move no section.
+    while len(pages) < n and len(joined()) <= max_chars:
+        read([i for i in range(n) if i not in pages][:size])
+
+    logger.info("Read %d of %d pages of %s via %s (%d scanned)",
+                len(pages), n, Path(pdf_path).name, probe.engine, scanned)
+    # Scanned pages among them (the keyword scan cannot see into those)
+    _ocr_pages(pdf_path, pages, sorted(pages), progress)
+    return joined()
+
+
+def extract_pdf_excerpt(pdf_path: Path, max_chars: int = 0,
+                        progress: Optional[OcrProgress] = None) -> PdfExcerpt:
+    """
+    What smart_truncate(text, max_chars) needs of a Gutachten.  Cached PDFs,
+    scans and documents under PDF_LAZY_MIN_PAGES pages are extracted
+    completely (extract_pdf); of longer ones only the first and last pages
+    and the pages around the first value / Baujahr keywords (see _lazy_excerpt).
+    """
+    max_chars = max_chars or config.MAX_CONTEXT_CHARS
+    digest, cached = _cached_pdf(pdf_path)
+    if cached is not None or not digest:
+        return PdfExcerpt(cached.text if cached else "", 0)
+    if config.PDF_LAZY_MIN_PAGES:
+        probe = probe_pdf(pdf_path)
+        if probe and probe.has_text and probe.pages >= config.PDF_LAZY_MIN_PAGES:
+            try:
+                return PdfExcerpt(_lazy_excerpt(pdf_path, probe, max_chars, progress), max_chars)
+            except BrokenProcessPool:
+                pass
+            except Exception as e:
+                logger.warning("Lazy extraction of %s failed (%s) – reading all pages",
+                               Path(pdf_path).name, e)
+    return PdfExcerpt(_extract_and_cache(pdf_path, digest, progress).text, 0)
+
+
+async def extract_pdf_excerpt_async(pdf_path: Path, max_chars: int = 0,
+                                    progress: Optional[OcrProgress] = None) -> PdfExcerpt:
+    """extract_pdf_excerpt() without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, extract_pdf_excerpt, pdf_path, max_chars, progress)
+
+
+def has_prompt_text(edikt: dict) -> bool:
+    """
+    True if the edikt's stored pdf_text is complete or an excerpt for the
+    current MAX_CONTEXT_CHARS.  Empty text (a scan stored before OCR was
+    available) counts as missing.
+    """
+    return bool(edikt.get("pdf_text")) and (
+        not edikt.get("pdf_text_excerpt") or edikt["pdf_text_excerpt"] >= config.MAX_CONTEXT_CHARS)
+
+
 # ── AI Backends ───────────────────────────────────────────────────────────────
 
 async def analyze(
@@ -0,0 +1,84 @@
+"""
+Lazy-excerpt check: for every PDF of a corpus, the prompt text built from
+ai_analyzer's lazy excerpt must equal the one built from the full text,
+i.e. smart_truncate(excerpt) == smart_truncate(full text).
+
+Per document: page count, time of excerpt vs. full extraction, and whether
+the two smart_truncate() outputs are identical.  Documents are read lazily
+whatever their length (PDF_LAZY_MIN_PAGES is ignored); the extracted-text
+cache is bypassed.  Exit code 1 on any difference.
+
+Usage (from the repository root):
+    python benchmarks/lazy_excerpt.py --corpus data/downloads --limit 50
+    python benchmarks/lazy_excerpt.py --corpus data/archive --max-chars 20000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ai_analyzer   # noqa: E402
+import config        # noqa: E402
+
+
+def _full_text(probe: ai_analyzer.PdfProbe, path: Path) -> str:
+    pages = ai_analyzer.PDF_ENGINES[probe.engine].page_texts(str(path), 0, probe.pages)
+    return ai_analyzer._PAGE_SEP.join(map(ai_analyzer._clean_page, pages))
+
+
+def _first_difference(a: str, b: str) -> int:
+    return next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--corpus", type=Path, default=Path("data/downloads"), help="directory with PDFs")
+    ap.add_argument("--limit", type=int, default=0, help="max. documents (0 = all)")
+    ap.add_argument("--max-chars", type=int, default=config.MAX_CONTEXT_CHARS,
+                    help="context budget passed to smart_truncate")
+    args = ap.parse_args()
+
+    pdfs = sorted(args.corpus.glob("**/*.pdf"))[:args.limit or None]
+    if not pdfs:
+        sys.exit(f"Keine PDFs in {args.corpus}")
+    config.OCR_LANGUAGES = ""   # the full text below is not OCR'd either
+    # Lazy extraction logs one line per document – keep the table readable
+    logging.getLogger(ai_analyzer.__name__).setLevel(logging.WARNING)
+    print(f"{len(pdfs)} Dokumente, Budget {args.max_chars} Zeichen", flush=True)
+    print(f"\n{'Dokument':<40} {'Seiten':>7} {'Auszug s':>9} {'Voll s':>7}  Ergebnis")
+
+    differing = skipped = 0
+    try:
+        for path in pdfs:
+            probe = ai_analyzer.probe_pdf(path)
+            if not probe or not probe.has_text:
+                skipped += 1
+                continue
+            t0 = time.perf_counter()
+            excerpt = ai_analyzer._lazy_excerpt(path, probe, args.max_chars)
+            t1 = time.perf_counter()
+            full = _full_text(probe, path)
+            t2 = time.perf_counter()
+
+            expected = ai_analyzer.smart_truncate(full, args.max_chars)
+            actual = ai_analyzer.smart_truncate(excerpt, args.max_chars)
+            if actual == expected:
+                result = "gleich"
+            else:
+                differing += 1
+                result = f"ABWEICHUNG ab Zeichen {_first_difference(actual, expected)}"
+            print(f"{path.name[:40]:<40} {probe.pages:>7} {t1 - t0:>9.2f} {t2 - t1:>7.2f}  {result}",
+                  flush=True)
+    finally:
+        ai_analyzer.shutdown_pdf_pool()
+
+    print(f"\n{differing} Abweichung(en), {skipped} Dokument(e) ohne Textebene übersprungen")
+    sys.exit(1 if differing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Page-load benchmark for the Playwright scraper: full loads with network idle
+("vorher") vs. resource blocking + DOMContentLoaded/selector waits ("nachher").
+
+Measures, per page type, the median wall time, the number of requests and the
+transferred bytes:
+  suche        search form → submit → result rows
+  detail       detail page rendered in the browser
+  detail_http  detail page via the httpx fast path (nachher only, for reference)
+  anhang       detail page → Gutachten PDF download
+
+Usage (from the repository root, needs network access):
+    python benchmarks/page_loads.py --bundesland Wien --pages 5 --runs 3
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config    # noqa: E402
+import scraper   # noqa: E402
+
+PROFILES = {
+    "vorher":  {"LIGHT_PAGE_LOADS": False, "BLOCKED_RESOURCE_TYPES": ()},
+    "nachher": {"LIGHT_PAGE_LOADS": True,  "BLOCKED_RESOURCE_TYPES": config.BLOCKED_RESOURCE_TYPES},
+}
+
+
+class _Traffic:
+    """Counts finished / aborted requests of one page and sums their sizes."""
+
+    def __init__(self, page):
+        self.finished = []
+        self.blocked = 0
+        page.on("requestfinished", self.finished.append)
+        page.on("requestfailed", self._failed)
+
+    def _failed(self, _req):
+        self.blocked += 1
+
+    async def totals(self) -> tuple[int, int, int]:
+        sizes = await asyncio.gather(*(r.sizes() for r in self.finished), return_exceptions=True)
+        nbytes = sum(s["responseBodySize"] + s["responseHeadersSize"]
+                     for s in sizes if isinstance(s, dict))
+        return len(self.finished), self.blocked, nbytes
+
+
+async def _measure(sc: scraper.EdikteScraper, step) -> tuple[float, int, int, int, object]:
+    ctx = await scraper._new_context(sc._browser)
+    page = await ctx.new_page()
+    page.set_default_timeout(config.SCRAPER_TIMEOUT)
+    traffic = _Traffic(page)
+    try:
+        t0 = time.perf_counter()
+        result = await step(page)
+        elapsed = time.perf_counter() - t0
+        requests, blocked, nbytes = await traffic.totals()
+    finally:
+        await ctx.close()
+    return elapsed, requests, blocked, nbytes, result
+
+
+async def _run_profile(name: str, args, detail_urls: list[str]) -> dict[str, list[tuple]]:
+    for key, value in PROFILES[name].items():
+        setattr(config, key, value)
+    samples: dict[str, list[tuple]] = {}
+    params = {"mode": "einfach", "bundesland": args.bundesland, "kategorie": args.kategorie}
+
+    async def search_step(page):
+        await scraper._goto(page, scraper.SEARCH_MODES["einfach"], scraper._FORM_READY)
+        await sc._fill_search_form(page, "einfach", params)
+        return await sc._parse_result_rows(page)
+
+    async with scraper.EdikteScraper() as sc:
+        for _ in range(args.runs):
+            *m, rows = await _measure(sc, search_step)
+            samples.setdefault("suche", []).append(tuple(m))
+            if not detail_urls:
+                detail_urls.extend(r["detail_url"] for r in rows[:args.pages])
+
+        for i, url in enumerate(detail_urls):
+            for _ in range(args.runs):
+                *m, _ = await _measure(sc, lambda page: sc._fetch_detail_browser(page, url))
+                samples.setdefault("detail", []).append(tuple(m))
+
+                async def download_step(page, url=url, i=i):
+                    await scraper._goto(page, url, scraper._ATTACHMENT_READY)
+                    return await sc._download_pdf(page, i)
+                *m, _ = await _measure(sc, download_step)
+                samples.setdefault("anhang", []).append(tuple(m))
+
+            if name == "nachher":
+                for _ in range(args.runs):
+                    t0 = time.perf_counter()
+                    await sc._fetch_detail_http(url)
+                    samples.setdefault("detail_http", []).append((time.perf_counter() - t0, 1, 0, 0))
+    return samples
+
+
+def _report(results: dict[str, dict[str, list[tuple]]]):
+    print(f"\n{'Seitentyp':<12} {'Profil':<8} {'Median ms':>10} {'Requests':>9} "
+          f"{'blockiert':>9} {'kB':>9}")
+    for kind in ("suche", "detail", "detail_http", "anhang"):
+        base = None
+        for name in PROFILES:
+            rows = results.get(name, {}).get(kind)
+            if not rows:
+                continue
+            ms = statistics.median(r[0] for r in rows) * 1000
+            req = statistics.mean(r[1] for r in rows)
+            blk = statistics.mean(r[2] for r in rows)
+            kb = statistics.mean(r[3] for r in rows) / 1024
+            speedup = f"  ×{base / ms:.1f}" if base and ms else ""
+            base = base or ms
+            print(f"{kind:<12} {name:<8} {ms:>10.0f} {req:>9.1f} {blk:>9.1f} {kb:>9.1f}{speedup}")
+
+
+async def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--bundesland", default="Wien")
+    ap.add_argument("--kategorie", default="")
+    ap.add_argument("--pages", type=int, default=5, help="detail pages per run")
+    ap.add_argument("--runs", type=int, default=3, help="repetitions per page")
+    args = ap.parse_args()
+
+    # Keep benchmark downloads out of the real data directory; rate limits stay on
+    config.DOWNLOADS_DIR = Path(tempfile.mkdtemp(prefix="edikte_bench_"))
+    config.DETAIL_FETCH_MODE = "http"
+
+    detail_urls: list[str] = []
+    results = {}
+    for name in PROFILES:
+        print(f"Profil {name} …", flush=True)
+        results[name] = await _run_profile(name, args, detail_urls)
+    _report(results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+PDF text extraction benchmark: every installed engine of ai_analyzer.PDF_ENGINES
+over a corpus of Gutachten PDFs, in this process (no worker pool, no cache).
+
+Per engine:
+  Zeichen/s   extraction speed (characters of output per second)
+  Seiten/s    pages per second
+  leer        pages without any text
+  Fehler      documents the engine could not read
+  F1          word-level agreement with the reference engine's output
+              (multiset of lower-cased words; 1.0 = same words)
+
+Usage (from the repository root):
+    python benchmarks/pdf_extractors.py --corpus data/downloads --limit 50
+    python benchmarks/pdf_extractors.py --corpus data/archive --reference pymupdf --runs 3
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ai_analyzer   # noqa: E402
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str) -> Counter:
+    return Counter(w.lower() for w in _WORD_RE.findall(text))
+
+
+def _f1(candidate: Counter, reference: Counter) -> float:
+    if not candidate and not reference:
+        return 1.0
+    common = sum((candidate & reference).values())
+    if not common:
+        return 0.0
+    precision = common / sum(candidate.values())
+    recall = common / sum(reference.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def _extract(engine: ai_analyzer.PdfEngine, path: Path) -> tuple[float, list[str]]:
+    t0 = time.perf_counter()
+    n = engine.page_count(str(path))
+    pages = [ai_analyzer._clean_page(t) for t in engine.page_texts(str(path), 0, n)]
+    return time.perf_counter() - t0, pages
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--corpus", type=Path, default=Path("data/downloads"), help="directory with PDFs")
+    ap.add_argument("--limit", type=int, default=0, help="max. documents (0 = all)")
+    ap.add_argument("--reference", default="pdfplumber", help="engine the F1 is measured against")
+    ap.add_argument("--runs", type=int, default=1, help="repetitions per document (median time)")
+    args = ap.parse_args()
+
+    pdfs = sorted(args.corpus.glob("**/*.pdf"))[:args.limit or None]
+    engines = ai_analyzer.available_engines()
+    if not pdfs or not engines:
+        sys.exit(f"Keine PDFs in {args.corpus} oder keine Engine installiert ({engines})")
+    print(f"{len(pdfs)} Dokumente, Engines: {', '.join(engines)}", flush=True)
+
+    outputs: dict[str, dict[Path, list[str]]] = {name: {} for name in engines}
+    stats = {name: {"seconds": 0.0, "chars": 0, "pages": 0, "empty": 0, "errors": 0} for name in engines}
+    for path in pdfs:
+        for name in engines:
+            try:
+                timings = []
+                for _ in range(args.runs):
+                    elapsed, pages = _extract(ai_analyzer.PDF_ENGINES[name], path)
+                    timings.append(elapsed)
+            except Exception as e:
+                print(f"  {name}: {path.name} nicht lesbar ({e})", flush=True)
+                stats[name]["errors"] += 1
+                continue
+            outputs[name][path] = pages
+            st = stats[name]
+            st["seconds"] += statistics.median(timings)
+            st["chars"] += sum(len(t) for t in pages)
+            st["pages"] += len(pages)
+            st["empty"] += sum(1 for t in pages if not t)
+
+    reference = outputs.get(args.reference, {})
+    print(f"\n{'Engine':<11} {'Dok.':>5} {'Seiten':>7} {'Zeichen':>10} {'Zeichen/s':>11} "
+          f"{'Seiten/s':>9} {'leer':>5} {'Fehler':>6} {'F1':>6}")
+    for name in engines:
+        st = stats[name]
+        secs = st["seconds"] or float("nan")
+        common = [p for p in outputs[name] if p in reference]
+        f1 = (statistics.mean(_f1(_words("\n".join(outputs[name][p])), _words("\n".join(reference[p])))
+                              for p in common) if common and name != args.reference else float("nan"))
+        print(f"{name:<11} {len(outputs[name]):>5} {st['pages']:>7} {st['chars']:>10} "
+              f"{st['chars'] / secs:>11.0f} {st['pages'] / secs:>9.1f} {st['empty']:>5} "
+              f"{st['errors']:>6} {f1:>6.3f}")
+    if args.reference not in engines:
+        print(f"\nReferenz-Engine {args.reference} ist nicht installiert – keine F1-Werte.")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,20 +13,149 @@ BASE_DIR     = Path(__file__).parent
 DATA_DIR      = BASE_DIR / "data"
 JSONS_DIR     = DATA_DIR / "jsons"
 DOWNLOADS_DIR = DATA_DIR / "downloads"
+BLOBS_DIR     = DATA_DIR / "blobs"       # content-addressed large values (see storage.put_blob)
+ARCHIVE_DIR   = DATA_DIR / "archive"     # monthly partitions of expired Edikte (see storage.archive_expired)
+PDF_TEXT_DIR  = DATA_DIR / "pdf_texts"   # extracted Gutachten text per PDF hash (see storage.get_pdf_text)
+OCR_DIR       = DATA_DIR / "ocr"         # OCR text per scanned page image (see storage.get_ocr_text)
 
 JSONS_DIR.mkdir(parents=True, exist_ok=True)
 DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
+BLOBS_DIR.mkdir(parents=True, exist_ok=True)
+PDF_TEXT_DIR.mkdir(parents=True, exist_ok=True)
+OCR_DIR.mkdir(parents=True, exist_ok=True)
 
 # ── JSON Storage Paths ────────────────────────────────────────────────────────
 EDIKTE_JSON   = JSONS_DIR / "edikte.json"     # list of all scraped Edikte
 ANALYSES_JSON = JSONS_DIR / "analyses.json"   # AI analyses keyed by edikt id
 SETTINGS_JSON = JSONS_DIR / "settings.json"   # user settings
+SQLITE_DB     = JSONS_DIR / "edikte.db"       # used when STORAGE_BACKEND == "sqlite"
+JOURNAL_JSONL = JSONS_DIR / "journal.jsonl"   # change journal of the json backend
+EDIKTE_BIN    = JSONS_DIR / "edikte.bin"      # binary snapshots (SNAPSHOT_FORMAT == "binary")
+ANALYSES_BIN  = JSONS_DIR / "analyses.bin"
+STORAGE_LOCK  = JSONS_DIR / "storage.lock"    # cross-process advisory lock
+STATS_JSON    = JSONS_DIR / "stats.json"      # overview aggregates saved with the snapshots
+
+# ── Storage backend ───────────────────────────────────────────────────────────
+# "json"   – edikte.json / analyses.json (plain files, default)
+# "sqlite" – edikte.db in WAL mode; JSON files are migrated on first use
+STORAGE_BACKEND = "json"
+
+# json backend: fold journal into the snapshots beyond this size, and fsync
+# appended journal entries at most this often
+JOURNAL_COMPACT_BYTES  = 8 * 1024 * 1024
+JOURNAL_FSYNC_INTERVAL = 1.0  # s
+
+# json backend snapshot files:
+# "json"   – edikte.json / analyses.json (human-readable, default)
+# "binary" – edikte.bin / analyses.bin; large fields are decoded on first access
+SNAPSHOT_FORMAT = "json"
+
+# Blob store (raw LLM responses, full Gutachten text)
+BLOB_COMPRESSION = True   # zstd, if the zstandard package is installed
+BLOB_GC_GRACE    = 3600   # s – unreferenced blobs younger than this survive gc_blobs()
+
+# ── Retention ─────────────────────────────────────────────────────────────────
+# Edikte whose auction lies more than ARCHIVE_AFTER_DAYS in the past are moved
+# (with analyses and PDFs) to data/archive/<YYYY-MM>/ on startup.  Opt-in:
+# 0 (default) = never, so nothing leaves the live store without being asked.
+# Archive months older than PURGE_AFTER_MONTHS are deleted (0 = keep forever).
+ARCHIVE_AFTER_DAYS = 0
+PURGE_AFTER_MONTHS = 0
 
 # ── Playwright / Scraper ──────────────────────────────────────────────────────
 EDIKTE_BASE_URL = "https://edikte.justiz.gv.at"
 HEADLESS        = True
 SCRAPER_TIMEOUT = 30_000  # ms
 
+# Detail-page enrichment: pages fetched in parallel, and politeness limits
+# per host (max. requests in flight, min. spacing between request starts)
+DETAIL_CONCURRENCY   = 4
+HOST_MAX_CONCURRENCY = 4
+HOST_MIN_INTERVAL    = 0.25  # s
+
+# Adaptive pacing: the request rate per host drops (halves) on 429/503, a high
+# error rate or a mean latency above HOST_SLOW_LATENCY – down to one request
+# per HOST_MAX_INTERVAL – and recovers step by step towards HOST_MIN_INTERVAL.
+# HOST_BURST requests may start back to back after an idle period.
+HOST_MAX_INTERVAL = 10.0  # s
+HOST_SLOW_LATENCY = 5.0   # s
+HOST_BURST        = 1
+
+# Page fetches: retries of timeouts / 408 / 429 / 5xx with jittered exponential
+# backoff (random up to FETCH_BACKOFF, 2×, 4×, … seconds); detail pages that
+# still fail get REFETCH_PASSES more tries, REFETCH_DELAY after the first pass
+FETCH_RETRIES  = 2
+FETCH_BACKOFF  = 0.5   # s
+REFETCH_PASSES = 1
+REFETCH_DELAY  = 10.0  # s
+
+# Incremental search: detail pages of known Edikte are only re-fetched when
+# their result row changed or the last check is older than this (conditional
+# GET with ETag / Last-Modified).  0 = re-check every detail page on every search.
+DETAIL_REFRESH_DAYS = 7
+
+# Headless crawler (python -m crawler): saved searches, last runs per search,
+# checkpoint of the running job; the scheduler re-reads searches this often
+SEARCHES_JSON         = JSONS_DIR / "searches.json"
+CRAWLER_STATE_JSON    = JSONS_DIR / "crawler_state.json"
+CRAWLER_JOB_JSONL     = JSONS_DIR / "crawler_job.jsonl"
+CRAWLER_POLL_INTERVAL = 300  # s
+
+# Sharded crawling: worker processes per job, each with its own browser
+# (0 = one per CPU core, 1 = everything in the crawler process; never more
+# than HOST_MAX_CONCURRENCY), and result rows per detail-page task.  The host
+# politeness limits above hold for the whole crawl – each worker gets its
+# share of them.
+CRAWLER_WORKERS    = 0
+CRAWLER_SHARD_SIZE = 50
+
+# Gutachten downloads: parallel transfers, retries with jittered exponential
+# backoff (random up to DOWNLOAD_BACKOFF, 2×, 4×, … seconds), streaming chunk size
+DOWNLOAD_CONCURRENCY = 4
+DOWNLOAD_RETRIES     = 3
+DOWNLOAD_BACKOFF     = 1.0  # s
+DOWNLOAD_CHUNK_SIZE  = 64 * 1024
+
+# Idle browser pages kept open in the scraper session's page pool
+PAGE_POOL_SIZE = 4
+
+# "http": fetch detail pages with httpx and parse the HTML directly (fast),
+# falling back to the browser when a page looks unexpected; "browser": always
+# render with Playwright
+DETAIL_FETCH_MODE = "http"
+HTTP_USER_AGENT   = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                     "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+# Browser page loads: resource types aborted by the route interceptor (plus
+# known analytics hosts); empty = load everything.  LIGHT_PAGE_LOADS waits for
+# DOMContentLoaded + the element a step needs instead of network idle.
+BLOCKED_RESOURCE_TYPES = ("image", "font", "stylesheet", "media")
+LIGHT_PAGE_LOADS       = True
+
+# ── PDF text extraction ───────────────────────────────────────────────────────
+# Preferred engine: "auto" (fastest installed: pymupdf, pdfium, pdfplumber,
+# pypdf2) or one of those names; the others remain fallbacks per document
+PDF_ENGINE = "auto"
+
+# Worker processes for PDF text extraction and OCR, whatever the engine (0 = one
+# per CPU core, 1 = extract in the calling thread) and pages per task – a
+# Gutachten is split into such chunks
+PDF_WORKERS        = 0
+PDF_PAGES_PER_TASK = 4
+
+# Gutachten with at least this many pages are read lazily: only the first and
+# last pages and the pages with the value / Baujahr keywords smart_truncate()
+# keeps are extracted, the rest is just scanned for them (0 = read every page)
+PDF_LAZY_MIN_PAGES = 30
+
+# OCR of pages without a text layer (scans): rendered at OCR_DPI and read by
+# the Tesseract binary – OCR_COMMAND, or "tesseract" on the PATH / in the
+# default Windows install folder – with these language packs ("deu+eng" for
+# several; "" = no OCR).  Pages run in parallel on the PDF worker processes.
+OCR_COMMAND   = ""
+OCR_LANGUAGES = "deu"
+OCR_DPI       = 300
+
 # ── AI Provider Defaults ──
 AI_PROVIDER       = "openai"
 OPENAI_API_KEY    = os.getenv("OPENAI_API_KEY", "")
@@ -72,6 +201,10 @@ def apply_settings():
     global GEMINI_API_KEY, GEMINI_MODEL
     global GROK_API_KEY, GROK_MODEL
     global MAX_CONTEXT_CHARS, HEADLESS
+    global STORAGE_BACKEND, SNAPSHOT_FORMAT
+    global ARCHIVE_AFTER_DAYS, PURGE_AFTER_MONTHS
+    global DETAIL_REFRESH_DAYS, PDF_ENGINE, PDF_LAZY_MIN_PAGES
+    global OCR_COMMAND, OCR_LANGUAGES
     s = load_settings()
     AI_PROVIDER       = s.get("ai_provider",       AI_PROVIDER)
     OPENAI_API_KEY    = s.get("openai_api_key",    OPENAI_API_KEY)
@@ -86,6 +219,15 @@ def apply_settings():
     GROK_MODEL        = s.get("grok_model",        GROK_MODEL)
     MAX_CONTEXT_CHARS = int(s.get("max_context_chars", MAX_CONTEXT_CHARS))
     HEADLESS          = bool(s.get("headless",     HEADLESS))
+    STORAGE_BACKEND   = s.get("storage_backend",   STORAGE_BACKEND)
+    SNAPSHOT_FORMAT   = s.get("snapshot_format",   SNAPSHOT_FORMAT)
+    ARCHIVE_AFTER_DAYS = int(s.get("archive_after_days", ARCHIVE_AFTER_DAYS))
+    PURGE_AFTER_MONTHS = int(s.get("purge_after_months", PURGE_AFTER_MONTHS))
+    DETAIL_REFRESH_DAYS = int(s.get("detail_refresh_days", DETAIL_REFRESH_DAYS))
+    PDF_ENGINE        = s.get("pdf_engine",        PDF_ENGINE)
+    PDF_LAZY_MIN_PAGES = int(s.get("pdf_lazy_min_pages", PDF_LAZY_MIN_PAGES))
+    OCR_COMMAND       = s.get("ocr_command",       OCR_COMMAND)
+    OCR_LANGUAGES     = s.get("ocr_languages",     OCR_LANGUAGES)
 
 
 apply_settings()
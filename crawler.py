@@ -0,0 +1,585 @@
+"""
+Headless crawler: runs saved searches on a schedule, without the GUI.
+
+    python -m crawler              # daemon – run saved searches when due
+    python -m crawler --once       # resume an interrupted job, run due searches, exit
+    python -m crawler --run NAME   # run one saved search now (repeatable)
+    python -m crawler --list       # show saved searches and their next run
+
+Saved searches live in data/jsons/searches.json:
+
+    [
+      {"name": "nacht-sweep",
+       "params": {"mode": "einfach", "bundesland": "*", "kategorie": "*"},
+       "at": "02:30", "download": true},
+      {"name": "wien-wohnungen",
+       "params": {"mode": "einfach", "bundesland": "Wien", "kategorie": ["Eigentumswohnung", "Garconniere"]},
+       "every_hours": 6}
+    ]
+
+`params` are the same as for EdikteScraper.search(); a list value runs one
+search per entry (all combinations), "*" for kategorie / bundesland / gericht
+means every known value.  `at` runs the search daily at that time,
+`every_hours` at that interval.  With `download`, Gutachten of the results
+that have no PDF yet are downloaded afterwards.
+
+Every run is a job with a checkpoint (data/jsons/crawler_job.jsonl, one JSON
+object per line, appended after each collected result list, enriched Edikt
+and downloaded Gutachten).  Results go to storage item by item; a job that
+was interrupted – crash, kill, reboot – continues where it stopped on the
+next start.
+
+With CRAWLER_WORKERS ≠ 1 (--workers N) a job is sharded across worker
+processes, each with its own browser: one search variant, or one chunk of
+CRAWLER_SHARD_SIZE result rows, per task.  Workers never touch storage –
+they send their results back and this process is the only writer.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from datetime import datetime, time as dtime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import ai_analyzer
+import config
+import scraper
+import storage
+
+logger = logging.getLogger("crawler")
+
+# Parameters whose "*" expands to every value the scraper knows
+_EXPANSIONS = {
+    "kategorie":  scraper.KATEGORIE_MAP,
+    "bundesland": scraper.BUNDESLAND_MAP,
+    "gericht":    scraper.GERICHT_MAP,
+}
+
+
+# ── Saved searches ───────────────────────────────────────────────────────────
+
+def load_searches() -> list[dict]:
+    """Saved searches from searches.json (re-read on every scheduler pass)."""
+    if not config.SEARCHES_JSON.exists():
+        return []
+    try:
+        searches = json.loads(config.SEARCHES_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.error("Cannot read %s: %s", config.SEARCHES_JSON, e)
+        return []
+    valid = []
+    for s in searches:
+        if not isinstance(s, dict) or not s.get("name") or not isinstance(s.get("params"), dict):
+            logger.warning("Ignoring invalid saved search: %r", s)
+            continue
+        valid.append(s)
+    return valid
+
+
+def expand_params(params: dict) -> list[dict]:
+    """One params dict per combination of list / "*" values."""
+    axes = []
+    for key, value in params.items():
+        if value == "*" and key in _EXPANSIONS:
+            # Aliases map to the same site code – search each code once
+            labels: dict[str, str] = {}
+            for label, code in _EXPANSIONS[key].items():
+                labels.setdefault(code, label)
+            value = list(labels.values())
+        axes.append([(key, v) for v in value] if isinstance(value, list) else [(key, value)])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def next_run(search: dict, last_run: Optional[datetime], now: datetime) -> datetime:
+    """When a saved search is due next (≤ now means: run it)."""
+    if search.get("every_hours"):
+        return last_run + timedelta(hours=float(search["every_hours"])) if last_run else now
+    at = dtime.fromisoformat(search.get("at", "03:00"))
+    today = datetime.combine(now.date(), at)
+    if last_run is None:
+        return today if today > now else today + timedelta(days=1)
+    # The first slot after the last run – a missed night is caught up once
+    slot = datetime.combine(last_run.date(), at)
+    return slot if slot > last_run else slot + timedelta(days=1)
+
+
+# ── State + checkpoints ──────────────────────────────────────────────────────
+
+def _load_state() -> dict:
+    try:
+        return json.loads(config.CRAWLER_STATE_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: dict):
+    tmp = config.CRAWLER_STATE_JSON.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, config.CRAWLER_STATE_JSON)
+
+
+def _last_run(state: dict, name: str) -> Optional[datetime]:
+    value = state.get("last_run", {}).get(name)
+    return datetime.fromisoformat(value) if value else None
+
+
+class Checkpoint:
+    """
+    Append-only progress log of the running job.  Lines:
+      {"job": name, "search": {...}, "variants": [...], "started": iso}
+      {"collected": k, "results": [...]}      result rows of variant k
+      {"enriched": detail_url}                 stored in edikte
+      {"variant_done": k}
+      {"downloaded": edikt_id}                 download attempted (PDF or not)
+    A torn last line (crash during the write) is cut off on load.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.header: Optional[dict] = None
+        self.collected: dict[int, list[dict]] = {}
+        self.enriched: set[str] = set()
+        self.variants_done: set[int] = set()
+        self.downloaded: set[str] = set()
+        self._lock = threading.Lock()   # downloads record from executor threads
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint":
+        cp = cls(path)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return cp
+        if raw and not raw.endswith(b"\n"):
+            # Drop the torn tail so the next append starts on a fresh line
+            raw = raw[:raw.rfind(b"\n") + 1]
+            with open(path, "r+b") as f:
+                f.truncate(len(raw))
+            logger.warning("Cut off torn checkpoint line in %s", path)
+        for line in raw.decode("utf-8").splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping unreadable checkpoint line in %s", path)
+                continue
+            cp._apply(entry)
+        return cp
+
+    def _apply(self, entry: dict):
+        if "job" in entry:
+            self.header = entry
+        elif "collected" in entry:
+            self.collected[entry["collected"]] = entry["results"]
+        elif "enriched" in entry:
+            self.enriched.add(entry["enriched"])
+        elif "variant_done" in entry:
+            self.variants_done.add(entry["variant_done"])
+        elif "downloaded" in entry:
+            self.downloaded.add(entry["downloaded"])
+
+    def record(self, **entry):
+        self.record_many([entry])
+
+    def record_many(self, entries: list[dict]):
+        """Append several lines with a single fsync."""
+        with self._lock:
+            for entry in entries:
+                self._apply(entry)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def start(self, search: dict, variants: list[dict]):
+        self.path.unlink(missing_ok=True)
+        self.record(job=search["name"], search=search, variants=variants,
+                    started=datetime.now().isoformat(timespec="seconds"))
+
+    def finish(self):
+        self.path.unlink(missing_ok=True)
+
+
+# ── Jobs ─────────────────────────────────────────────────────────────────────
+
+def _store_pdf(cp: Checkpoint, edikt_id: str, pdf_path: Optional[Path]):
+    """Extract + store the text of a downloaded Gutachten (runs in an executor thread)."""
+    if pdf_path:
+        try:
+            excerpt = ai_analyzer.extract_pdf_excerpt(Path(pdf_path))
+            storage.update_edikt_field(edikt_id, status="downloaded", pdf_text=excerpt.text,
+                                       pdf_text_excerpt=excerpt.budget,
+                                       pdf_text_preview=excerpt.text[:500])
+        except Exception as e:
+            logger.warning("Text extraction failed for %s: %s", pdf_path, e)
+    cp.record(downloaded=edikt_id)
+
+
+async def _crawl(sc: scraper.EdikteScraper, cp: Checkpoint):
+    """Collect + enrich every unfinished variant in this process."""
+    variants = cp.header["variants"]
+
+    def on_item(entry: dict):
+        if entry.get("detail_url"):
+            storage.upsert_edikte_bulk([entry])
+            cp.record(enriched=entry["detail_url"])
+
+    for k, params in enumerate(variants):
+        if k in cp.variants_done:
+            continue
+        rows = cp.collected.get(k)
+        if rows is None:
+            rows = await sc.collect(params)
+            cp.record(collected=k, results=rows)
+        todo = [r for r in rows if r.get("detail_url") not in cp.enriched]
+        logger.info("Variant %d/%d %s: %d results, %d to process",
+                    k + 1, len(variants), params, len(rows), len(todo))
+        await sc.enrich(todo, known=storage.get_edikt_by_url, on_item=on_item)
+        cp.record(variant_done=k)
+
+
+async def _download_missing(sc: scraper.EdikteScraper, cp: Checkpoint):
+    """Download the Gutachten of all collected Edikte that have no PDF yet."""
+    urls = {r["detail_url"] for rows in cp.collected.values() for r in rows if r.get("detail_url")}
+    items = []
+    for url in sorted(urls):
+        edikt = storage.get_edikt_by_url(url)
+        if edikt and edikt["id"] not in cp.downloaded and not storage.has_pdf(edikt["id"]):
+            items.append((edikt["id"], url))
+    logger.info("Downloading %d Gutachten", len(items))
+    loop = asyncio.get_running_loop()
+    stored = []
+    await sc.download_many(items, on_done=lambda eid, path: stored.append(
+        loop.run_in_executor(None, _store_pdf, cp, eid, path)))
+    await asyncio.gather(*stored)
+
+
+def _worker_count() -> int:
+    # Never more workers than requests the host may have in flight: the extra
+    # ones would only wait behind the politeness limit, each with a Chromium
+    wanted = config.CRAWLER_WORKERS or os.cpu_count() or 1
+    return max(1, min(wanted, config.HOST_MAX_CONCURRENCY))
+
+
+async def run_job(cp: Checkpoint):
+    """Run (or continue) the job described by the checkpoint header."""
+    search, variants = cp.header["search"], cp.header["variants"]
+    logger.info("Job %s: %d search variant(s)%s", search["name"], len(variants),
+                " – resuming" if cp.enriched or cp.collected else "")
+
+    workers = _worker_count()
+    if workers > 1:
+        await _crawl_sharded(cp, workers)
+        if search.get("download"):
+            async with scraper.EdikteScraper() as sc:
+                await _download_missing(sc, cp)
+    else:
+        async with scraper.EdikteScraper() as sc:
+            await _crawl(sc, cp)
+            if search.get("download"):
+                await _download_missing(sc, cp)
+
+    cp.finish()
+    logger.info("Job %s finished", search["name"])
+
+
+# ── Sharded crawling ─────────────────────────────────────────────────────────
+#
+# Tasks on a shared queue, taken by whichever worker is free:
+#   ("collect", k, params)            → ("collected", k, rows)
+#   ("enrich", k, rows, known)        → ("item", k, entry) per entry, then ("enriched", k, n)
+# A task that raises is answered with ("failed", k, message).  `known` holds
+# the stored fields enrich() needs for its incremental check, so workers do not
+# open storage at all.
+
+_KNOWN_FIELDS = ("row_sig", "detail_checked", "http_etag", "http_last_modified")
+
+
+def _shard_main(tasks, results, overrides: dict, log_level: int):
+    """Entry point of a worker process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl+C is handled by the coordinator
+    logging.basicConfig(level=log_level,
+                        format="%(asctime)s %(levelname)-7s %(processName)s %(name)s: %(message)s")
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    asyncio.run(_shard_loop(tasks, results))
+
+
+async def _shard_loop(tasks, results):
+    loop = asyncio.get_running_loop()
+    async with scraper.EdikteScraper() as sc:
+        while (task := await loop.run_in_executor(None, tasks.get)) is not None:
+            kind, k = task[0], task[1]
+            try:
+                if kind == "collect":
+                    results.put(("collected", k, await sc.collect(task[2])))
+                else:
+                    rows, known = task[2], task[3]
+                    await sc.enrich(rows, known=known.get,
+                                    on_item=lambda entry: results.put(("item", k, entry)))
+                    results.put(("enriched", k, len(rows)))
+            except Exception as e:
+                logger.exception("Task %s of variant %d failed", kind, k)
+                results.put(("failed", k, f"{type(e).__name__}: {e}"))
+
+
+def _shard_overrides(workers: int, index: int) -> dict:
+    """Settings for worker `index`; the politeness limits are shared among the workers."""
+    share, extra = divmod(config.HOST_MAX_CONCURRENCY, workers)
+    return {
+        "HEADLESS":             config.HEADLESS,
+        "DETAIL_FETCH_MODE":    config.DETAIL_FETCH_MODE,
+        "DETAIL_REFRESH_DAYS":  config.DETAIL_REFRESH_DAYS,
+        "HOST_MAX_CONCURRENCY": max(1, share + (index < extra)),
+        "HOST_MIN_INTERVAL":    config.HOST_MIN_INTERVAL * workers,
+        "HOST_MAX_INTERVAL":    config.HOST_MAX_INTERVAL * workers,
+    }
+
+
+def _next_results(results, timeout: float) -> list[tuple]:
+    """Block for one message, then take whatever else is already queued."""
+    try:
+        batch = [results.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while True:
+        try:
+            batch.append(results.get_nowait())
+        except queue.Empty:
+            return batch
+
+
+def _stop_workers(procs: list, tasks, timeout: float):
+    # Idle workers exit on the sentinel; busy ones (aborted job) are terminated
+    for _ in procs:
+        tasks.put(None)
+    for p in procs:
+        p.join(timeout)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+    tasks.cancel_join_thread()   # unread tasks must not block our exit
+
+
+async def _crawl_sharded(cp: Checkpoint, max_workers: int):
+    """Collect + enrich every unfinished variant on up to `max_workers` processes."""
+    variants = cp.header["variants"]
+    # spawn: Playwright must not inherit a forked copy of a running event loop
+    ctx = multiprocessing.get_context("spawn")
+    tasks, results = ctx.Queue(), ctx.Queue()
+    log_level = logging.getLogger().level
+    procs: list = []
+    outstanding = 0                   # tasks queued or running
+    chunks_left: dict[int, int] = {}  # enrich tasks per variant not answered yet
+    failed: set[int] = set()
+
+    def put(task: tuple):
+        nonlocal outstanding
+        tasks.put(task)
+        outstanding += 1
+        # Workers start on demand – a small job does not launch a browser per core
+        while len(procs) < min(max_workers, outstanding):
+            p = ctx.Process(target=_shard_main, name=f"shard-{len(procs) + 1}", daemon=True,
+                            args=(tasks, results, _shard_overrides(max_workers, len(procs)), log_level))
+            p.start()
+            procs.append(p)
+
+    def queue_enrich(k: int, rows: list[dict]):
+        todo = [r for r in rows if r.get("detail_url") not in cp.enriched]
+        logger.info("Variant %d/%d %s: %d results, %d to process",
+                    k + 1, len(variants), variants[k], len(rows), len(todo))
+        if not todo:
+            cp.record(variant_done=k)
+            return
+        size = max(1, config.CRAWLER_SHARD_SIZE)
+        chunks_left[k] = (len(todo) + size - 1) // size
+        for i in range(0, len(todo), size):
+            chunk, known = todo[i:i + size], {}
+            for r in chunk:
+                stored = storage.get_edikt_by_url(r["detail_url"]) if r.get("detail_url") else None
+                if stored is not None:
+                    known[r["detail_url"]] = {f: stored.get(f) for f in _KNOWN_FIELDS}
+            put(("enrich", k, chunk, known))
+
+    def chunk_answered(k: int):
+        chunks_left[k] -= 1
+        if not chunks_left[k] and k not in failed:
+            cp.record(variant_done=k)
+
+    for k, params in enumerate(variants):
+        if k in cp.variants_done:
+            continue
+        if k in cp.collected:
+            queue_enrich(k, cp.collected[k])
+        else:
+            put(("collect", k, params))
+
+    loop = asyncio.get_running_loop()
+    grace = 2.0
+    try:
+        while outstanding:
+            batch = await loop.run_in_executor(None, _next_results, results, 1.0)
+            if not batch:
+                dead = [p for p in procs if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker {dead[0].name} exited with code {dead[0].exitcode}")
+                continue
+            # Single writer: one storage write + one checkpoint fsync per batch
+            items = [m[2] for m in batch if m[0] == "item" and m[2].get("detail_url")]
+            if items:
+                storage.upsert_edikte_bulk(items)
+                cp.record_many([{"enriched": e["detail_url"]} for e in items])
+            for kind, k, payload in batch:
+                if kind == "collected":
+                    outstanding -= 1
+                    cp.record(collected=k, results=payload)
+                    queue_enrich(k, payload)
+                elif kind == "enriched":
+                    outstanding -= 1
+                    chunk_answered(k)
+                elif kind == "failed":
+                    outstanding -= 1
+                    logger.error("Variant %d %s: %s", k + 1, variants[k], payload)
+                    failed.add(k)
+                    if k in chunks_left:
+                        chunk_answered(k)
+        grace = 30.0
+    finally:
+        await asyncio.shield(loop.run_in_executor(None, _stop_workers, procs, tasks, grace))
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(variants)} variant(s) failed")
+
+
+async def run_search(search: dict):
+    cp = Checkpoint(config.CRAWLER_JOB_JSONL)
+    cp.start(search, expand_params(search["params"]))
+    await run_job(cp)
+
+
+def _mark_run(name: str):
+    state = _load_state()
+    state.setdefault("last_run", {})[name] = datetime.now().isoformat(timespec="seconds")
+    _save_state(state)
+
+
+async def resume_interrupted() -> bool:
+    """Finish a job left over by a previous run.  False if it failed again."""
+    cp = Checkpoint.load(config.CRAWLER_JOB_JSONL)
+    if cp.header is None:
+        return True
+    try:
+        await run_job(cp)
+    except Exception:
+        logger.exception("Resumed job %s failed – retrying on the next pass", cp.header["job"])
+        return False
+    _mark_run(cp.header["job"])
+    return True
+
+
+# ── Scheduler ────────────────────────────────────────────────────────────────
+
+async def run_due(searches: list[dict]):
+    """Resume an interrupted job, then run every saved search that is due."""
+    if not await resume_interrupted():
+        return   # do not overwrite its checkpoint with a new job
+    for search in searches:
+        now = datetime.now()
+        if next_run(search, _last_run(_load_state(), search["name"]), now) > now:
+            continue
+        try:
+            await run_search(search)
+        except Exception:
+            # Checkpoint stays – the job is resumed on the next pass
+            logger.exception("Job %s failed", search["name"])
+            return
+        _mark_run(search["name"])
+
+
+async def serve():
+    """Scheduler loop; saved searches are re-read on every pass."""
+    while True:
+        searches = load_searches()
+        await run_due(searches)
+        state, now = _load_state(), datetime.now()
+        upcoming = [next_run(s, _last_run(state, s["name"]), now) for s in searches]
+        wait = min([(t - now).total_seconds() for t in upcoming] + [config.CRAWLER_POLL_INTERVAL])
+        await asyncio.sleep(max(1.0, wait))
+
+
+def _print_searches():
+    state, now = _load_state(), datetime.now()
+    for s in load_searches():
+        last = _last_run(state, s["name"])
+        print(f"{s['name']:<24} {len(expand_params(s['params'])):>4} Varianten  "
+              f"zuletzt: {last.isoformat(sep=' ', timespec='minutes') if last else '–':<16}  "
+              f"nächster Lauf: {next_run(s, last, now).isoformat(sep=' ', timespec='minutes')}")
+
+
+async def _main(args) -> int:
+    # SIGINT / SIGTERM cancel the running job; its checkpoint stays on disk
+    task, loop = asyncio.current_task(), asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except (NotImplementedError, RuntimeError):
+            pass   # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+    if args.run:
+        by_name = {s["name"]: s for s in load_searches()}
+        missing = [n for n in args.run if n not in by_name]
+        if missing:
+            logger.error("Unknown saved search(es): %s", ", ".join(missing))
+            return 2
+        if not await resume_interrupted():
+            return 1
+        for name in args.run:
+            await run_search(by_name[name])
+            _mark_run(name)
+    elif args.once:
+        await run_due(load_searches())
+    else:
+        logger.info("Crawler started – %d saved search(es) in %s",
+                    len(load_searches()), config.SEARCHES_JSON)
+        await serve()
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m crawler",
+                                 description="Headless crawler for saved Edikte searches")
+    ap.add_argument("--once", action="store_true", help="run due searches once and exit")
+    ap.add_argument("--run", action="append", metavar="NAME", help="run this saved search now")
+    ap.add_argument("--list", action="store_true", help="list saved searches and exit")
+    ap.add_argument("--workers", type=int, metavar="N",
+                    help="worker processes (browsers) per job; 0 = one per CPU core")
+    ap.add_argument("-v", "--verbose", action="store_true")
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)-7s %(name)s: %(message)s",
+    )
+    if args.list:
+        _print_searches()
+        return 0
+    config.HEADLESS = True   # no display on a server
+    if args.workers is not None:
+        config.CRAWLER_WORKERS = max(0, args.workers)
+    try:
+        return asyncio.run(_main(args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("Interrupted – the running job resumes on the next start")
+        return 130
+    finally:
+        ai_analyzer.shutdown_pdf_pool()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -522,6 +522,75 @@ class SettingsDialog(QDialog):
         form_tok.addRow(lbl_hint)
         layout.addWidget(grp_tok)
 
+        # ── PDF-Text ──────────────────────────────────────────────────────────
+        grp_pdf = QGroupBox("PDF-Text")
+        form_pdf = QFormLayout(grp_pdf)
+        self.pdf_engine_combo = QComboBox()
+        self.pdf_engine_combo.addItems(["auto", *ai_analyzer.PDF_ENGINES])
+        self.pdf_engine_combo.setCurrentText(s.get("pdf_engine", config.PDF_ENGINE))
+        form_pdf.addRow("Engine:", self.pdf_engine_combo)
+        self.lazy_pages = QLineEdit(str(s.get("pdf_lazy_min_pages", config.PDF_LAZY_MIN_PAGES)))
+        form_pdf.addRow("Nur relevante Seiten ab (Seiten):", self.lazy_pages)
+        self.ocr_languages = QLineEdit(s.get("ocr_languages", config.OCR_LANGUAGES))
+        self.ocr_languages.setPlaceholderText("leer = keine Texterkennung")
+        form_pdf.addRow("OCR-Sprachen:", self.ocr_languages)
+        self.ocr_command = QLineEdit(s.get("ocr_command", config.OCR_COMMAND))
+        self.ocr_command.setPlaceholderText("tesseract (PATH / Standardordner)")
+        form_pdf.addRow("Tesseract-Programm:", self.ocr_command)
+        pe_hint = QLabel(
+            "auto: schnellste installierte Engine (pymupdf › pdfium › pdfplumber › pypdf2)\n"
+            "Installiert: " + (", ".join(ai_analyzer.available_engines()) or "–") + "\n"
+            "Lange Gutachten: nur Anfang, Ende und Wert-/Baujahr-Seiten lesen  ·  0 = immer alle Seiten\n"
+            "OCR: gescannte Seiten ohne Textebene, z.B. deu oder deu+eng  ·  Tesseract: "
+            + (ai_analyzer.tesseract_command() or "nicht gefunden")
+        )
+        pe_hint.setStyleSheet("color: #475569; font-size: 10px;")
+        form_pdf.addRow(pe_hint)
+        layout.addWidget(grp_pdf)
+
+        # ── Suche ─────────────────────────────────────────────────────────────
+        grp_se = QGroupBox("Suche")
+        form_se = QFormLayout(grp_se)
+        self.refresh_days = QLineEdit(str(s.get("detail_refresh_days", config.DETAIL_REFRESH_DAYS)))
+        form_se.addRow("Detailseiten erneut prüfen nach (Tagen):", self.refresh_days)
+        se_hint = QLabel(
+            "Bekannte Edikte mit unveränderter Trefferzeile werden bei einer erneuten Suche übersprungen\n"
+            "bis diese Frist abläuft  ·  0 = bei jeder Suche alle Detailseiten prüfen"
+        )
+        se_hint.setStyleSheet("color: #475569; font-size: 10px;")
+        form_se.addRow(se_hint)
+        layout.addWidget(grp_se)
+
+        # ── Speicher ──────────────────────────────────────────────────────────
+        grp_st = QGroupBox("Datenspeicher")
+        form_st = QFormLayout(grp_st)
+        self.storage_combo = QComboBox()
+        self.storage_combo.addItems(["json", "sqlite"])
+        self.storage_combo.setCurrentText(s.get("storage_backend", config.STORAGE_BACKEND))
+        form_st.addRow("Backend:", self.storage_combo)
+        self.snapshot_combo = QComboBox()
+        self.snapshot_combo.addItems(["json", "binary"])
+        self.snapshot_combo.setCurrentText(s.get("snapshot_format", config.SNAPSHOT_FORMAT))
+        form_st.addRow("Snapshot-Format:", self.snapshot_combo)
+        st_hint = QLabel(
+            "json: edikte.json / analyses.json  ·  sqlite: edikte.db (WAL, empfohlen ab ~5.000 Edikten)\n"
+            "Beim ersten Wechsel auf sqlite werden die JSON-Daten automatisch übernommen.\n"
+            "Snapshot-Format binary (nur json-Backend): kompakter, große Felder werden erst bei Bedarf gelesen."
+        )
+        st_hint.setStyleSheet("color: #475569; font-size: 10px;")
+        form_st.addRow(st_hint)
+        self.archive_days = QLineEdit(str(s.get("archive_after_days", config.ARCHIVE_AFTER_DAYS)))
+        form_st.addRow("Archivieren nach (Tagen):", self.archive_days)
+        self.purge_months = QLineEdit(str(s.get("purge_after_months", config.PURGE_AFTER_MONTHS)))
+        form_st.addRow("Archiv löschen nach (Monaten):", self.purge_months)
+        ar_hint = QLabel(
+            "Edikte, deren Versteigerung länger zurückliegt, werden beim Start samt Analyse und PDF\n"
+            "nach data/archive/<Jahr-Monat>/ verschoben  ·  0 = nie archivieren (Standard) / Archiv nie löschen"
+        )
+        ar_hint.setStyleSheet("color: #475569; font-size: 10px;")
+        form_st.addRow(ar_hint)
+        layout.addWidget(grp_st)
+
         layout.addStretch()
 
         # ── Sticky button bar ─────────────────────────────────────────────────
@@ -542,7 +611,9 @@ class SettingsDialog(QDialog):
         root.addWidget(btn_bar)
 
     def _save(self):
-        s = {
+        # Keep settings that are not editable in this dialog (e.g. "headless")
+        s = config.load_settings()
+        s.update({
             "ai_provider":       self.provider_combo.currentText(),
             "openai_api_key":    self.oa_key.text().strip(),
             "openai_model":      self.oa_model.currentText().strip(),
@@ -555,7 +626,16 @@ class SettingsDialog(QDialog):
             "ollama_base_url":   self.ol_url.text().strip(),
             "ollama_model":      self.ol_model.text().strip(),
             "max_context_chars": int(self.max_chars.text().strip() or 40000),
-        }
+            "storage_backend":   self.storage_combo.currentText(),
+            "snapshot_format":   self.snapshot_combo.currentText(),
+            "archive_after_days": int(self.archive_days.text().strip() or 0),
+            "purge_after_months": int(self.purge_months.text().strip() or 0),
+            "detail_refresh_days": int(self.refresh_days.text().strip() or 0),
+            "pdf_engine":        self.pdf_engine_combo.currentText(),
+            "pdf_lazy_min_pages": int(self.lazy_pages.text().strip() or 0),
+            "ocr_languages":     self.ocr_languages.text().strip(),
+            "ocr_command":       self.ocr_command.text().strip(),
+        })
         config.save_settings(s)
         config.apply_settings()
         self.accept()
@@ -824,7 +904,8 @@ class OverviewTab(QWidget):
 
     def refresh(self):
         edikte   = storage.load_all_edikte()
-        analyses = storage.load_all_analyses()
+        # Every row shows the (cold) zusammenfassung – decode them in one pass
+        analyses = storage.load_all_analyses(cold=True)
         stats    = storage.get_stats()
 
         self.kpi_total._value_label.setText(str(stats["total_edikte"]))
@@ -918,8 +999,10 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("EdikteFinder Analyzer")
         self.resize(1400, 860)
         self._workers: list[Worker] = []
+        self._session = None   # scraper.ScraperSession, started on first use
         self._build_ui()
         self._load_table()
+        self._run_retention()
 
     def _build_ui(self):
         # ── Toolbar ──────────────────────────────────────────
@@ -1123,10 +1206,54 @@ class MainWindow(QMainWindow):
         )
 
     def _load_table(self):
-        self.edikt_model.load()
+        try:
+            self.edikt_model.load()
+        except storage.StorageCorruptError as e:
+            # Never continue with an empty dataset – the next write would persist it
+            QMessageBox.critical(self, "Datenspeicher beschädigt", str(e))
+            return
         count = self.edikt_model.rowCount()
         self.lbl_count.setText(f" {count} Einträge")
 
+    def _run_retention(self):
+        """Archive expired Edikte / purge old archive months in the background."""
+        if config.ARCHIVE_AFTER_DAYS <= 0 and config.PURGE_AFTER_MONTHS <= 0:
+            return
+
+        async def _run():
+            return storage.archive_expired(), storage.purge_archive()
+
+        w = Worker(_run())
+        w.finished.connect(lambda r: self._on_retention_done(*r))
+        w.error.connect(self._on_error)
+        w.finished.connect(lambda _: self._workers.remove(w) if w in self._workers else None)
+        w.error.connect(lambda _: self._workers.remove(w) if w in self._workers else None)
+        self._workers.append(w)
+        w.start()
+
+    def _on_retention_done(self, archived: dict, purged: list):
+        if archived:
+            self._load_table()
+            self.status.showMessage(
+                f"{sum(archived.values())} abgelaufene Edikte archiviert "
+                f"({', '.join(sorted(archived))})."
+            )
+        if purged:
+            self.status.showMessage(f"Archiv bereinigt: {', '.join(purged)} gelöscht.")
+
+    def _scraper_session(self):
+        """Warm browser shared by all searches and downloads of this run."""
+        if self._session is None:
+            from scraper import ScraperSession
+            self._session = ScraperSession()
+        return self._session
+
+    def closeEvent(self, event):
+        if self._session is not None:
+            self._session.close()
+        ai_analyzer.shutdown_pdf_pool()
+        super().closeEvent(event)
+
     def _set_busy(self, busy: bool, msg: str = ""):
         self.progress_bar.setVisible(busy)
         self.btn_search.setEnabled(not busy)
@@ -1187,12 +1314,17 @@ class MainWindow(QMainWindow):
 
         self._set_busy(True, "Suche läuft – Detail-Seiten werden nachgeladen, bitte warten …")
 
+        session = self._scraper_session()
+
         async def _run():
-            from scraper import EdikteScraper
-            async with EdikteScraper() as sc:
-                return await sc.search(params)
+            return await session.run(lambda sc: sc.search(
+                params,
+                progress=lambda done, total, _url: w.progress.emit(
+                    f"Suche läuft – Detail-Seite {done}/{total} geladen …"),
+                known=storage.get_edikt_by_url))
 
         w = Worker(_run())
+        w.progress.connect(self.status.showMessage)
         w.finished.connect(self._on_search_done)
         w.error.connect(self._on_error)
         w.finished.connect(lambda _: self._workers.remove(w) if w in self._workers else None)
@@ -1201,9 +1333,13 @@ class MainWindow(QMainWindow):
         w.start()
 
     def _on_search_done(self, results: list):
-        ids = storage.save_edikte_bulk(results)
+        report = storage.upsert_edikte_bulk(results)
+        inserted = sum(1 for _, outcome in report if outcome == "inserted")
+        updated  = sum(1 for _, outcome in report if outcome == "updated")
         self._load_table()
-        self._set_busy(False, f"✓  {len(results)} Ergebnisse gefunden und gespeichert.")
+        self._set_busy(False, f"✓  {len(results)} Ergebnisse gefunden und gespeichert "
+                              f"({inserted} neu, {updated} aktualisiert, "
+                              f"{len(results) - inserted - updated} unverändert).")
 
     # ── Download ───────────────────────────────────────────────
 
@@ -1220,23 +1356,52 @@ class MainWindow(QMainWindow):
     def _do_download(self, edikt_ids: list[str]):
         self._set_busy(True, f"Lade {len(edikt_ids)} Gutachten herunter …")
 
+        session = self._scraper_session()
+
         async def _run():
-            from scraper import EdikteScraper
+            items = [(eid, e["detail_url"]) for eid in edikt_ids
+                     if (e := storage.get_edikt(eid))]
+            loop = asyncio.get_running_loop()
+            finished: asyncio.Queue = asyncio.Queue()
+
+            def on_done(eid, pdf_path):   # called on the scraper session's thread
+                loop.call_soon_threadsafe(finished.put_nowait, (eid, pdf_path))
+
+            # Transfers run concurrently in the session; PDFs are processed
+            # here as they arrive
+            downloads = asyncio.ensure_future(
+                session.run(lambda sc: sc.download_many(items, on_done)))
             results = []
-            async with EdikteScraper() as sc:
-                for eid in edikt_ids:
-                    edikt = storage.get_edikt(eid)
-                    if not edikt:
-                        continue
-                    pdf_path = await sc.download_gutachten(edikt["detail_url"], eid)
-                    if pdf_path:
-                        pdf_text = ai_analyzer.extract_pdf_text(Path(pdf_path))
-                        storage.update_edikt_field(eid, status="downloaded",
-                                                   pdf_text_preview=pdf_text[:500])
-                        results.append(eid)
+            processed = 0
+
+            async def process(eid, pdf_path):
+                # Parsed in the PDF worker processes while transfers continue
+                nonlocal processed
+                if pdf_path:
+                    excerpt = await ai_analyzer.extract_pdf_excerpt_async(
+                        Path(pdf_path), progress=self._ocr_progress(w, eid))
+                    storage.update_edikt_field(eid, status="downloaded",
+                                               pdf_text=excerpt.text,
+                                               pdf_text_excerpt=excerpt.budget,
+                                               pdf_text_preview=excerpt.text[:500])
+                    results.append(eid)
+                processed += 1
+                w.progress.emit(f"Gutachten {processed}/{len(items)} verarbeitet …")
+
+            extractions = []
+            for _ in items:
+                getter = asyncio.ensure_future(finished.get())
+                await asyncio.wait({getter, downloads}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done() and downloads.exception() is not None:
+                    getter.cancel()
+                    downloads.result()   # session failed – raise its error
+                extractions.append(asyncio.ensure_future(process(*await getter)))
+            await downloads
+            await asyncio.gather(*extractions)
             return results
 
         w = Worker(_run())
+        w.progress.connect(self.status.showMessage)
         w.finished.connect(lambda ids: self._on_download_done(ids))
         w.error.connect(self._on_error)
         w.finished.connect(lambda _: self._workers.remove(w) if w in self._workers else None)
@@ -1244,6 +1409,12 @@ class MainWindow(QMainWindow):
         self._workers.append(w)
         w.start()
 
+    @staticmethod
+    def _ocr_progress(w: Worker, edikt_id: str):
+        """OCR pages of one Gutachten → status line, via the Worker's progress signal."""
+        return lambda done, total: w.progress.emit(
+            f"Texterkennung (OCR) Gutachten {edikt_id}: Seite {done}/{total} …")
+
     def _on_download_done(self, ids: list):
         self._load_table()
         self._set_busy(False, f"✓  {len(ids)} Gutachten heruntergeladen.")
@@ -1265,15 +1436,33 @@ class MainWindow(QMainWindow):
 
         async def _run():
             done = 0
+            # PDFs without stored text (older downloads, scans stored before
+            # OCR was available, or an excerpt for a smaller context budget)
+            # are parsed in the PDF worker processes, all at once, while the
+            # analyses run
+            extractions = {
+                eid: asyncio.ensure_future(ai_analyzer.extract_pdf_excerpt_async(
+                    storage.pdf_path_for(eid), progress=self._ocr_progress(w, eid)))
+                for eid in edikt_ids
+                if (e := storage.get_edikt(eid)) and not ai_analyzer.has_prompt_text(e) and storage.has_pdf(eid)
+            }
             for eid in edikt_ids:
                 edikt = storage.get_edikt(eid)
                 if not edikt:
                     continue
                 pdf_path = storage.pdf_path_for(eid)
+                text = ""
                 if pdf_path.exists():
-                    text = ai_analyzer.extract_pdf_text(pdf_path)
-                else:
-                    # Analyse nur auf Metadaten
+                    # Text (bzw. Auszug) liegt seit dem Download im Blob-Store
+                    text = edikt.get("pdf_text")
+                    if not ai_analyzer.has_prompt_text(edikt):
+                        extraction = extractions.get(eid) or ai_analyzer.extract_pdf_excerpt_async(
+                            pdf_path, progress=self._ocr_progress(w, eid))
+                        excerpt = await extraction
+                        text = excerpt.text
+                        storage.update_edikt_field(eid, pdf_text=text, pdf_text_excerpt=excerpt.budget)
+                if not text:
+                    # Analyse nur auf Metadaten (kein PDF, oder Scan ohne Texterkennung)
                     text = " ".join(filter(None, [
                         edikt.get("titel", ""), edikt.get("beschreibung", ""),
                         edikt.get("adresse", ""),
@@ -1288,6 +1477,7 @@ class MainWindow(QMainWindow):
             return done
 
         w = Worker(_run())
+        w.progress.connect(self.status.showMessage)
         w.finished.connect(lambda n: self._on_analyze_done(n))
         w.error.connect(self._on_error)
         w.finished.connect(lambda _: self._workers.remove(w) if w in self._workers else None)
@@ -12,14 +12,25 @@ Field mappings confirmed by live DOM inspection (Feb 2026):
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import random
 import re
-from datetime import date, timedelta
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urljoin
+from typing import Optional, TypeVar
+from urllib.parse import unquote, urljoin, urlsplit
 
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError as PWTimeout
+import httpx
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Page, Route, TimeoutError as PWTimeout,
+)
 
 import config
 
@@ -86,30 +97,650 @@ GERICHT_MAP: dict[str, str] = {
 }
 
 
+# ── Detail page text ─────────────────────────────────────────────────────────
+
+# Rendered as line breaks by innerText (p: two, blocks: one); td/th cells are tab-separated
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "caption", "center", "dd", "div",
+    "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2",
+    "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "pre",
+    "section", "table", "tbody", "tfoot", "thead", "tr", "ul",
+}
+_SKIP_TAGS = {"head", "noscript", "script", "style", "template", "title"}
+_WS_RE = re.compile(r"[ \t\r\n\f]+")
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[tuple[str, object]] = []   # ("text", s) | ("break", n) | ("br", None) | ("tab", None)
+        self._skip = 0
+        self._cells = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+        elif tag == "br":
+            self.parts.append(("br", None))
+        elif tag == "p":
+            self.parts.append(("break", 2))
+        elif tag in ("td", "th"):
+            if self._cells:
+                self.parts.append(("tab", None))
+            self._cells += 1
+        elif tag in _BLOCK_TAGS:
+            if tag == "tr":
+                self._cells = 0
+            self.parts.append(("break", 1))
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br":
+            self.parts.append(("br", None))
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(("break", 1))
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+        elif tag == "p":
+            self.parts.append(("break", 2))
+        elif tag in _BLOCK_TAGS:
+            self.parts.append(("break", 1))
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(("text", data))
+
+
+def html_to_text(html: str) -> str:
+    """
+    Approximate document.body.innerText for server-rendered HTML: whitespace
+    collapsed, block elements on their own lines, paragraphs separated by a
+    blank line, table cells by tabs.  CSS is not evaluated, so hidden
+    elements are included.
+    """
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    out: list[str] = []
+    pending = 0   # required line breaks before the next text
+    for kind, value in extractor.parts:
+        if kind == "break":
+            pending = max(pending, value)
+        elif kind == "br":
+            out.append("\n" * max(pending, 1))
+            pending = 0
+        elif kind == "tab":
+            out.append("\t")
+        else:
+            chunk = _WS_RE.sub(" ", value)
+            if not chunk.strip():
+                if pending or not out or out[-1][-1:] in ("\n", " ", "\t"):
+                    continue
+            if pending and out:
+                out.append("\n" * pending)
+            pending = 0
+            out.append(chunk)
+    lines = "".join(out).split("\n")
+    return "\n".join(line.strip(" ") for line in lines).strip("\n")
+
+
+def parse_detail_text(text: str, url: str) -> dict:
+    """Extract all relevant metadata from the text of a detail page.
+
+    The page body text has the format:
+        Label:\n\nValue\n\nNextLabel:\n\nValue ...
+    with the brief header block before the first label.
+    """
+    def field(pattern: str, default: str = "") -> str:
+        m = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        if not m:
+            return default
+        # Grab first non-blank line from the group
+        val = m.group(1).strip()
+        return val.split("\n")[0].strip()
+
+    # Title: the body starts with nav text + header block.
+    # "BG Döbling, 015 26 E 27/24y\nVerschiebung - ...\nBerichtigte Fassung\n"
+    # The actual Edikt title is on the second or third line of that block.
+    title = ""
+    title_m = re.search(
+        r"Gerichtliche Versteigerungen\s+.+?\n(.+?)(?:\nBerichtigte Fassung)?(?:\nDienststelle)",
+        text, re.DOTALL
+    )
+    if title_m:
+        title_lines = [l.strip() for l in title_m.group(1).strip().splitlines() if l.strip()]
+        title = " – ".join(title_lines[-2:]) if len(title_lines) >= 2 else (title_lines[0] if title_lines else "")
+
+    versteigerung_termin = field(r"Neuer Versteigerungstermin:\s+\n+\s*(.+)")
+    if not versteigerung_termin:
+        versteigerung_termin = field(r"Versteigerungstermin:\s+\n+\s*(.+)")
+
+    liegenschaft_adresse = field(r"Liegenschaftsadresse:\s+\n+\s*(.+)")
+    plz_ort              = field(r"PLZ/Ort:\s+\n+\s*(.+)")
+    adresse_full = f"{liegenschaft_adresse}, {plz_ort}".strip(", ") if (liegenschaft_adresse or plz_ort) else ""
+
+    # Kundmachungsdatum: try several field labels used on different page variants
+    kundmachung = field(r"Kundmachungsdatum:\s+\n+\s*(.+)")
+    if not kundmachung:
+        kundmachung = field(r"Erscheinungsdatum:\s+\n+\s*(.+)")
+    if not kundmachung:
+        kundmachung = field(r"Ver\xf6ffentlicht am:\s+\n+\s*(.+)")
+    # Letzte Änderung am is the last-modified date, NOT the publication date –
+    # stored separately so both are available without confusing them.
+    letzte_aenderung = field(r"Letzte .nderung am:\s+\n+\s*(.+)")
+
+    return {
+        "detail_url":       url,
+        "titel":            title,
+        "aktenzeichen":     field(r"Aktenzeichen:\s+\n+\s*(.+)"),
+        "gericht":          field(r"Dienststelle:\s+\n+\s*(.+)"),
+        "veroeffentlicht":  kundmachung or letzte_aenderung,
+        "letzte_aenderung": letzte_aenderung,
+        "versteigerung":    versteigerung_termin,
+        "adresse":       adresse_full,
+        "kategorien":    field(r"Kategorie\(n\):\s+\n+\s*(.+)"),
+        "mindestgebot":  field(r"Geringstes Gebot:\s+\n+\s*([\d\.,\s]+EUR)"),
+        "schätzwert":    field(r"Schätzwert:\s+\n+\s*([\d\.,\s]+EUR)"),
+        "objektgröße":   (
+            field(r"Objektgr\xf6\xdfe:\s+\n+\s*(.+)")
+            or field(r"Gesamtfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
+            or field(r"Nutzfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
+            or field(r"Wohnfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
+            or field(r"Grundfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
+            or field(r"Grundst\xfccksfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
+        ),
+        "beschreibung":  field(r"Beschreibung[^:]*:\s+\n+\s*(.{0,1000})", "")[:1000],
+    }
+
+
+# ── Attachments ──────────────────────────────────────────────────────────────
+
+# Attachment types that are never the Gutachten
+_NON_PDF_RE = re.compile(r"\.(jpe?g|png|gif|bmp|tiff?|docx?|xlsx?|zip|html?)$", re.IGNORECASE)
+
+# One DOM evaluation instead of one query per selector: (href, link text) pairs
+_LINKS_JS = "els => els.map(a => [a.href || '', (a.innerText || '').trim()])"
+
+
+class _LinkExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: list[tuple[str, str]] = []
+        self._href: Optional[str] = None
+        self._text: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self._href = dict(attrs).get("href") or ""
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._href is not None:
+            self.links.append((self._href, _WS_RE.sub(" ", "".join(self._text)).strip()))
+            self._href = None
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+
+def extract_links(html: str) -> list[tuple[str, str]]:
+    """All <a href> of a page as (href, link text) pairs, in document order."""
+    extractor = _LinkExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.links
+
+
+def rank_attachments(links: list[tuple[str, str]], base_url: str) -> list[str]:
+    """
+    Gutachten candidates among (href, link text) pairs as absolute URLs, most
+    likely first: Langgutachten PDF, other Langgutachten links, PDF
+    attachments ($file), other Gutachten links, remaining attachments, other
+    PDFs, Langtext.  Images, Office files etc. are dropped; ties keep page order.
+    """
+    ranks: dict[str, int] = {}
+    for href, text in links:
+        if not href or href.startswith(("#", "javascript:", "mailto:")):
+            continue
+        url = urljoin(base_url, href)
+        path = unquote(urlsplit(url).path).lower()
+        if _NON_PDF_RE.search(path):
+            continue
+        label = f"{path} {text.lower()}"
+        is_file = "$file" in path
+        is_pdf = path.endswith(".pdf") or "pdf" in label
+        if "langgutachten" in label:
+            rank = 0 if is_pdf else 1
+        elif is_file and is_pdf:
+            rank = 2
+        elif "gutachten" in label:
+            rank = 3
+        elif is_file:
+            rank = 4
+        elif is_pdf:
+            rank = 5
+        elif "langtext" in label:
+            rank = 6
+        else:
+            continue
+        ranks[url] = min(rank, ranks.get(url, rank))
+    return sorted(ranks, key=ranks.__getitem__)
+
+
+# ── Incremental search ───────────────────────────────────────────────────────
+
+# detail_url → stored Edikt (or None); lets search() skip unchanged detail pages
+KnownLookup = Callable[[str], Optional[Mapping]]
+
+# Result-row fields that the portal updates together with the detail page
+_ROW_FIELDS = ("titel", "veroeffentlicht", "adresse", "kategorien", "beschreibung")
+
+# Returned by _fetch_detail_http for a 304 answer to a conditional request
+_NOT_MODIFIED: dict = {}
+
+
+def row_signature(row: Mapping) -> str:
+    """Fingerprint of a search-result row, stored as `row_sig` with the enriched Edikt."""
+    raw = json.dumps([row.get(k, "") for k in _ROW_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _is_stale(stored: Mapping) -> bool:
+    if config.DETAIL_REFRESH_DAYS <= 0:
+        return True
+    try:
+        checked = datetime.fromisoformat(stored.get("detail_checked") or "")
+    except ValueError:
+        return True
+    return datetime.now() - checked > timedelta(days=config.DETAIL_REFRESH_DAYS)
+
+
+def _conditional_headers(stored: Mapping) -> dict[str, str]:
+    headers = {}
+    if stored.get("http_etag"):
+        headers["If-None-Match"] = stored["http_etag"]
+    if stored.get("http_last_modified"):
+        headers["If-Modified-Since"] = stored["http_last_modified"]
+    return headers
+
+
+# ── Page loading ─────────────────────────────────────────────────────────────
+
+# Elements a step actually needs; navigation waits for these instead of network idle
+_FORM_READY       = "input[name='sebut'], input[type='submit']"
+_RESULT_ROWS      = "#DataTables_Table_0 tbody tr"
+_DETAIL_READY     = "text=Aktenzeichen:"
+_ATTACHMENT_READY = "a[href*='$file']"
+
+# Analytics / tracking requests, aborted together with BLOCKED_RESOURCE_TYPES
+_TRACKER_RE = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|matomo|piwik|"
+    r"hotjar\.com|facebook\.net|webtrekk|etracker", re.IGNORECASE,
+)
+
+
+async def _block_route(route: Route):
+    req = route.request
+    if req.resource_type in config.BLOCKED_RESOURCE_TYPES or _TRACKER_RE.search(req.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_context(browser: Browser) -> BrowserContext:
+    """Browser context with the resource-blocking route installed."""
+    ctx = await browser.new_context(
+        accept_downloads=True,
+        viewport={"width": 1400, "height": 900},
+    )
+    if config.BLOCKED_RESOURCE_TYPES:
+        await ctx.route("**/*", _block_route)
+    return ctx
+
+
+async def _goto(page: Page, url: str, ready: str = ""):
+    """
+    Navigate to `url`.  With LIGHT_PAGE_LOADS, wait for DOMContentLoaded and
+    then for the `ready` selector (if any); a missing element is left to the
+    caller's own fallbacks.  Otherwise wait for network idle as before.
+    """
+    if not config.LIGHT_PAGE_LOADS:
+        await page.goto(url, wait_until="networkidle")
+        return
+    await page.goto(url, wait_until="domcontentloaded")
+    if ready:
+        try:
+            await page.wait_for_selector(ready, state="attached", timeout=10000)
+        except PWTimeout:
+            logger.debug("%r not found on %s", ready, url)
+
+
+# (done, total, detail_url) after each detail page, successful or not
+ProgressCallback = Callable[[int, int, str], None]
+# Enriched (or failed) entry, right after its detail page was processed
+ItemCallback = Callable[[dict], None]
+# (edikt_id, pdf_path or None) after each Gutachten download
+DownloadCallback = Callable[[str, Optional[Path]], None]
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+# Answers that mean "slow down": retried, and they shrink the host's request rate
+_RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+def _backoff(base: float, attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, base · 2^attempt]."""
+    return random.uniform(0, base * 2 ** attempt)
+
+
+def _part_meta(part: Path) -> Path:
+    """Sidecar of a partial download: the URL and validator it was fetched with."""
+    return part.with_name(part.name + ".json")
+
+
+def _discard_partial(part: Path):
+    part.unlink(missing_ok=True)
+    _part_meta(part).unlink(missing_ok=True)
+
+
+def _partial_url(part: Path) -> str:
+    """URL the partial download `part` was fetched from, or ""."""
+    try:
+        return json.loads(_part_meta(part).read_text(encoding="utf-8")).get("url", "")
+    except (OSError, ValueError):
+        return ""
+
+
+def _resume_headers(part: Path, url: str, magic: bytes) -> dict:
+    """
+    Range + If-Range headers to continue `part`, or {} (and the partial file
+    discarded) unless it was fetched from this very URL, has a strong
+    validator to pin the server's version, and starts with `magic`.
+    """
+    try:
+        offset = part.stat().st_size
+        meta = json.loads(_part_meta(part).read_text(encoding="utf-8"))
+        with open(part, "rb") as f:
+            head = f.read(len(magic))
+    except (OSError, ValueError):
+        meta, offset, head = {}, 0, b""
+    validator = meta.get("etag") or meta.get("last_modified")
+    if offset and meta.get("url") == url and validator and head == magic:
+        return {"Range": f"bytes={offset}-", "If-Range": validator}
+    _discard_partial(part)
+    return {}
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds from a Retry-After header (delta form only), else 0."""
+    value = response.headers.get("retry-after", "")
+    return min(float(value), 60.0) if value.isdigit() else 0.0
+
+
+class FetchMetrics:
+    """Counters of one scraper: requests, retries, throttling and re-fetches."""
+
+    def __init__(self):
+        self.requests      = 0
+        self.errors        = 0     # failed or "slow down" answers (before retries)
+        self.retries       = 0
+        self.throttle_waits = 0    # requests that had to wait for the host limiter
+        self.throttle_wait_s = 0.0
+        self.rate_decreases = 0
+        self.refetched     = 0     # detail pages queued for a re-fetch pass
+        self.recovered     = 0     # … that succeeded there
+
+    def summary(self) -> str:
+        return (f"{self.requests} requests, {self.errors} errors, {self.retries} retries, "
+                f"{self.throttle_waits} throttled ({self.throttle_wait_s:.1f} s), "
+                f"{self.rate_decreases} rate decreases, "
+                f"{self.recovered}/{self.refetched} re-fetched")
+
+
+class _Request:
+    """
+    Handed out by _HostLimiter.slot(); the caller reports the response with
+    answer() as soon as its headers are in.  Latency is measured up to then,
+    so streaming a large body does not count as a slow host.
+    """
+    __slots__ = ("status", "answered")
+
+    def __init__(self):
+        self.status = 0
+        self.answered: Optional[float] = None   # loop time of the response headers
+
+    def answer(self, status: int):
+        self.status = status
+        self.answered = asyncio.get_running_loop().time()
+
+
+class _HostState:
+    __slots__ = ("rate", "tokens", "updated", "latency", "error_rate", "last_decrease")
+
+    def __init__(self, rate: float, now: float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = now
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.last_decrease = now
+
+
+class _HostLimiter:
+    """
+    Politeness towards the portal, shared by everything a scraper fetches:
+    per host at most `max_concurrent` requests in flight, and request starts
+    paced by a token bucket (`burst` tokens, refilled at the host's rate).
+
+    The rate adapts (AIMD): every healthy answer raises it by _INCREASE up
+    to 1 / min_interval; an explicit 429/503, an error rate above
+    _ERROR_RATE or a mean latency above `slow_latency` halves it, down to
+    1 / max_interval, at most once per refill interval.
+    """
+
+    _ALPHA      = 0.2    # weight of the newest sample in the moving averages
+    _INCREASE   = 0.05   # requests/s added per healthy answer
+    _DECREASE   = 0.5
+    _ERROR_RATE = 0.2
+
+    def __init__(self, max_concurrent: int, min_interval: float, max_interval: float = 10.0,
+                 burst: int = 1, slow_latency: float = 5.0, metrics: Optional[FetchMetrics] = None):
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_rate = 1 / min_interval if min_interval > 0 else float("inf")
+        self._min_rate = 1 / max(max_interval, min_interval, 1e-3)
+        self._burst = max(1, burst)
+        self._slow_latency = slow_latency
+        self.metrics = metrics or FetchMetrics()
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._hosts: dict[str, _HostState] = {}
+
+    def rate(self, url: str) -> float:
+        """Current request rate (1/s) for the host of `url`."""
+        state = self._hosts.get(urlsplit(url).hostname or "")
+        return state.rate if state else self._max_rate
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlsplit(url).hostname or ""
+        loop = asyncio.get_running_loop()
+        sem = self._slots.setdefault(host, asyncio.Semaphore(self._max_concurrent))
+        queued = loop.time()
+        async with sem:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self._max_rate, loop.time())
+            # Take a token now (the balance may go negative), then sleep off the
+            # debt – waiting requests queue up one refill interval apart
+            now = loop.time()
+            if state.rate != float("inf"):
+                state.tokens = min(self._burst, state.tokens + (now - state.updated) * state.rate)
+                state.updated = now
+                state.tokens -= 1
+                if state.tokens < 0:
+                    await asyncio.sleep(-state.tokens / state.rate)
+            started = loop.time()
+            if started - queued > 0.001:
+                self.metrics.throttle_waits += 1
+                self.metrics.throttle_wait_s += started - queued
+            self.metrics.requests += 1
+            request = _Request()
+            failed = False
+            try:
+                yield request
+            except httpx.HTTPStatusError:
+                raise   # judged by request.status – a 404 is no reason to slow down
+            except Exception:
+                failed = True
+                raise
+            finally:
+                now = loop.time()
+                self._record(state, now, (request.answered or now) - started, failed, request.status)
+
+    def _record(self, state: _HostState, now: float, latency: float, failed: bool, status: int):
+        throttled = status in (429, 503)
+        error = failed or status in _RETRY_STATUS
+        if error:
+            self.metrics.errors += 1
+        a = self._ALPHA
+        state.error_rate = (1 - a) * state.error_rate + a * error
+        if not failed:
+            state.latency = (1 - a) * state.latency + a * latency if state.latency else latency
+        if throttled or state.error_rate > self._ERROR_RATE or state.latency > self._slow_latency:
+            if now - state.last_decrease >= 1 / state.rate and state.rate > self._min_rate:
+                if state.rate == float("inf"):   # unlimited so far: start from what the host managed
+                    state.rate = self._max_concurrent / max(state.latency, 0.1)
+                state.rate = max(self._min_rate, state.rate * self._DECREASE)
+                state.last_decrease = now
+                self.metrics.rate_decreases += 1
+                logger.info("Slowing down to %.2f requests/s (errors %.0f %%, latency %.1f s)",
+                            state.rate, state.error_rate * 100, state.latency)
+        elif not error:
+            state.rate = min(self._max_rate, state.rate + self._INCREASE)
+
+
+class _PagePool:
+    """
+    One persistent browser context (cookies and HTTP cache survive between
+    operations) with reusable pages.  The context is opened on the first
+    acquire only.  Pages that crashed, were closed, or were in use when an
+    operation failed are discarded instead of going back to the pool.
+    """
+
+    def __init__(self, browser: Browser, max_idle: int):
+        self._browser = browser
+        self._max_idle = max(0, max_idle)
+        self._ctx: Optional[BrowserContext] = None
+        self._idle: list[Page] = []
+        self._crashed: set[Page] = set()
+        self._lock = asyncio.Lock()
+
+    def _usable(self, page: Page) -> bool:
+        return not page.is_closed() and page not in self._crashed
+
+    async def acquire(self) -> Page:
+        async with self._lock:
+            if self._ctx is None:
+                self._ctx = await _new_context(self._browser)
+        while self._idle:
+            page = self._idle.pop()
+            if self._usable(page):
+                return page
+            await self._discard(page)
+        page = await self._ctx.new_page()
+        page.set_default_timeout(config.SCRAPER_TIMEOUT)
+        page.on("crash", self._crashed.add)
+        return page
+
+    async def release(self, page: Page, reuse: bool = True):
+        if reuse and self._usable(page) and len(self._idle) < self._max_idle:
+            self._idle.append(page)
+        else:
+            await self._discard(page)
+
+    async def _discard(self, page: Page):
+        self._crashed.discard(page)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug("Closing page failed: %s", e)
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
+        try:
+            yield page
+        except BaseException:
+            await self.release(page, reuse=False)
+            raise
+        await self.release(page)
+
+    async def close(self):
+        self._idle.clear()
+        self._crashed.clear()
+        if self._ctx is not None:
+            ctx, self._ctx = self._ctx, None
+            await ctx.close()
+
+
 class EdikteScraper:
     def __init__(self):
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self.metrics = FetchMetrics()
+        self._limiter = _HostLimiter(
+            config.HOST_MAX_CONCURRENCY, config.HOST_MIN_INTERVAL, config.HOST_MAX_INTERVAL,
+            config.HOST_BURST, config.HOST_SLOW_LATENCY, self.metrics)
+        self._http: Optional[httpx.AsyncClient] = None
+        self._pages: Optional[_PagePool] = None
 
     async def __aenter__(self):
+        # Pooled keep-alive client for the HTTP fast path (detail pages, PDFs)
+        self._http = httpx.AsyncClient(
+            timeout=config.SCRAPER_TIMEOUT / 1000,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max(
+                config.HOST_MAX_CONCURRENCY, config.DETAIL_CONCURRENCY, config.DOWNLOAD_CONCURRENCY)),
+            headers={"User-Agent": config.HTTP_USER_AGENT, "Accept-Language": "de-AT,de;q=0.9"},
+        )
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(
             headless=config.HEADLESS,
             args=["--no-sandbox", "--disable-dev-shm-usage"],
         )
+        self._pages = _PagePool(self._browser, config.PAGE_POOL_SIZE)
         return self
 
     async def __aexit__(self, *_):
+        if self._pages:
+            try:
+                await self._pages.close()
+            except Exception as e:
+                logger.debug("Closing browser context failed: %s", e)
+        if self._http:
+            await self._http.aclose()
         if self._browser:
             await self._browser.close()
         if self._playwright:
             await self._playwright.stop()
 
+    def is_connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
     # ── Public API ──────────────────────────────────────────────────────────
 
-    async def search(self, params: dict) -> list[dict]:
+    async def search(self, params: dict, progress: Optional[ProgressCallback] = None,
+                     known: Optional[KnownLookup] = None) -> list[dict]:
         """
         Execute a search and return a list of result dicts.
+        Detail pages are fetched config.DETAIL_CONCURRENCY at a time; the
+        result order is that of the portal's result table.  `progress` is
+        called after every detail page.
+        With `known` (detail_url → stored Edikt) the search is incremental:
+        see enrich().
         params keys:
           mode: "einfach" | "aktenzeichen" | "erweitert"
           -- einfach --
@@ -119,85 +750,218 @@ class EdikteScraper:
           -- erweitert --
           kategorie, ort, plz, bundesland, seit, gericht, freitext
         """
-        mode = params.get("mode", "einfach")
-        url = SEARCH_MODES.get(mode, SEARCH_MODES["einfach"])
+        results = await self.collect(params)
+        logger.info("Found %d results – fetching detail pages …", len(results))
 
-        ctx = await self._browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1400, "height": 900},
-        )
-        page = await ctx.new_page()
-        page.set_default_timeout(config.SCRAPER_TIMEOUT)
+        # ── Fetch the detail pages to get full metadata (Aktenzeichen, Gericht,
+        #    Versteigerungstermin, Mindestgebot, Schätzwert, …) ──────────────
+        enriched = await self.enrich(results, progress, known)
+        logger.info("Detail fetch complete – %d entries enriched", len(enriched))
+        return enriched
 
-        try:
+    async def collect(self, params: dict) -> list[dict]:
+        """Submit the search form and return the basic result rows (no detail pages)."""
+        mode = params.get("mode", "einfach")
+        url = SEARCH_MODES.get(mode, SEARCH_MODES["einfach"])
+        async with self._pages.page() as page:
             logger.info("Opening search page: %s", url)
-            await page.goto(url, wait_until="networkidle")
+            await _goto(page, url, _FORM_READY)
             await self._fill_search_form(page, mode, params)
-            results = await self._collect_results(page)
-            logger.info("Found %d results – fetching detail pages …", len(results))
-        finally:
-            await ctx.close()
-
-        # ── Fetch each detail page to get full metadata (Aktenzeichen, Gericht,
-        #    Versteigerungstermin, Mindestgebot, Schätzwert, …) ──────────────
-        enriched: list[dict] = []
-        detail_ctx = await self._browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1400, "height": 900},
-        )
-        detail_page = await detail_ctx.new_page()
-        detail_page.set_default_timeout(config.SCRAPER_TIMEOUT)
-        try:
-            for i, entry in enumerate(results):
-                url_d = entry.get("detail_url", "")
-                if not url_d:
-                    enriched.append(entry)
-                    continue
-                try:
-                    logger.info("[%d/%d] Fetching detail: %s", i + 1, len(results), url_d)
-                    await detail_page.goto(url_d, wait_until="networkidle")
-                    detail = await self._parse_detail(detail_page, url_d)
-                    # Merge: detail values take priority over the basic search-row values
-                    merged = {**entry, **{k: v for k, v in detail.items() if v}}
-                    enriched.append(merged)
-                except Exception as e:
-                    logger.warning("Detail fetch failed for %s: %s", url_d, e)
-                    enriched.append(entry)
-        finally:
-            await detail_ctx.close()
+            return await self._collect_results(page)
 
-        logger.info("Detail fetch complete – %d entries enriched", len(enriched))
+    async def enrich(self, results: list[dict], progress: Optional[ProgressCallback] = None,
+                     known: Optional[KnownLookup] = None,
+                     on_item: Optional[ItemCallback] = None) -> list[dict]:
+        """
+        Fetch detail pages on a pool of workers; enriched[i] belongs to results[i].
+        `on_item(entry)` is called with each fetched entry as soon as it is done
+        (lets callers persist progress item by item).
+
+        Every fetched entry carries `row_sig` (row_signature of its result
+        row), `detail_checked` and the page's HTTP validators.  With `known`,
+        an already stored Edikt whose row is unchanged and whose last check is
+        younger than DETAIL_REFRESH_DAYS is not fetched at all: its entry is
+        just {"detail_url": ...}.  Stale but unchanged rows are re-checked
+        with a conditional GET; a 304 only renews `detail_checked`.  Known
+        Edikte never get their `status` reset.
+
+        Detail pages that fail are fetched again in up to REFETCH_PASSES later
+        passes (after REFETCH_DELAY, once the rest is done); only then are
+        they given up on and reported.
+        """
+        enriched = list(results)
+        work: list[tuple[int, dict, Optional[Mapping]]] = []
+        for i, entry in enumerate(results):
+            url_d = entry.get("detail_url", "")
+            entry = {**entry, "row_sig": row_signature(entry)}
+            stored = known(url_d) if known and url_d else None
+            if stored is not None and stored.get("row_sig") == entry["row_sig"] and not _is_stale(stored):
+                enriched[i] = {"detail_url": url_d}
+            else:
+                work.append((i, entry, stored))
+        if known:
+            logger.info("%d of %d results unchanged – fetching %d detail pages",
+                        len(results) - len(work), len(results), len(work))
+        done = 0
+
+        async def worker(pending, final: bool, failed: list):
+            nonlocal done
+            page = None   # taken from the page pool on the first browser fallback
+            try:
+                for i, entry, stored in pending:
+                    url_d = entry.get("detail_url", "")
+                    if url_d:
+                        in_browser = False
+                        try:
+                            logger.info("[%d/%d] Fetching detail: %s", i + 1, len(results), url_d)
+                            unchanged_row = stored is not None and stored.get("row_sig") == entry["row_sig"]
+                            detail = await self._fetch_detail_http(
+                                url_d, _conditional_headers(stored) if unchanged_row else None)
+                            checked = {"detail_checked": datetime.now().isoformat(timespec="seconds")}
+                            if detail is _NOT_MODIFIED:
+                                enriched[i] = {"detail_url": url_d, **checked}
+                            else:
+                                if detail is None:
+                                    page = page or await self._pages.acquire()
+                                    in_browser = True
+                                    detail = await self._fetch_detail_browser(page, url_d)
+                                # Merge: detail values take priority over the basic search-row values
+                                enriched[i] = {**entry, **{k: v for k, v in detail.items() if v}, **checked}
+                                if stored is not None:
+                                    enriched[i].pop("status", None)
+                        except Exception as e:
+                            if in_browser and page is not None:
+                                # The page may have crashed or been closed – never
+                                # reuse it; the next fallback acquires a healthy one
+                                await self._pages.release(page, reuse=False)
+                                page = None
+                            failed.append((i, entry, stored))
+                            if not final:
+                                logger.info("Detail fetch failed for %s: %s – retrying later", url_d, e)
+                                continue
+                            logger.warning("Detail fetch failed for %s: %s", url_d, e)
+                            # Keep what is stored; a new row is saved bare and retried next time
+                            enriched[i] = ({"detail_url": url_d} if stored is not None else
+                                           {k: v for k, v in entry.items() if k != "row_sig"})
+                        if on_item:
+                            on_item(enriched[i])
+                    done += 1
+                    if progress:
+                        progress(done, len(work), url_d)
+            finally:
+                if page is not None:
+                    await self._pages.release(page)
+
+        todo = work
+        for n in range(config.REFETCH_PASSES + 1):
+            if n:
+                if not todo:
+                    break
+                logger.info("Re-fetching %d failed detail pages in %.0f s (pass %d)",
+                            len(todo), config.REFETCH_DELAY, n + 1)
+                if n == 1:
+                    self.metrics.refetched += len(todo)
+                await asyncio.sleep(config.REFETCH_DELAY)
+            failed: list[tuple[int, dict, Optional[Mapping]]] = []
+            pending = iter(todo)   # shared by all pool workers
+            pool_size = max(1, min(config.DETAIL_CONCURRENCY, len(todo)))
+            await asyncio.gather(*(worker(pending, n == config.REFETCH_PASSES, failed)
+                                   for _ in range(pool_size)))
+            if n:
+                self.metrics.recovered += len(todo) - len(failed)
+            todo = failed
+        logger.info("Fetch metrics: %s", self.metrics.summary())
         return enriched
 
+    async def _fetch_detail_http(self, url: str, headers: Optional[dict] = None) -> Optional[dict]:
+        """
+        Fast path: plain GET + html_to_text, no browser.  Returns None (→ use
+        the browser) when disabled, on HTTP errors, or when the page does not
+        have the expected label/value shape; _NOT_MODIFIED when a conditional
+        request (`headers`) is answered with 304.  The page's ETag /
+        Last-Modified come back as http_etag / http_last_modified.
+        """
+        if config.DETAIL_FETCH_MODE != "http" or self._http is None:
+            return None
+        try:
+            r = await self._get(url, headers)
+            if r.status_code == 304 and headers:
+                return _NOT_MODIFIED
+            r.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("HTTP detail fetch failed for %s: %s", url, e)
+            return None
+        detail = parse_detail_text(html_to_text(r.text), url)
+        if not (detail["aktenzeichen"] or detail["gericht"]):
+            logger.info("Unexpected detail page HTML for %s – falling back to browser", url)
+            return None
+        detail["http_etag"] = r.headers.get("etag", "")
+        detail["http_last_modified"] = r.headers.get("last-modified", "")
+        return detail
+
+    async def _fetch_detail_browser(self, page: Page, url: str) -> dict:
+        async with self._limiter.slot(url):
+            await _goto(page, url, _DETAIL_READY)
+        return await self._parse_detail(page, url)
+
     async def fetch_detail(self, detail_url: str) -> dict:
         """Scrape a single Edikt detail page. Returns enriched metadata dict."""
-        ctx = await self._browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1400, "height": 900},
-        )
-        page = await ctx.new_page()
-        page.set_default_timeout(config.SCRAPER_TIMEOUT)
-        try:
-            await page.goto(detail_url, wait_until="networkidle")
-            return await self._parse_detail(page, detail_url)
-        finally:
-            await ctx.close()
+        detail = await self._fetch_detail_http(detail_url)
+        if detail is not None:
+            return detail
+        async with self._pages.page() as page:
+            return await self._fetch_detail_browser(page, detail_url)
 
     async def download_gutachten(self, detail_url: str, edikt_id: int) -> Optional[Path]:
-        """Download the Langgutachten PDF from a detail page. Returns local path."""
+        """
+        Download the Langgutachten PDF from a detail page. Returns local path.
+
+        Attachment links are resolved from the page HTML (httpx, no browser)
+        and fetched directly, best candidate first.  Only if that yields no
+        PDF is the page rendered: its links (one DOM evaluation) are tried
+        the same way, and clicking download links is the last resort.
+        """
         config.DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
-        ctx = await self._browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1400, "height": 900},
-        )
-        page = await ctx.new_page()
-        page.set_default_timeout(config.SCRAPER_TIMEOUT)
-        try:
-            await page.goto(detail_url, wait_until="networkidle")
-            pdf_path = await self._download_pdf(page, edikt_id)
-            return pdf_path
-        finally:
-            await ctx.close()
+        dest = config.DOWNLOADS_DIR / f"gutachten_{edikt_id}.pdf"
+
+        tried = await self._attachment_links_http(detail_url)
+        if tried and await self._fetch_first_pdf(tried, dest):
+            return dest
+
+        async with self._pages.page() as page:
+            async with self._limiter.slot(detail_url):
+                await _goto(page, detail_url, _ATTACHMENT_READY)
+            links = rank_attachments(await page.eval_on_selector_all("a[href]", _LINKS_JS), detail_url)
+            fresh = [u for u in links if u not in tried]
+            if fresh and await self._fetch_first_pdf(fresh, dest):
+                return dest
+            return await self._download_pdf(page, edikt_id)
+
+    async def download_many(self, items: list[tuple[str, str]],
+                            on_done: Optional[DownloadCallback] = None) -> dict[str, Optional[Path]]:
+        """
+        Download the Gutachten for (edikt_id, detail_url) pairs,
+        config.DOWNLOAD_CONCURRENCY at a time.  `on_done(edikt_id, path)` is
+        called after every item, also for failures (path None), so callers
+        can process finished PDFs while the rest is still transferring.
+        """
+        paths: dict[str, Optional[Path]] = {}
+        pending = iter(items)   # shared by all pool workers
+
+        async def worker():
+            for edikt_id, detail_url in pending:
+                try:
+                    path = await self.download_gutachten(detail_url, edikt_id)
+                except Exception as e:
+                    logger.warning("Download failed for %s: %s", detail_url, e)
+                    path = None
+                paths[edikt_id] = path
+                if on_done:
+                    on_done(edikt_id, path)
+
+        pool_size = max(1, min(config.DOWNLOAD_CONCURRENCY, len(items)))
+        await asyncio.gather(*(worker() for _ in range(pool_size)))
+        return paths
 
     # ── Form filling ────────────────────────────────────────────────────────
 
@@ -244,9 +1008,11 @@ class EdikteScraper:
                 except PWTimeout:
                     continue
 
-        # Wait for results
+        # Wait for the result page; _parse_result_rows then waits for the
+        # DataTables rows themselves
         try:
-            await page.wait_for_load_state("networkidle", timeout=30000)
+            await page.wait_for_load_state(
+                "domcontentloaded" if config.LIGHT_PAGE_LOADS else "networkidle", timeout=30000)
         except PWTimeout:
             pass
 
@@ -348,13 +1114,13 @@ class EdikteScraper:
         """
         try:
             # Wait briefly for the table to render
-            await page.wait_for_selector("#DataTables_Table_0 tbody tr", timeout=10000)
+            await page.wait_for_selector(_RESULT_ROWS, timeout=10000)
         except PWTimeout:
             logger.warning("Result table #DataTables_Table_0 not found – trying generic fallback")
             return await self._parse_result_rows_fallback(page)
 
         raw_rows = await page.eval_on_selector_all(
-            "#DataTables_Table_0 tbody tr",
+            _RESULT_ROWS,
             """els => els.map(r => {
                 const cells = Array.from(r.querySelectorAll('td'));
                 const col1  = cells[1] || {};
@@ -445,77 +1211,69 @@ class EdikteScraper:
     # ── Detail page ─────────────────────────────────────────────────────────
 
     async def _parse_detail(self, page: Page, url: str) -> dict:
-        """Extract all relevant metadata from a detail page.
-
-        The page body text has the format:
-            Label:\n\nValue\n\nNextLabel:\n\nValue ...
-        with the brief header block before the first label.
-        """
+        """Extract all relevant metadata from a rendered detail page."""
         text = await page.eval_on_selector("body", "el => el.innerText")
+        return parse_detail_text(text, url)
 
-        def field(pattern: str, default: str = "") -> str:
-            m = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if not m:
-                return default
-            # Grab first non-blank line from the group
-            val = m.group(1).strip()
-            return val.split("\n")[0].strip()
-
-        # Title: the body starts with nav text + header block.
-        # "BG Döbling, 015 26 E 27/24y\nVerschiebung - ...\nBerichtigte Fassung\n"
-        # The actual Edikt title is on the second or third line of that block.
-        title = ""
-        title_m = re.search(
-            r"Gerichtliche Versteigerungen\s+.+?\n(.+?)(?:\nBerichtigte Fassung)?(?:\nDienststelle)",
-            text, re.DOTALL
-        )
-        if title_m:
-            title_lines = [l.strip() for l in title_m.group(1).strip().splitlines() if l.strip()]
-            title = " – ".join(title_lines[-2:]) if len(title_lines) >= 2 else (title_lines[0] if title_lines else "")
-
-        versteigerung_termin = field(r"Neuer Versteigerungstermin:\s+\n+\s*(.+)")
-        if not versteigerung_termin:
-            versteigerung_termin = field(r"Versteigerungstermin:\s+\n+\s*(.+)")
-
-        liegenschaft_adresse = field(r"Liegenschaftsadresse:\s+\n+\s*(.+)")
-        plz_ort              = field(r"PLZ/Ort:\s+\n+\s*(.+)")
-        adresse_full = f"{liegenschaft_adresse}, {plz_ort}".strip(", ") if (liegenschaft_adresse or plz_ort) else ""
-
-        # Kundmachungsdatum: try several field labels used on different page variants
-        kundmachung = field(r"Kundmachungsdatum:\s+\n+\s*(.+)")
-        if not kundmachung:
-            kundmachung = field(r"Erscheinungsdatum:\s+\n+\s*(.+)")
-        if not kundmachung:
-            kundmachung = field(r"Ver\xf6ffentlicht am:\s+\n+\s*(.+)")
-        # Letzte Änderung am is the last-modified date, NOT the publication date –
-        # stored separately so both are available without confusing them.
-        letzte_aenderung = field(r"Letzte .nderung am:\s+\n+\s*(.+)")
-
-        return {
-            "detail_url":       url,
-            "titel":            title,
-            "aktenzeichen":     field(r"Aktenzeichen:\s+\n+\s*(.+)"),
-            "gericht":          field(r"Dienststelle:\s+\n+\s*(.+)"),
-            "veroeffentlicht":  kundmachung or letzte_aenderung,
-            "letzte_aenderung": letzte_aenderung,
-            "versteigerung":    versteigerung_termin,
-            "adresse":       adresse_full,
-            "kategorien":    field(r"Kategorie\(n\):\s+\n+\s*(.+)"),
-            "mindestgebot":  field(r"Geringstes Gebot:\s+\n+\s*([\d\.,\s]+EUR)"),
-            "schätzwert":    field(r"Schätzwert:\s+\n+\s*([\d\.,\s]+EUR)"),
-            "objektgröße":   (
-                field(r"Objektgr\xf6\xdfe:\s+\n+\s*(.+)")
-                or field(r"Gesamtfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
-                or field(r"Nutzfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
-                or field(r"Wohnfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
-                or field(r"Grundfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
-                or field(r"Grundst\xfccksfl\xe4che:\s+\n+\s*([\d\.,\s]+m\xb2[^\n]*)")
-            ),
-            "beschreibung":  field(r"Beschreibung[^:]*:\s+\n+\s*(.{0,1000})", "")[:1000],
-        }
+    async def _attachment_links_http(self, detail_url: str) -> list[str]:
+        """Ranked attachment URLs from the raw detail page HTML ([] on errors / browser mode)."""
+        if config.DETAIL_FETCH_MODE != "http" or self._http is None:
+            return []
+        try:
+            r = await self._get(detail_url)
+            r.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("HTTP attachment lookup failed for %s: %s", detail_url, e)
+            return []
+        return rank_attachments(extract_links(r.text), str(r.url))
+
+    async def _get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        """
+        GET through the host limiter.  Timeouts, connection errors and
+        408/429/5xx answers are retried FETCH_RETRIES times with jittered
+        exponential backoff (at least Retry-After); the last answer or
+        error is returned / raised.
+        """
+        for attempt in range(config.FETCH_RETRIES + 1):
+            try:
+                async with self._limiter.slot(url) as req:
+                    r = await self._http.get(url, headers=headers or None)
+                    req.answer(r.status_code)
+            except httpx.TransportError as e:   # timeouts, resets, DNS
+                if attempt == config.FETCH_RETRIES:
+                    raise
+                delay = _backoff(config.FETCH_BACKOFF, attempt)
+                logger.debug("GET %s failed (%s) – retry in %.1f s", url, e, delay)
+            else:
+                if r.status_code not in _RETRY_STATUS or attempt == config.FETCH_RETRIES:
+                    return r
+                delay = max(_backoff(config.FETCH_BACKOFF, attempt), _retry_after(r))
+                logger.debug("GET %s: HTTP %d – retry in %.1f s", url, r.status_code, delay)
+            self.metrics.retries += 1
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def _fetch_first_pdf(self, urls: list[str], dest: Path) -> bool:
+        """
+        Stream the first candidate that turns out to be a PDF to `dest`.  A
+        candidate that fails part-way leaves no partial file behind for the
+        next one to build on; the last one tried keeps it, so a later run can
+        resume it.  That candidate then goes first.
+        """
+        part = dest.with_name(dest.name + ".part")
+        resumable = _partial_url(part)
+        if resumable in urls:
+            urls = [resumable] + [u for u in urls if u != resumable]
+        for i, url in enumerate(urls):
+            if i:
+                _discard_partial(part)   # moving on to a different URL
+            if await self._stream_to_file(url, dest, magic=b"%PDF"):
+                logger.info("Downloaded PDF %s to %s", url, dest)
+                return True
+        return False
 
     async def _download_pdf(self, page: Page, edikt_id: int) -> Optional[Path]:
-        """Find and download the Langgutachten PDF via $file attachment links."""
+        """Last resort: click attachment links on the rendered page and catch the download."""
         # Priority selectors – confirmed by live inspection:
         # PDF attachments are served as /$file/... links
         pdf_selectors = [
@@ -531,35 +1289,28 @@ class EdikteScraper:
             "a:has-text('PDF')",
         ]
 
+        clicked: set[str] = set()   # an element matching several selectors is clicked once
         for selector in pdf_selectors:
             try:
                 els = await page.query_selector_all(selector)
                 for el in els:
                     href = await el.get_attribute("href") or ""
-                    if not href:
+                    if not href or href in clicked:
                         continue
-                    if not href.startswith("http"):
-                        href = urljoin(config.EDIKTE_BASE_URL, href)
+                    clicked.add(href)
 
                     dest = config.DOWNLOADS_DIR / f"gutachten_{edikt_id}.pdf"
                     try:
-                        # Try Playwright download handler first
                         async with page.expect_download(timeout=30000) as dl_info:
                             await el.click()
                         download = await dl_info.value
-                        await download.save_as(str(dest))
+                        part = dest.with_name(dest.name + ".part")
+                        await download.save_as(str(part))
+                        os.replace(part, dest)
                         logger.info("Downloaded PDF to %s", dest)
                         return dest
-                    except Exception:
-                        # Fallback: direct HTTP fetch
-                        if href.lower().endswith(".pdf") or "$file" in href:
-                            import httpx
-                            async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
-                                r = await client.get(href)
-                                if r.status_code == 200:
-                                    dest.write_bytes(r.content)
-                                    logger.info("Downloaded PDF via httpx to %s", dest)
-                                    return dest
+                    except Exception as e:
+                        logger.debug("Click download of %s failed: %s", href, e)
             except Exception as e:
                 logger.debug("PDF selector %s failed: %s", selector, e)
                 continue
@@ -567,6 +1318,85 @@ class EdikteScraper:
         logger.warning("No PDF found for edikt_id=%s", edikt_id)
         return None
 
+    async def _stream_to_file(self, url: str, dest: Path, magic: bytes = b"") -> bool:
+        """
+        GET `url` into `dest` without holding the body in memory: chunks are
+        appended to `<dest>.part`, which is renamed once complete.  Failed
+        transfers are retried DOWNLOAD_RETRIES times with jittered exponential
+        backoff and resume from the partial file with a Range request (also across
+        runs – the .part file is kept).  A partial file is only continued for
+        the URL it came from, with If-Range on its ETag / Last-Modified: a
+        changed file comes back whole (200) and is written from the start.
+        Returns False if the file could not be fetched, or if the body does
+        not start with `magic`.
+        """
+        part = dest.with_name(dest.name + ".part")
+        delay = 0.0
+        for attempt in range(config.DOWNLOAD_RETRIES + 1):
+            if attempt:
+                delay = max(delay, _backoff(config.DOWNLOAD_BACKOFF, attempt - 1))
+                logger.info("Retrying %s in %.1f s (attempt %d)", url, delay, attempt + 1)
+                self.metrics.retries += 1
+                await asyncio.sleep(delay)
+                delay = 0.0
+            headers = _resume_headers(part, url, magic)
+            offset = part.stat().st_size if headers else 0
+            try:
+                async with self._limiter.slot(url) as req:
+                    async with self._http.stream("GET", url, headers=headers) as r:
+                        req.answer(r.status_code)
+                        if r.status_code == 416:
+                            # Range beyond the (changed?) file – start over
+                            _discard_partial(part)
+                            continue
+                        r.raise_for_status()
+                        m = _CONTENT_RANGE_RE.match(r.headers.get("content-range", ""))
+                        if r.status_code == 206 and m and int(m.group(1)) == offset:
+                            mode = "ab"
+                        else:
+                            # Range ignored, or If-Range failed (file changed): whole body
+                            mode, offset = "wb", 0
+                            etag = r.headers.get("etag", "")
+                            _part_meta(part).write_text(json.dumps({
+                                "url": url,
+                                "etag": "" if etag.startswith("W/") else etag,   # weak: no If-Range
+                                "last_modified": r.headers.get("last-modified", ""),
+                            }), encoding="utf-8")
+                        length = r.headers.get("content-length")
+                        expected = offset + int(length) if length and length.isdigit() else None
+                        wrong_type = False
+                        with open(part, mode) as f:
+                            async for chunk in r.aiter_bytes(config.DOWNLOAD_CHUNK_SIZE):
+                                if magic and f.tell() == 0 and not chunk.startswith(magic):
+                                    wrong_type = True
+                                    break
+                                f.write(chunk)
+                        if wrong_type:
+                            _discard_partial(part)
+                            logger.info("%s is not the expected file type – skipped", url)
+                            return False
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if 400 <= status < 500 and status not in (408, 429):
+                    logger.warning("Download of %s failed: HTTP %d", url, status)
+                    _discard_partial(part)
+                    return False
+                logger.info("Download of %s failed: HTTP %d", url, status)
+                delay = _retry_after(e.response)
+                continue
+            except httpx.HTTPError as e:
+                logger.info("Download of %s interrupted: %s", url, e)
+                continue
+            size = part.stat().st_size
+            if expected is not None and size < expected:
+                logger.info("Download of %s incomplete (%d/%d bytes)", url, size, expected)
+                continue
+            os.replace(part, dest)
+            _part_meta(part).unlink(missing_ok=True)
+            return True
+        logger.warning("Giving up on %s after %d attempts", url, config.DOWNLOAD_RETRIES + 1)
+        return False
+
     # ── Helpers ─────────────────────────────────────────────────────────────
 
     async def _try_fill(self, page: Page, selector: str, value: str):
@@ -600,3 +1430,94 @@ class EdikteScraper:
                 await el.select_option(label=label)
         except Exception as e:
             logger.debug("_try_select_by_label(%s, %s) failed: %s", selector, label, e)
+
+
+# ── Persistent session ───────────────────────────────────────────────────────
+
+T = TypeVar("T")
+
+
+class ScraperSession:
+    """
+    One EdikteScraper kept warm for the lifetime of the application: the
+    browser, its context (cookies, HTTP cache), the page pool and the httpx
+    connection pool survive between operations.
+
+    Playwright objects are bound to the event loop that created them, so the
+    scraper lives on a dedicated event-loop thread; `run()` can be awaited
+    from any other loop (e.g. a Worker thread's).  The scraper is started on
+    first use and restarted when the browser process has died.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._scraper: Optional[EdikteScraper] = None
+        self._start_lock: Optional[asyncio.Lock] = None   # created on the session loop
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="scraper-session", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _ready(self) -> EdikteScraper:
+        """Health check + (re)start; runs on the session loop."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            sc = self._scraper
+            if sc is not None and not sc.is_connected():
+                logger.warning("Browser disconnected – restarting scraper session")
+                self._scraper = None
+                try:
+                    await sc.__aexit__(None, None, None)
+                except Exception as e:
+                    logger.debug("Closing dead scraper failed: %s", e)
+            if self._scraper is None:
+                sc = EdikteScraper()
+                try:
+                    await sc.__aenter__()
+                except BaseException:
+                    await sc.__aexit__(None, None, None)
+                    raise
+                self._scraper = sc
+            return self._scraper
+
+    async def run(self, fn: Callable[[EdikteScraper], Awaitable[T]]) -> T:
+        """Run `fn(scraper)` on the session loop and return its result."""
+        async def call():
+            return await fn(await self._ready())
+
+        future = asyncio.run_coroutine_threadsafe(call(), self._ensure_loop())
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def close(self, timeout: float = 10.0):
+        """Shut down browser and loop thread (blocking; call from the UI thread on exit)."""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def shutdown():
+            if self._scraper is not None:
+                sc, self._scraper = self._scraper, None
+                await sc.__aexit__(None, None, None)
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("Scraper session shutdown failed: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
@@ -1,123 +1,1763 @@
 """
-JSON-based persistence layer for EdikteFinder-Analyzer Desktop.
-All data lives in data/edikte.json and data/analyses.json.
-Thread-safe via a simple file lock pattern.
+Persistence layer for EdikteFinder-Analyzer Desktop.
+
+Two interchangeable backends sit behind the same function API:
+  json    – data/jsons/edikte.json + analyses.json (default)
+  sqlite  – data/jsons/edikte.db in WAL mode, one row per Edikt / Analyse
+
+The active backend is selected via config.STORAGE_BACKEND ("storage_backend"
+in settings.json).  Thread-safe via a module-level lock; safe across
+processes (GUI + headless jobs) via an OS-level advisory lock on
+data/jsons/storage.lock that is held for every load and write.
+
+Reads are served from an in-process write-through cache (_Cache) holding the
+parsed edikte list, an id → edikt dict and the analyses dict.  The cache is
+revalidated against a cheap backend fingerprint (file mtime/size for JSON,
+PRAGMA data_version for SQLite) so changes made by other processes are
+picked up; the module's own writes update the cache in place.
+
+The JSON backend does not rewrite the snapshot files on every change: each
+change is appended to data/jsons/journal.jsonl and the journal is replayed on
+load.  Once the journal exceeds config.JOURNAL_COMPACT_BYTES it is folded
+back into edikte.json / analyses.json by a background thread.  With
+config.SNAPSHOT_FORMAT = "binary" the snapshots are edikte.bin / analyses.bin
+instead, whose large fields are only decoded when first accessed.
 """
 
+import atexit
+import bisect
+import hashlib
 import json
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import struct
 import threading
+import time
 import uuid
-from datetime import datetime
+from collections import Counter
+from collections.abc import Callable, Container, Iterable, Mapping
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Sequence
 
 import config
 
+try:
+    import msgpack
+except ImportError:   # optional – binary snapshots then store compact JSON records
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:   # optional – blobs are then stored uncompressed
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
 _lock = threading.Lock()
 
 
+class StorageCorruptError(RuntimeError):
+    """A snapshot file and its last good backup are both unreadable."""
+
+
+# ── Cross-process lock ────────────────────────────────────────────────────────
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_fd(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after ~10 s – keep waiting like flock does
+                continue
+
+    def _unlock_fd(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_fd(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_fd(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _FileLock:
+    """
+    Exclusive advisory lock on config.STORAGE_LOCK, shared by every process
+    using this data directory.  Re-entrant within a process; only ever
+    acquired while holding the thread-level _lock.
+    """
+
+    def __init__(self):
+        self._fd: Optional[int] = None
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            fd = os.open(config.STORAGE_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_fd(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+            self._fd = fd
+        self._depth += 1
+        return self
+
+    def __exit__(self, *_):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                _unlock_fd(self._fd)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+
+_file_lock = _FileLock()
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _read(path: Path) -> dict | list:
+def _backup_path(path: Path) -> Path:
+    return path.with_name(path.name + ".bak")
+
+
+def _parse_json(f) -> dict | list:
+    return json.loads(f.read().decode("utf-8"))
+
+
+def _dump_json(data) -> bytes:
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _read(path: Path, parse: Callable = _parse_json) -> tuple[object, bool]:
+    """
+    Parse a snapshot file with parse(binary file object).  Returns
+    (data, restored_from_backup); data is None if the file does not exist.
+
+    A corrupt file is moved aside and replaced by its last good backup; if
+    that is unreadable too, StorageCorruptError is raised instead of returning
+    an empty dataset that the next write would persist.
+    """
+    if not path.exists():
+        return None, False
+    try:
+        with open(path, "rb") as f:
+            return parse(f), False
+    except (ValueError, struct.error) as e:
+        logger.error("%s is corrupt (%s) – falling back to last good snapshot", path.name, e)
+
+    backup = _backup_path(path)
+    try:
+        with open(backup, "rb") as f:
+            data = parse(f)
+    except (OSError, ValueError, struct.error) as e:
+        raise StorageCorruptError(
+            f"{path} ist beschädigt und es gibt keine lesbare Sicherung ({backup.name})"
+        ) from e
+    corrupt = path.with_name(f"{path.name}.corrupt-{datetime.now():%Y%m%d-%H%M%S}")
+    os.replace(path, corrupt)
+    logger.warning("Moved corrupt %s to %s, restored %s", path.name, corrupt.name, backup.name)
+    # Byte-for-byte copy: offsets parsed from the backup stay valid for `path`
+    _write(path, backup.read_bytes())
+    return data, True
+
+
+def _fsync_dir(path: Path):
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write(path: Path, payload: bytes):
+    """Crash-safe write: temp file + fsync + atomic rename, keeping a .bak of the previous file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if path.exists():
+        # Hard-link the current (last good) snapshot as .bak – no window in
+        # which `path` itself is missing.
+        backup = _backup_path(path)
+        tmp_bak = backup.with_name(backup.name + ".tmp")
+        tmp_bak.unlink(missing_ok=True)
+        try:
+            os.link(path, tmp_bak)
+        except OSError:
+            shutil.copy2(path, tmp_bak)
+        os.replace(tmp_bak, backup)
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _new_id(taken: Container = ()) -> str:
+    # 8 hex chars collide with ~5 % probability at 20,000 edikte – retry
+    while True:
+        edikt_id = str(uuid.uuid4())[:8]
+        if edikt_id not in taken:
+            return edikt_id
+
+
+# Keys owned by the storage layer – never taken over from incoming records
+_MANAGED_KEYS = ("id", "created_at", "updated_at")
+
+
+def _merge_into(existing: dict, incoming: dict) -> bool:
+    """Apply incoming values to an existing record.  Returns True if anything changed."""
+    changes = {
+        k: v for k, v in incoming.items()
+        if k not in _MANAGED_KEYS and existing.get(k) != v
+    }
+    if not changes:
+        return False
+    existing.update(changes)
+    existing["updated_at"] = datetime.now().isoformat()
+    return True
+
+
+def _stamp_new(edikt: dict, taken: Container = ()) -> str:
+    edikt_id = _new_id(taken)
+    edikt["id"]         = edikt_id
+    edikt["created_at"] = datetime.now().isoformat()
+    edikt["updated_at"] = edikt["created_at"]
+    return edikt_id
+
+
+# ── Change journal ────────────────────────────────────────────────────────────
+#
+# Backends only load and persist.  persist() receives the full cached state
+# plus the list of change operations:
+#   ("put_edikt", edikt)  ("patch_edikt", id, fields)  ("delete_edikt", id)
+#   ("put_analysis", id, analysis)  ("delete_analysis", id)
+#
+# The JSON backend writes these as one JSON object per line to the journal.
+# Every operation is idempotent, so replaying a journal over a snapshot that
+# already contains some of its changes is harmless.
+
+def _journal_entry(op: tuple) -> dict:
+    kind = op[0]
+    if kind == "put_edikt":
+        return {"op": kind, "data": op[1]}
+    if kind == "patch_edikt":
+        return {"op": kind, "id": op[1], "fields": op[2]}
+    if kind == "put_analysis":
+        return {"op": kind, "id": op[1], "data": op[2]}
+    return {"op": kind, "id": op[1]}
+
+
+def _read_journal(path: Path) -> list[dict]:
     if not path.exists():
-        return [] if "edikte" in path.name else {}
+        return []
+    entries = []
+    lines = path.read_text(encoding="utf-8").splitlines()
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            # A torn last line is expected after a crash mid-append
+            if i != len(lines) - 1:
+                logger.warning("Skipping corrupt journal line %d in %s", i + 1, path)
+    return entries
+
+
+def _replay(edikte: list[dict], analyses: dict, entries: list[dict]):
+    """Apply journal entries in place to snapshot data."""
+    pos = {e.get("id"): i for i, e in enumerate(edikte)}
+    deleted = False
+    for entry in entries:
+        op = entry.get("op")
+        if op == "put_edikt":
+            rec = entry["data"]
+            i = pos.get(rec.get("id"))
+            if i is None:
+                pos[rec.get("id")] = len(edikte)
+                edikte.append(rec)
+            else:
+                edikte[i] = rec
+        elif op == "patch_edikt":
+            i = pos.get(entry["id"])
+            if i is not None:
+                edikte[i].update(entry["fields"])
+        elif op == "delete_edikt":
+            i = pos.pop(entry["id"], None)
+            if i is not None:
+                edikte[i] = None
+                deleted = True
+        elif op == "put_analysis":
+            analyses[entry["id"]] = entry["data"]
+        elif op == "delete_analysis":
+            analyses.pop(entry["id"], None)
+    if deleted:
+        edikte[:] = [e for e in edikte if e is not None]
+
+
+# ── Binary snapshots ──────────────────────────────────────────────────────────
+#
+# With config.SNAPSHOT_FORMAT = "binary" the JSON backend writes edikte.bin /
+# analyses.bin instead of the .json snapshots.  Layout (little endian):
+#
+#   header  magic "EDKS", version u8, codec u8 (0 = JSON, 1 = msgpack),
+#           record count u32, index offset u64
+#   hot     one encoded dict per record: every field except _COLD_FIELDS
+#   cold    one encoded dict per record: only its _COLD_FIELDS (may be empty)
+#   index   per record: key length u16, key (utf-8), hot offset u64,
+#           hot length u32, cold offset u64, cold length u32
+#
+# Loading reads header, index and the contiguous hot region only.  A record's
+# cold part stays on disk until one of its cold fields is accessed (one seek,
+# read and decode for that record).  Journal entries of such a record may
+# lack its cold fields; decoding only fills in fields not already present,
+# so newer values always win.
+
+_BIN_MAGIC   = b"EDKS"
+_BIN_VERSION = 1
+_BIN_HEADER  = struct.Struct("<4sBBIQ")
+_BIN_KEYLEN  = struct.Struct("<H")
+_BIN_ENTRY   = struct.Struct("<QIQI")
+
+_CODEC_JSON, _CODEC_MSGPACK = 0, 1
+
+# Large fields the table never shows – decoded on first access
+_COLD_FIELDS = {
+    "edikt":    ("beschreibung", "pdf_text_preview"),
+    "analysis": ("raw_response", "zusammenfassung"),
+}
+
+
+def _encode(obj, codec: int) -> bytes:
+    if codec == _CODEC_MSGPACK:
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _decode(raw: bytes, codec: int):
+    if codec == _CODEC_MSGPACK:
+        if msgpack is None:
+            raise StorageCorruptError("Der Snapshot benötigt das Paket msgpack (pip install msgpack)")
+        try:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        except Exception as e:   # msgpack raises several unrelated types
+            raise ValueError(f"msgpack: {e}") from e
+    return json.loads(raw.decode("utf-8"))
+
+
+def _decode_run(raw: bytes, spans: list[tuple[int, int]], codec: int) -> list:
+    """Decode back-to-back records in one C-level pass instead of one call each."""
+    if codec == _CODEC_MSGPACK:
+        if msgpack is None:
+            return [_decode(raw, codec)]   # raises the "needs msgpack" error
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(raw)
+        try:
+            out = list(unpacker)
+        except Exception as e:
+            raise ValueError(f"msgpack: {e}") from e
+    else:
+        out = json.loads(b"[" + b",".join(raw[o:o + n] for o, n in spans) + b"]")
+    if len(out) != len(spans):
+        raise ValueError(f"expected {len(spans)} records, decoded {len(out)}")
+    return out
+
+
+def _pack_bin(items: list[tuple[str, dict, bytes]], codec: int) -> tuple[bytes, dict]:
+    """
+    Serialize (key, hot fields, encoded cold part) triples.
+    Returns (file bytes, key → (codec, offset, length) of non-empty cold parts).
+    """
+    body = bytearray(_BIN_HEADER.size)
+    spans = []
+    for blob in [_encode(hot, codec) for _, hot, _ in items] + [cold for _, _, cold in items]:
+        spans.append((len(body), len(blob)))
+        body += blob
+    index_offset = len(body)
+    n = len(items)
+    cold_refs = {}
+    for i, (key, _, _) in enumerate(items):
+        k = key.encode("utf-8")
+        body += _BIN_KEYLEN.pack(len(k)) + k + _BIN_ENTRY.pack(*spans[i], *spans[n + i])
+        if spans[n + i][1]:
+            cold_refs[key] = (codec, *spans[n + i])
+    body[:_BIN_HEADER.size] = _BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION, codec, n, index_offset)
+    return bytes(body), cold_refs
+
+
+def _parse_bin(f) -> tuple[list[tuple[str, dict]], dict]:
+    """
+    Read the hot part of a binary snapshot.  Returns ([(key, hot fields)],
+    key → (codec, offset, length) of the cold parts).  Raises ValueError /
+    struct.error on a damaged file.
+    """
+    size = os.fstat(f.fileno()).st_size
+    magic, version, codec, n, index_offset = _BIN_HEADER.unpack(f.read(_BIN_HEADER.size))
+    if magic != _BIN_MAGIC or version != _BIN_VERSION or not _BIN_HEADER.size <= index_offset <= size:
+        raise ValueError("invalid snapshot header")
+    f.seek(index_offset)
+    index = f.read()
+    entries, pos = [], 0
+    for _ in range(n):
+        (klen,) = _BIN_KEYLEN.unpack_from(index, pos)
+        key = index[pos + 2:pos + 2 + klen].decode("utf-8")
+        pos += 2 + klen
+        hot_off, hot_len, cold_off, cold_len = _BIN_ENTRY.unpack_from(index, pos)
+        pos += _BIN_ENTRY.size
+        if hot_off + hot_len > index_offset or cold_off + cold_len > index_offset:
+            raise ValueError(f"record {key!r} points past the data region")
+        entries.append((key, hot_off, hot_len, cold_off, cold_len))
+    if pos != len(index):
+        raise ValueError("trailing bytes after index")
+
+    # Hot parts are written back to back – fetch and decode them in one go
+    start = entries[0][1] if entries else index_offset
+    f.seek(start)
+    hot = f.read((entries[-1][1] + entries[-1][2] - start) if entries else 0)
+    spans = [(hot_off - start, hot_len) for _, hot_off, hot_len, _, _ in entries]
+    records = list(zip((e[0] for e in entries), _decode_run(hot, spans, codec)))
+    cold_refs = {key: (codec, cold_off, cold_len)
+                 for key, _, _, cold_off, cold_len in entries if cold_len}
+    return records, cold_refs
+
+
+# ── JSON backend ──────────────────────────────────────────────────────────────
+
+class JsonBackend:
+    """
+    Snapshot files (edikte.json / analyses.json, or edikte.bin / analyses.bin
+    with config.SNAPSHOT_FORMAT = "binary") plus an append-only change
+    journal.  A change costs one appended line; the journal is flushed after
+    every write (survives a process crash) and fsync'ed at most every
+    config.JOURNAL_FSYNC_INTERVAL seconds (survives a power loss).
+    """
+
+    name = "json"
+
+    def __init__(self):
+        self._journal = None
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+        self._compacting = False
+        self._format: Optional[str] = None   # snapshot format found on disk by load()
+        # Binary snapshots: cold parts not yet decoded, per kind key → (codec, offset, length),
+        # and the (path, stat) of the file the offsets refer to
+        self._cold: dict[str, dict[str, tuple]] = {"edikt": {}, "analysis": {}}
+        self._cold_src: dict[str, tuple] = {}
+        self._stats: Optional["_Stats"] = None   # aggregates matching the last load()
+
+    @staticmethod
+    def _paths(fmt: str) -> dict[str, Path]:
+        if fmt == "binary":
+            return {"edikt": config.EDIKTE_BIN, "analysis": config.ANALYSES_BIN}
+        return {"edikt": config.EDIKTE_JSON, "analysis": config.ANALYSES_JSON}
+
+    @classmethod
+    def _format_on_disk(cls) -> str:
+        """The configured format, unless only the other format's snapshots exist yet."""
+        wanted = config.SNAPSHOT_FORMAT
+        other = "json" if wanted == "binary" else "binary"
+        if (not any(p.exists() for p in cls._paths(wanted).values())
+                and any(p.exists() for p in cls._paths(other).values())):
+            return other
+        return wanted
+
+    def fingerprint(self):
+        return (_stat(config.EDIKTE_JSON), _stat(config.ANALYSES_JSON),
+                _stat(config.EDIKTE_BIN), _stat(config.ANALYSES_BIN),
+                _stat(config.JOURNAL_JSONL))
+
+    def load(self, materialize: bool = False) -> tuple[list[dict], dict]:
+        """
+        Snapshots + journal.  Records from a binary snapshot come without their
+        cold fields (see load_cold) unless materialize is set.
+        """
+        self._format = self._format_on_disk()
+        paths = self._paths(self._format)
+        if self._format == "binary":
+            edikte, restored_e = self._read_bin("edikt", paths["edikt"])
+            analyses, restored_a = self._read_bin("analysis", paths["analysis"])
+            edikte = [rec for _, rec in edikte]
+            analyses = dict(analyses)
+        else:
+            self._cold = {"edikt": {}, "analysis": {}}
+            edikte, restored_e   = _read(paths["edikt"])
+            analyses, restored_a = _read(paths["analysis"])
+            edikte, analyses = edikte or [], analyses or {}
+        stats = None if restored_e or restored_a else self._read_stats(paths)
+        entries = _read_journal(config.JOURNAL_JSONL)
+        if restored_e or restored_a:
+            # The .bak snapshots predate the last compaction – replay the
+            # journal segment that compaction folded in, then the live one.
+            entries = _read_journal(_backup_path(config.JOURNAL_JSONL)) + entries
+        if entries:
+            # Bring the saved aggregates forward by the analyses the journal touches
+            touched = {e.get("id") for e in entries if e.get("op") in ("put_analysis", "delete_analysis")}
+            if stats is not None:
+                for key in touched & analyses.keys():
+                    stats.remove_analysis(analyses[key])
+            _replay(edikte, analyses, entries)
+            if stats is not None:
+                for key in touched & analyses.keys():
+                    stats.add_analysis(analyses[key])
+            self._drop_cold(entries)
+            logger.info("Replayed %d journal entries", len(entries))
+        self._stats = stats
+        if materialize:
+            self._materialize("edikt", {e.get("id"): e for e in edikte})
+            self._materialize("analysis", analyses)
+        return edikte, analyses
+
+    def load_stats(self) -> Optional["_Stats"]:
+        """The aggregates saved with the snapshots, brought up to the last load(), or None."""
+        stats, self._stats = self._stats, None
+        return stats
+
+    @staticmethod
+    def _read_stats(paths: dict[str, Path]) -> Optional["_Stats"]:
+        # Only valid for exactly the snapshot files compact() wrote them with
+        try:
+            data = json.loads(config.STATS_JSON.read_text(encoding="utf-8"))
+            if data.get("snapshots") != [list(_stat(p) or ()) for p in paths.values()]:
+                return None
+            return _Stats.from_json(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_stats(paths: dict[str, Path], stats: "_Stats"):
+        data = {"snapshots": [list(_stat(p) or ()) for p in paths.values()], **stats.to_json()}
+        tmp = config.STATS_JSON.with_name(f"{config.STATS_JSON.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, config.STATS_JSON)
+
+    def _read_bin(self, kind: str, path: Path) -> tuple[list[tuple[str, dict]], bool]:
+        data, restored = _read(path, _parse_bin)
+        records, self._cold[kind] = data if data is not None else ([], {})
+        self._cold_src[kind] = (path, _stat(path))
+        return records, restored
+
+    def _drop_cold(self, entries):
+        """Forget cold parts that journal entries / ops made obsolete."""
+        for entry in entries:
+            op, key = (entry[0], entry[1]) if isinstance(entry, tuple) else (entry.get("op"), entry.get("id"))
+            if op == "delete_edikt":
+                self._cold["edikt"].pop(key, None)
+            elif op in ("put_analysis", "delete_analysis"):
+                # A new analysis is complete – never mix in the old one's fields
+                self._cold["analysis"].pop(key, None)
+
+    def load_cold(self, kind: str, key: str) -> Optional[dict]:
+        """Decode the cold fields of one record, or None if nothing is pending."""
+        return self.load_cold_many(kind, (key,)).get(key)
+
+    def load_cold_many(self, kind: str, keys: Optional[Iterable[str]] = None) -> dict[str, dict]:
+        """
+        Decode the pending cold fields of `keys` (default: every record of
+        `kind`) with a single open of the snapshot; key → cold fields.
+        """
+        refs = self._cold[kind]
+        if keys is None:
+            wanted, self._cold[kind] = list(refs.items()), {}
+        else:
+            wanted = [(key, refs.pop(key)) for key in keys if key in refs]
+        if not wanted:
+            return {}
+        path, st = self._cold_src[kind]
+        if _stat(path) != st:
+            # Callers hold the file lock and a fresh cache, so this means the
+            # snapshot was replaced behind our back – don't read garbage.
+            logger.error("%s changed since load – cold fields of %d record(s) unavailable",
+                         path.name, len(wanted))
+            return {}
+        out = {}
+        try:
+            with open(path, "rb") as f:
+                for key, (codec, offset, length) in sorted(wanted, key=lambda kv: kv[1][1]):
+                    f.seek(offset)
+                    out[key] = _decode(f.read(length), codec)
+        except (OSError, ValueError) as e:
+            logger.error("Could not read cold fields from %s: %s", path.name, e)
+        return out
+
+    def _materialize(self, kind: str, records: dict):
+        """Merge every pending cold part into `records` (key → record)."""
+        refs = self._cold[kind]
+        if not refs:
+            return
+        with open(self._cold_src[kind][0], "rb") as f:
+            for key, (codec, offset, length) in refs.items():
+                rec = records.get(key)
+                if rec is not None:
+                    f.seek(offset)
+                    for field, value in _decode(f.read(length), codec).items():
+                        rec.setdefault(field, value)
+        refs.clear()
+
+    def persist(self, cache: "_Cache", ops: list[tuple]):
+        if self._journal is None:
+            self._journal = self._open_journal()
+        self._journal.write("".join(
+            json.dumps(_journal_entry(op), ensure_ascii=False, default=str) + "\n"
+            for op in ops
+        ))
+        self._journal.flush()
+        self._unsynced = True
+        self._drop_cold(ops)
+        self._sync_soon()
+        due = (self._journal.tell() >= config.JOURNAL_COMPACT_BYTES
+               or self._format != config.SNAPSHOT_FORMAT)
+        if due and not self._compacting:
+            self._compacting = True
+            threading.Thread(target=_compact_in_background, args=(self,),
+                             name="storage-compact", daemon=True).start()
+
+    @staticmethod
+    def _open_journal():
+        path = config.JOURNAL_JSONL
+        torn = False
+        if path.exists() and path.stat().st_size:
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        f = open(path, "a", encoding="utf-8")
+        if torn:
+            # Terminate a torn line left by a crash so the next entry stays parseable
+            f.write("\n")
+        return f
+
+    def _sync_soon(self):
+        """fsync now if the interval has passed, otherwise schedule one."""
+        if time.monotonic() - self._last_sync >= config.JOURNAL_FSYNC_INTERVAL:
+            self.sync()
+        elif self._sync_timer is None:
+            self._sync_timer = threading.Timer(config.JOURNAL_FSYNC_INTERVAL, self._timed_sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def _timed_sync(self):
+        with _lock:
+            self._sync_timer = None
+            self.sync()
+
+    def sync(self):
+        if self._journal is not None and self._unsynced:
+            os.fsync(self._journal.fileno())
+            self._unsynced = False
+        self._last_sync = time.monotonic()
+
+    def compact(self, cache: "_Cache"):
+        """Write the cached state as new snapshots (config.SNAPSHOT_FORMAT) and truncate the journal."""
+        fmt = config.SNAPSHOT_FORMAT
+        records = {"edikt": [(e.get("id"), e) for e in cache.edikte],
+                   "analysis": list(cache.analyses.items())}
+        if fmt == "binary":
+            codec = _CODEC_MSGPACK if msgpack is not None else _CODEC_JSON
+            for kind, path in self._paths(fmt).items():
+                for _, rec in records[kind]:
+                    _externalize(rec, kind)
+                payload, cold_refs = self._pack(kind, records[kind], codec)
+                _write(path, payload)
+                self._cold[kind], self._cold_src[kind] = cold_refs, (path, _stat(path))
+        else:
+            for kind, path in self._paths(fmt).items():
+                self._materialize(kind, dict(records[kind]))
+                for _, rec in records[kind]:
+                    _externalize(rec, kind)
+                _write(path, _dump_json(cache.edikte if kind == "edikt" else cache.analyses))
+        self._write_stats(self._paths(fmt), cache.stats)
+        if self._format not in (None, fmt):
+            # Format switched: the old snapshots are superseded, and would be
+            # preferred again (stale) if the setting were switched back
+            for path in self._paths(self._format).values():
+                path.unlink(missing_ok=True)
+                _backup_path(path).unlink(missing_ok=True)
+        self._format = fmt
+        # Only now is it safe to drop the journal; a crash before this point
+        # just replays already-applied (idempotent) entries.  The dropped
+        # segment is kept as journal.jsonl.bak: together with the .bak
+        # snapshots it reconstructs the current state.
+        self.close()
+        if config.JOURNAL_JSONL.exists():
+            shutil.copyfile(config.JOURNAL_JSONL, _backup_path(config.JOURNAL_JSONL))
+        with open(config.JOURNAL_JSONL, "w", encoding="utf-8") as f:
+            os.fsync(f.fileno())
+
+    def _pack(self, kind: str, records: list[tuple[str, dict]], codec: int) -> tuple[bytes, dict]:
+        cold_fields = _COLD_FIELDS[kind]
+        pending = self._cold[kind]
+        src = open(self._cold_src[kind][0], "rb") if pending else None
+        try:
+            items = []
+            for key, rec in records:
+                hot  = {k: v for k, v in rec.items() if k not in cold_fields}
+                cold = {k: rec[k] for k in cold_fields if k in rec}
+                ref = pending.get(key)
+                if ref is not None:
+                    src.seek(ref[1])
+                    raw = src.read(ref[2])
+                    if not cold and ref[0] == codec:
+                        # Untouched cold part: copy the bytes, no decode/encode
+                        items.append((key, hot, raw))
+                        continue
+                    for field, value in _decode(raw, ref[0]).items():
+                        cold.setdefault(field, value)
+                items.append((key, hot, _encode(cold, codec) if cold else b""))
+        finally:
+            if src is not None:
+                src.close()
+        return _pack_bin(items, codec)
+
+    def close(self):
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        if self._journal is not None:
+            self.sync()
+            self._journal.close()
+            self._journal = None
+
+
+def _compact_in_background(backend: JsonBackend):
+    try:
+        with _lock, _file_lock:
+            if _backend is not backend:
+                return
+            _cache.ensure_fresh(backend)
+            backend.compact(_cache)
+            _cache.fingerprint = backend.fingerprint()
+            logger.info("Compacted journal into snapshots (%d edikte)", len(_cache.edikte))
+            removed = _sweep_blobs(_cache)
+            if removed:
+                logger.info("Removed %d unreferenced blobs", removed)
+    except Exception as e:
+        logger.error("Journal compaction failed: %s", e)
+    finally:
+        backend._compacting = False
+
+
+# ── SQLite backend ────────────────────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS edikte (
+    id          TEXT PRIMARY KEY,
+    detail_url  TEXT,
+    data        TEXT NOT NULL,
+    created_at  TEXT,
+    updated_at  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_edikte_detail_url ON edikte(detail_url);
+CREATE TABLE IF NOT EXISTS analyses (
+    edikt_id    TEXT PRIMARY KEY,
+    data        TEXT NOT NULL,
+    analyzed_at TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SqliteBackend:
+    """
+    WAL-mode SQLite storage.  Each Edikt / Analyse is one row holding the
+    record as a JSON document, so a status patch touches a single row.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path):
+        self.path = path
+        # One shared connection; all access is serialised through storage._lock.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def fingerprint(self):
+        # Changes only when *another* connection commits – own writes are
+        # already reflected in the cache.
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def load_cold(self, kind: str, key: str) -> None:
+        return None   # rows are always loaded complete
+
+    def load_cold_many(self, kind: str, keys=None) -> dict:
+        return {}
+
+    def load(self) -> tuple[list[dict], dict]:
+        rows = self._conn.execute("SELECT data FROM edikte ORDER BY rowid")
+        edikte = [json.loads(r[0]) for r in rows]
+        rows = self._conn.execute("SELECT edikt_id, data FROM analyses ORDER BY rowid")
+        return edikte, {eid: json.loads(data) for eid, data in rows}
+
+    def load_stats(self) -> Optional["_Stats"]:
+        """The aggregates every persist() stores next to the rows, or None."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'stats'").fetchone()
+        try:
+            return _Stats.from_json(json.loads(row[0])) if row else None
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def persist(self, cache: "_Cache", ops: list[tuple]):
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for op in ops:
+                kind = op[0]
+                if kind in ("put_edikt", "patch_edikt"):
+                    # Rows hold whole documents – a patch writes the merged record
+                    e = op[1] if kind == "put_edikt" else cache.by_id[op[1]]
+                    self._conn.execute(
+                        "INSERT INTO edikte (id, detail_url, data, created_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(id) DO UPDATE SET detail_url = excluded.detail_url, "
+                        "data = excluded.data, updated_at = excluded.updated_at",
+                        (e["id"], e.get("detail_url"), _dumps(e),
+                         e.get("created_at"), e.get("updated_at")),
+                    )
+                elif kind == "delete_edikt":
+                    self._conn.execute("DELETE FROM edikte WHERE id = ?", (op[1],))
+                elif kind == "put_analysis":
+                    self._conn.execute(
+                        "INSERT INTO analyses (edikt_id, data, analyzed_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(edikt_id) DO UPDATE SET data = excluded.data, "
+                        "analyzed_at = excluded.analyzed_at",
+                        (op[1], _dumps(op[2]), op[2].get("analyzed_at")),
+                    )
+                elif kind == "delete_analysis":
+                    self._conn.execute("DELETE FROM analyses WHERE edikt_id = ?", (op[1],))
+            # Same transaction as the rows, so the two never disagree
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('stats', ?)",
+                (_dumps(cache.stats.to_json()),),
+            )
+
+    # ── Migration ───────────────────────────────────────────────────────────
+
+    def is_migrated(self) -> bool:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'migrated_from_json'"
+        ).fetchone()
+        return row is not None
+
+    def import_json(self, edikte: list[dict], analyses: dict) -> tuple[int, int]:
+        """Bulk-load records from the JSON files in a single transaction."""
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO edikte (id, detail_url, data, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(e["id"], e.get("detail_url"), _dumps(e),
+                  e.get("created_at"), e.get("updated_at"))
+                 for e in edikte if e.get("id")],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analyses (edikt_id, data, analyzed_at) VALUES (?, ?, ?)",
+                [(eid, _dumps(a), a.get("analyzed_at")) for eid, a in analyses.items()],
+            )
+            self._conn.execute("DELETE FROM meta WHERE key = 'stats'")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                (datetime.now().isoformat(),),
+            )
+        return len(edikte), len(analyses)
+
+
+# ── Backend selection ─────────────────────────────────────────────────────────
+
+_backend = None
+
+
+def _get_backend():
+    """Return the backend for config.STORAGE_BACKEND, (re)opening it on change."""
+    global _backend
+    wanted = config.STORAGE_BACKEND
+    if _backend is not None and _backend.name == wanted:
+        return _backend
+    if _backend is not None:
+        _backend.close()
+    if wanted == "sqlite":
+        _backend = SqliteBackend(config.SQLITE_DB)
+        if not _backend.is_migrated():
+            with _file_lock:
+                _migrate(_backend)
+    else:
+        _backend = JsonBackend()
+    _cache.invalidate()
+    return _backend
+
+
+def _migrate(backend: SqliteBackend) -> tuple[int, int]:
+    edikte, analyses = JsonBackend().load(materialize=True)
+    for e in edikte:
+        _externalize(e, "edikt")
+    for a in analyses.values():
+        _externalize(a, "analysis")
+    return backend.import_json(edikte, analyses)
+
+
+def migrate_json_to_sqlite() -> tuple[int, int]:
+    """
+    One-shot import of edikte.json / analyses.json into the SQLite database.
+    Runs automatically the first time the sqlite backend is opened; calling it
+    again re-imports (existing rows with the same id are replaced).
+    Returns (edikte_count, analyses_count).
+    """
+    with _lock, _file_lock:
+        backend = _get_backend()
+        if isinstance(backend, SqliteBackend):
+            _cache.invalidate()
+            return _migrate(backend)
+        sqlite_backend = SqliteBackend(config.SQLITE_DB)
+        try:
+            return _migrate(sqlite_backend)
+        finally:
+            sqlite_backend.close()
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────────
+
+class _RecordView(Mapping):
+    """
+    Read-only view on one cached record.  Cold fields (_COLD_FIELDS) of a
+    record loaded from a binary snapshot are decoded on first access; blob
+    fields (_BLOB_FIELDS) are read from the blob store on every access.
+    """
+
+    __slots__ = ("_rec", "_kind", "_key", "_complete")
+
+    def __init__(self, rec: dict, kind: str, key: str, complete: bool = False):
+        self._rec, self._kind, self._key = rec, kind, key
+        self._complete = complete
+
+    def _load_cold(self):
+        if not self._complete:
+            _load_cold(self._kind, self._key, self._rec)
+            self._complete = True
+
+    def __getitem__(self, field):
+        try:
+            return self._rec[field]
+        except KeyError:
+            pass
+        if field in _BLOB_FIELDS[self._kind] and self._rec.get(field + "_ref"):
+            return _blob_text(self._rec[field + "_ref"])
+        if self._complete or field not in _COLD_FIELDS[self._kind]:
+            raise KeyError(field)
+        self._load_cold()
+        return self._rec[field]
+
+    def __iter__(self):
+        self._load_cold()
+        yield from self._rec
+        for field in _BLOB_FIELDS[self._kind]:
+            if field not in self._rec and self._rec.get(field + "_ref"):
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"_RecordView({self._rec!r})"
+
+
+class _ReadOnlyAnalyses(Mapping):
+    """
+    Live, read-only view on the cached analyses dict (values are read-only
+    too).  `complete` marks the cold fields as already loaded.
+    """
+
+    def __init__(self, analyses: dict, complete: bool = False):
+        self._analyses = analyses
+        self._complete = complete
+
+    def __getitem__(self, edikt_id):
+        return _RecordView(self._analyses[edikt_id], "analysis", edikt_id, self._complete)
+
+    def __iter__(self):
+        return iter(self._analyses)
+
+    def __len__(self):
+        return len(self._analyses)
+
+
+# Exact-match secondary indexes kept by _Cache (besides id and detail_url)
+_INDEXED_FIELDS = ("aktenzeichen", "gericht", "status")
+
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+
+def parse_date(value) -> Optional[date]:
+    """Parse the first DD.MM.YYYY in a portal value such as "12.03.2026, 10:00 Uhr"."""
+    if isinstance(value, date):
+        return value
+    m = _DATE_RE.search(value or "")
+    if not m:
+        return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return [] if "edikte" in path.name else {}
+        return date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    except ValueError:
+        return None
+
+
+_PDF_NAME_RE = re.compile(r"gutachten_(.+)\.pdf")
+
+
+def _score(analysis: dict):
+    score = analysis.get("investitions_score")
+    return score if isinstance(score, (int, float)) else None
+
+
+class _Stats:
+    """
+    Running aggregates behind get_stats(), kept in step by _Cache.
+
+    `scores` counts occurrences per score value so the maximum survives
+    deletes without rescanning all analyses.  `pdf_files` holds the ids of
+    all gutachten_<id>.pdf files (from one directory scan per load, updated
+    on every patch of that edikt); `pdf_ids` the subset that are live edikte.
+    """
+
+    def __init__(self):
+        self.scores: Counter     = Counter()
+        self.score_sum           = 0
+        self.empfehlungen: Counter = Counter()
+        self.pdf_files: set[str] = set()
+        self.pdf_ids: set[str]   = set()
+
+    def add_analysis(self, analysis: dict, sign: int = 1):
+        score = _score(analysis)
+        if score is not None:
+            self.scores[score] += sign
+            if not self.scores[score]:
+                del self.scores[score]
+            self.score_sum += sign * score
+        empfehlung = analysis.get("empfehlung")
+        if empfehlung:
+            self.empfehlungen[empfehlung] += sign
+            if not self.empfehlungen[empfehlung]:
+                del self.empfehlungen[empfehlung]
+
+    def remove_analysis(self, analysis: dict):
+        self.add_analysis(analysis, -1)
+
+    def scan_pdfs(self, live_ids):
+        try:
+            names = os.listdir(config.DOWNLOADS_DIR)
+        except FileNotFoundError:
+            names = []
+        self.pdf_files = {m.group(1) for m in map(_PDF_NAME_RE.fullmatch, names) if m}
+        self.pdf_ids = {i for i in self.pdf_files if i in live_ids}
+
+    def check_pdf(self, edikt_id: str):
+        if has_pdf(edikt_id):
+            self.pdf_files.add(edikt_id)
+            self.pdf_ids.add(edikt_id)
+        else:
+            self.pdf_files.discard(edikt_id)
+            self.pdf_ids.discard(edikt_id)
+
+    def to_json(self) -> dict:
+        """The analysis aggregates; PDF files are rescanned on every load."""
+        return {"scores": [[score, n] for score, n in self.scores.items()],
+                "score_sum": self.score_sum,
+                "empfehlungen": dict(self.empfehlungen)}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "_Stats":
+        stats = cls()
+        stats.scores = Counter({score: n for score, n in data["scores"]})
+        stats.score_sum = data["score_sum"]
+        stats.empfehlungen = Counter(data["empfehlungen"])
+        return stats
+
+    def as_dict(self, total_edikte: int, total_analyses: int) -> dict:
+        count = sum(self.scores.values())
+        return {
+            "total_edikte":   total_edikte,
+            "total_analyses": total_analyses,
+            "with_pdf":       len(self.pdf_ids),
+            "avg_score":      round(self.score_sum / count, 1) if count else 0,
+            "top_score":      max(self.scores, default=0),
+            "empfehlungen": {
+                "KAUFEN": self.empfehlungen.get("KAUFEN", 0),
+                "PRÜFEN": self.empfehlungen.get("PRÜFEN", 0),
+                "MEIDEN": self.empfehlungen.get("MEIDEN", 0),
+            },
+        }
+
+
+class _Cache:
+    """
+    Parsed copy of the active backend's data.  Callers only ever receive
+    read-only views (_RecordView per record); every mutation goes
+    through the CRUD functions below, which update the cache, its indexes
+    and persist.
+
+    Indexes: by_id, by_url, one value → {id: edikt} dict per _INDEXED_FIELDS
+    entry, and `by_date` – (versteigerung date ordinal, id) pairs kept sorted.
+    `stats` holds the get_stats() aggregates, updated on every change.  The
+    backend persists them with the data; they are only recounted on load
+    when it has none that match (first run, restored backup).
+    """
+
+    def __init__(self):
+        self.edikte: list[dict]          = []
+        self.by_id: dict[str, dict]      = {}
+        self.by_url: dict[str, dict]     = {}
+        self.by_field: dict[str, dict[str, dict[str, dict]]] = {}
+        self.by_date: list[tuple[int, str]] = []
+        self.analyses: dict[str, dict]   = {}
+        self.stats                       = _Stats()
+        self.fingerprint                 = None
+        self._valid                      = False
+        self._edikte_view: Optional[tuple] = None
+
+    def invalidate(self):
+        self._valid = False
+
+    def ensure_fresh(self, backend):
+        if self._valid and backend.fingerprint() == self.fingerprint:
+            return
+        with _file_lock:
+            # Fingerprint taken under the lock, so no writer can slip in between
+            self.fingerprint = backend.fingerprint()
+            self.edikte, self.analyses = backend.load()
+            stats = backend.load_stats()
+        self.reindex(stats)
+        self._valid = True
+
+    def reindex(self, stats: Optional[_Stats] = None):
+        self.by_id    = {}
+        self.by_url   = {}
+        self.by_field = {f: {} for f in _INDEXED_FIELDS}
+        dated = []
+        for e in self.edikte:
+            self.by_id.setdefault(e.get("id"), e)
+            self.by_url.setdefault(e.get("detail_url"), e)
+            for f in _INDEXED_FIELDS:
+                self.by_field[f].setdefault(e.get(f) or "", {})[e.get("id")] = e
+            d = parse_date(e.get("versteigerung"))
+            if d:
+                dated.append((d.toordinal(), e.get("id")))
+        dated.sort()
+        self.by_date = dated
+        self._edikte_view = None
+        if stats is None:
+            stats = _Stats()
+            for a in self.analyses.values():
+                stats.add_analysis(a)
+        self.stats = stats
+        self.stats.scan_pdfs(self.by_id)
+
+    def _index(self, e: dict):
+        eid = e.get("id")
+        self.by_id[eid] = e
+        self.by_url.setdefault(e.get("detail_url"), e)
+        for f in _INDEXED_FIELDS:
+            self.by_field[f].setdefault(e.get(f) or "", {})[eid] = e
+        d = parse_date(e.get("versteigerung"))
+        if d:
+            bisect.insort(self.by_date, (d.toordinal(), eid))
+
+    def _unindex(self, e: dict):
+        eid = e.get("id")
+        self.by_id.pop(eid, None)
+        if self.by_url.get(e.get("detail_url")) is e:
+            del self.by_url[e.get("detail_url")]
+        for f in _INDEXED_FIELDS:
+            bucket = self.by_field[f].get(e.get(f) or "")
+            if bucket is not None:
+                bucket.pop(eid, None)
+                if not bucket:
+                    del self.by_field[f][e.get(f) or ""]
+        d = parse_date(e.get("versteigerung"))
+        if d:
+            key = (d.toordinal(), eid)
+            i = bisect.bisect_left(self.by_date, key)
+            if i < len(self.by_date) and self.by_date[i] == key:
+                del self.by_date[i]
+
+    def add(self, edikt: dict):
+        self.edikte.append(edikt)
+        self._index(edikt)
+        self._edikte_view = None
+        if edikt.get("id") in self.stats.pdf_files:
+            self.stats.pdf_ids.add(edikt.get("id"))
+
+    def merge(self, existing: dict, incoming: dict) -> bool:
+        self._unindex(existing)
+        changed = _merge_into(existing, incoming)
+        self._index(existing)
+        return changed
+
+    def patch(self, edikt: dict, fields: dict):
+        self._unindex(edikt)
+        edikt.update(fields)
+        self._index(edikt)
+        # Status patches follow downloads – the one moment a PDF appears
+        self.stats.check_pdf(edikt.get("id"))
+
+    def remove(self, edikt_id: str) -> bool:
+        return bool(self.remove_many([edikt_id]))
+
+    def remove_many(self, edikt_ids) -> list[str]:
+        """Remove several edikte with one pass over the list; returns the ids removed."""
+        gone = {}
+        for edikt_id in edikt_ids:
+            edikt = self.by_id.get(edikt_id)
+            if edikt is not None:
+                self._unindex(edikt)
+                self.stats.pdf_ids.discard(edikt_id)
+                gone[id(edikt)] = edikt_id
+        if gone:
+            self.edikte = [e for e in self.edikte if id(e) not in gone]
+            self._edikte_view = None
+        return list(gone.values())
+
+    def put_analysis(self, edikt_id: str, analysis: dict):
+        old = self.analyses.get(edikt_id)
+        if old is not None:
+            self.stats.remove_analysis(old)
+        self.analyses[edikt_id] = analysis
+        self.stats.add_analysis(analysis)
 
+    def pop_analysis(self, edikt_id: str) -> Optional[dict]:
+        analysis = self.analyses.pop(edikt_id, None)
+        if analysis is not None:
+            self.stats.remove_analysis(analysis)
+        return analysis
 
-def _write(path: Path, data):
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str),
-                    encoding="utf-8")
+    def commit(self, backend, ops: list[tuple]):
+        """Persist ops; on failure drop the cache so the next read reloads from disk."""
+        if not ops:
+            return
+        try:
+            backend.persist(self, ops)
+        except Exception:
+            self.invalidate()
+            raise
+        self.fingerprint = backend.fingerprint()
+
+    def edikte_view(self) -> tuple:
+        if self._edikte_view is None:
+            self._edikte_view = tuple(_RecordView(e, "edikt", e.get("id")) for e in self.edikte)
+        return self._edikte_view
+
+
+_cache = _Cache()
+
+
+def _fresh_cache() -> tuple["_Cache", object]:
+    """Must be called with _lock held."""
+    backend = _get_backend()
+    _cache.ensure_fresh(backend)
+    return _cache, backend
+
+
+@contextmanager
+def _transaction():
+    """
+    Hold both locks for a read-modify-write: the cache is revalidated under
+    the file lock, so changes by other processes are never overwritten.
+    """
+    with _lock, _file_lock:
+        yield _fresh_cache()
+
+
+def _load_cold(kind: str, key: str, rec: dict):
+    """Decode a record's pending cold fields into the cache (and into `rec`)."""
+    with _transaction() as (cache, backend):
+        current = (cache.by_id if kind == "edikt" else cache.analyses).get(key)
+        if current is None:
+            return
+        for field, value in (backend.load_cold(kind, key) or {}).items():
+            current.setdefault(field, value)
+        if current is not rec:
+            # The view predates a reload – hand over what the fresh record has
+            for field in _COLD_FIELDS[kind]:
+                if field in current:
+                    rec.setdefault(field, current[field])
 
 
 # ── Edikte CRUD ───────────────────────────────────────────────────────────────
 
-def load_all_edikte() -> list[dict]:
+def load_all_edikte() -> Sequence[Mapping]:
+    """Read-only views of all edikte (in insertion order)."""
     with _lock:
-        return _read(config.EDIKTE_JSON)
+        cache, _ = _fresh_cache()
+        return cache.edikte_view()
 
 
 def save_edikt(edikt: dict) -> str:
     """
     Upsert an Edikt by detail_url.  Returns the edikt_id.
     """
-    with _lock:
-        edikte = _read(config.EDIKTE_JSON)
-        # Try to find existing entry by URL
-        existing = next(
-            (e for e in edikte if e.get("detail_url") == edikt.get("detail_url")), None
-        )
-        if existing:
-            existing.update(edikt)
-            existing["updated_at"] = datetime.now().isoformat()
-            edikt_id = existing["id"]
-        else:
-            edikt_id = str(uuid.uuid4())[:8]
-            edikt["id"]         = edikt_id
-            edikt["created_at"] = datetime.now().isoformat()
-            edikt["updated_at"] = edikt["created_at"]
-            edikte.append(edikt)
-        _write(config.EDIKTE_JSON, edikte)
-    return edikt_id
+    return upsert_edikte_bulk([edikt])[0][0]
 
 
 def save_edikte_bulk(edikte_list: list[dict]) -> list[str]:
     """Save a batch of edikte, returning list of ids."""
-    return [save_edikt(e) for e in edikte_list]
+    return [edikt_id for edikt_id, _ in upsert_edikte_bulk(edikte_list)]
+
+
+def upsert_edikte_bulk(edikte_list: list[dict]) -> list[tuple[str, str]]:
+    """
+    Upsert a batch of edikte by detail_url with a single load and a single write.
+    Returns one (edikt_id, outcome) pair per input entry, in input order;
+    outcome is "inserted", "updated" or "unchanged".
+    """
+    with _transaction() as (cache, backend):
+        report = []
+        dirty: dict[str, dict] = {}
+        for edikt in edikte_list:
+            existing = cache.by_url.get(edikt.get("detail_url"))
+            if existing is not None:
+                changed = cache.merge(existing, edikt)
+                report.append((existing["id"], "updated" if changed else "unchanged"))
+                if changed:
+                    dirty[existing["id"]] = existing
+            else:
+                edikt_id = _stamp_new(edikt, cache.by_id)
+                cache.add(edikt)
+                report.append((edikt_id, "inserted"))
+                dirty[edikt_id] = edikt
+        cache.commit(backend, [("put_edikt", e) for e in dirty.values()])
+        return report
 
 
-def get_edikt(edikt_id: str) -> Optional[dict]:
+def get_edikt(edikt_id: str) -> Optional[Mapping]:
     with _lock:
-        edikte = _read(config.EDIKTE_JSON)
-        return next((e for e in edikte if e.get("id") == edikt_id), None)
+        cache, _ = _fresh_cache()
+        edikt = cache.by_id.get(edikt_id)
+        return _RecordView(edikt, "edikt", edikt_id) if edikt is not None else None
 
 
-def update_edikt_field(edikt_id: str, **kwargs):
-    """Patch specific fields on an existing edikt."""
+def get_edikt_by_url(detail_url: str) -> Optional[Mapping]:
     with _lock:
-        edikte = _read(config.EDIKTE_JSON)
-        for e in edikte:
-            if e.get("id") == edikt_id:
-                e.update(kwargs)
-                e["updated_at"] = datetime.now().isoformat()
-                break
-        _write(config.EDIKTE_JSON, edikte)
+        cache, _ = _fresh_cache()
+        edikt = cache.by_url.get(detail_url)
+        return _RecordView(edikt, "edikt", edikt["id"]) if edikt is not None else None
 
 
-def delete_edikt(edikt_id: str):
+def find(
+    status: Optional[str] = None,
+    gericht: Optional[str] = None,
+    aktenzeichen: Optional[str] = None,
+    detail_url: Optional[str] = None,
+    versteigerung_between: Optional[tuple] = None,
+) -> list[Mapping]:
+    """
+    Index-backed query over the cached edikte; all given criteria must match.
+
+    status / gericht / aktenzeichen / detail_url match exactly.
+    versteigerung_between is a (von, bis) pair of date objects or "DD.MM.YYYY"
+    strings, both inclusive; either end may be None.  Results with a date
+    range come back sorted by auction date, otherwise in storage order of the
+    most selective criterion.
+    """
     with _lock:
-        edikte = _read(config.EDIKTE_JSON)
-        edikte = [e for e in edikte if e.get("id") != edikt_id]
-        _write(config.EDIKTE_JSON, edikte)
+        cache, _ = _fresh_cache()
+        candidates: list[dict] = []   # each: id → edikt
+        if detail_url is not None:
+            e = cache.by_url.get(detail_url)
+            candidates.append({e["id"]: e} if e else {})
+        for field, value in (("status", status), ("gericht", gericht),
+                             ("aktenzeichen", aktenzeichen)):
+            if value is not None:
+                candidates.append(cache.by_field[field].get(value, {}))
+        if versteigerung_between is not None:
+            von, bis = (parse_date(v) if v else None for v in versteigerung_between)
+            lo = bisect.bisect_left(cache.by_date, (von.toordinal(), "") if von else (0, ""))
+            hi = (bisect.bisect_right(cache.by_date, (bis.toordinal(), "\uffff"))
+                  if bis else len(cache.by_date))
+            candidates.append({eid: cache.by_id[eid] for _, eid in cache.by_date[lo:hi]})
+        if not candidates:
+            return list(cache.edikte_view())
+        if versteigerung_between is not None:
+            # Keep date order: iterate the date candidates, filter by the rest
+            base, rest = candidates[-1], candidates[:-1]
+        else:
+            candidates.sort(key=len)
+            base, rest = candidates[0], candidates[1:]
+        keep = base.keys()
+        for c in rest:
+            keep = keep & c.keys()   # C-level set intersection, iterates the smaller side
+        return [_RecordView(e, "edikt", eid) for eid, e in base.items() if eid in keep]
+
+
+def update_edikt_field(edikt_id: str, **kwargs):
+    """Patch specific fields on an existing edikt (pdf_text goes to the blob store)."""
+    _externalize(kwargs, "edikt")
+    with _transaction() as (cache, backend):
+        edikt = cache.by_id.get(edikt_id)
+        if edikt is None:
+            return
+        fields = {**kwargs, "updated_at": datetime.now().isoformat()}
+        cache.patch(edikt, fields)
+        cache.commit(backend, [("patch_edikt", edikt_id, fields)])
+
+
+def delete_edikt(edikt_id: str):
+    with _transaction() as (cache, backend):
+        cache.remove(edikt_id)
+        ops = [("delete_edikt", edikt_id)]
         # Also remove analysis
-        analyses = _read(config.ANALYSES_JSON)
-        analyses.pop(edikt_id, None)
-        _write(config.ANALYSES_JSON, analyses)
+        if cache.pop_analysis(edikt_id) is not None:
+            ops.append(("delete_analysis", edikt_id))
+        cache.commit(backend, ops)
 
 
-# ── Analysis CRUD ─────────────────────────────────────────────────────────────
+def compact():
+    """
+    Fold the JSON change journal into the snapshot files now (no-op for
+    sqlite), then drop unreferenced blobs.
+    """
+    with _transaction() as (cache, backend):
+        if isinstance(backend, JsonBackend):
+            backend.compact(cache)
+            cache.fingerprint = backend.fingerprint()
+        _sweep_blobs(cache)
+
 
-def load_all_analyses() -> dict:
-    """Returns dict keyed by edikt_id."""
+@atexit.register
+def _close_backend():
     with _lock:
-        return _read(config.ANALYSES_JSON)
+        if _backend is not None:
+            _backend.close()
+
+
+# ── Analysis CRUD ─────────────────────────────────────────────────────────────
+
+def load_all_analyses(cold: bool = False) -> Mapping:
+    """
+    Read-only view of all analyses, keyed by edikt_id.  With cold=True the
+    cold fields of every analysis are decoded up front in one pass – for
+    views that read them for each row instead of one file open per record.
+    """
+    if not cold:
+        with _lock:
+            cache, _ = _fresh_cache()
+            return _ReadOnlyAnalyses(cache.analyses)
+    with _transaction() as (cache, backend):
+        for key, fields in backend.load_cold_many("analysis").items():
+            rec = cache.analyses.get(key)
+            if rec is not None:
+                for field, value in fields.items():
+                    rec.setdefault(field, value)
+        return _ReadOnlyAnalyses(cache.analyses, complete=True)
 
 
 def save_analysis(edikt_id: str, analysis: dict):
-    with _lock:
-        analyses = _read(config.ANALYSES_JSON)
+    """Upsert the analysis of an edikt; raw_response goes to the blob store."""
+    _externalize(analysis, "analysis")
+    with _transaction() as (cache, backend):
         analysis["edikt_id"]    = edikt_id
         analysis["analyzed_at"] = datetime.now().isoformat()
-        analyses[edikt_id]      = analysis
-        _write(config.ANALYSES_JSON, analyses)
+        cache.put_analysis(edikt_id, analysis)
+        cache.commit(backend, [("put_analysis", edikt_id, analysis)])
 
 
-def get_analysis(edikt_id: str) -> Optional[dict]:
+def get_analysis(edikt_id: str) -> Optional[Mapping]:
     with _lock:
-        analyses = _read(config.ANALYSES_JSON)
-        return analyses.get(edikt_id)
+        cache, _ = _fresh_cache()
+        analysis = cache.analyses.get(edikt_id)
+        return _RecordView(analysis, "analysis", edikt_id) if analysis is not None else None
+
+
+# ── Blob store ────────────────────────────────────────────────────────────────
+#
+# Large values – raw LLM responses, the full extracted Gutachten text – are
+# kept out of the records in data/blobs/<aa>/<sha256>[.zst], addressed by the
+# sha256 of the uncompressed bytes.  A record only carries "<field>_ref";
+# _RecordView resolves the field on access, so the cached data (and the
+# snapshot files) no longer grow with the size of the model output.
+
+# Record fields stored as blobs, per kind
+_BLOB_FIELDS = {"edikt": ("pdf_text",), "analysis": ("raw_response",)}
+
+
+def _blob_path(key: str) -> Path:
+    return config.BLOBS_DIR / key[:2] / key[2:]
+
+
+def put_blob(data: bytes | str) -> str:
+    """Store data (idempotent, deduplicated) and return its key."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    key = hashlib.sha256(data).hexdigest()
+    path = _blob_path(key)
+    for existing in (path.with_suffix(".zst"), path):
+        try:
+            os.utime(existing)   # fresh mtime: a concurrent gc_blobs() keeps it
+            return key
+        except FileNotFoundError:
+            pass
+    if config.BLOB_COMPRESSION and zstandard is not None:
+        path, data = path.with_suffix(".zst"), zstandard.ZstdCompressor(level=3).compress(data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())   # durable before any record refers to it
+    os.replace(tmp, path)
+    return key
+
+
+def get_blob(key: str) -> bytes:
+    """Raises KeyError for an unknown key, StorageCorruptError for a damaged blob."""
+    path = _blob_path(key)
+    try:
+        raw = path.with_suffix(".zst").read_bytes()
+    except FileNotFoundError:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+    else:
+        if zstandard is None:
+            raise StorageCorruptError(
+                f"Blob {key[:12]}… ist zstd-komprimiert – bitte das Paket zstandard installieren"
+            )
+        try:
+            data = zstandard.ZstdDecompressor().decompress(raw)
+        except zstandard.ZstdError as e:
+            raise StorageCorruptError(f"Blob {key[:12]}… ist beschädigt ({e})") from e
+    if hashlib.sha256(data).hexdigest() != key:
+        raise StorageCorruptError(f"Blob {key[:12]}… ist beschädigt (Prüfsumme)")
+    return data
+
+
+def _blob_text(key: str) -> str:
+    try:
+        return get_blob(key).decode("utf-8")
+    except StorageCorruptError as e:
+        logger.error("%s", e)
+        raise KeyError(key) from e
+
+
+def _externalize(rec: dict, kind: str) -> dict:
+    """Move rec's inline blob fields into the blob store, leaving "<field>_ref"."""
+    for field in _BLOB_FIELDS[kind]:
+        if field in rec:
+            value = rec.pop(field)
+            if value:
+                rec[field + "_ref"] = put_blob(value if isinstance(value, bytes) else str(value))
+    return rec
+
+
+def _sweep_blobs(cache: "_Cache", grace: Optional[float] = None) -> int:
+    """Delete blobs no cached record references.  Call with _lock and _file_lock held."""
+    live = {rec.get(field + "_ref")
+            for kind, records in (("edikt", cache.edikte), ("analysis", cache.analyses.values()))
+            for rec in records
+            for field in _BLOB_FIELDS[kind]}
+    live |= _sweep_pdf_texts()
+    cutoff = time.time() - (config.BLOB_GC_GRACE if grace is None else grace)
+    removed = 0
+    for path in config.BLOBS_DIR.glob("??/*"):
+        key = path.parent.name + path.name.split(".", 1)[0]
+        if key in live and not path.name.endswith(".tmp"):
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def gc_blobs(grace: Optional[float] = None) -> int:
+    """
+    Delete blobs that no edikt / analysis references any more and that are
+    older than `grace` seconds (default config.BLOB_GC_GRACE).  Runs after
+    every journal compaction.  Returns the number of files removed.
+    """
+    with _transaction() as (cache, _):
+        return _sweep_blobs(cache, grace)
+
+
+# ── Extracted PDF text cache ──────────────────────────────────────────────────
+#
+# Text extraction of a 30-page Gutachten takes seconds, so its result is kept
+# per PDF content: data/pdf_texts/<sha256 of the PDF>.v<extractor version>.json
+# holds the text's blob key, the offset of every page in it, and the PDF files
+# (path, size, mtime) it was extracted from.  An entry is evicted once none of
+# those files exists unchanged any more – on gc_blobs() / compaction, or right
+# away when storage itself moves the PDF away (archive).  Its text blob is shared
+# with the edikt's pdf_text (same content, same key).
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _pdf_text_entry(digest: str, version: int) -> Path:
+    return config.PDF_TEXT_DIR / f"{digest}.v{version}.json"
+
+
+def _source_key(pdf_path: Path) -> str:
+    try:
+        return Path(pdf_path).resolve().relative_to(config.DATA_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(Path(pdf_path).resolve())
+
+
+def _source_path(key: str) -> Path:
+    path = Path(key)
+    return path if path.is_absolute() else config.DATA_DIR / path
+
+
+def _source_stamp(path: Path) -> Optional[list[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write_pdf_text_entry(path: Path, entry: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(entry), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def get_pdf_text(pdf_path: Path, digest: str, version: int) -> Optional[tuple[str, list[int]]]:
+    """Cached (text, page offsets) of the PDF with content hash `digest`, or None."""
+    path = _pdf_text_entry(digest, version)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        text = _blob_text(entry["text_ref"])
+    except (OSError, ValueError, KeyError):
+        return None
+    key, stamp = _source_key(pdf_path), _source_stamp(Path(pdf_path))
+    if stamp and entry["files"].get(key) != stamp:
+        # Same content under another name (re-download, copy) – keep it alive too
+        entry["files"][key] = stamp
+        _write_pdf_text_entry(path, entry)
+    return text, entry["pages"]
+
+
+def put_pdf_text(pdf_path: Path, digest: str, version: int, text: str, pages: list[int]):
+    """Cache the extraction result of the PDF with content hash `digest`."""
+    stamp = _source_stamp(Path(pdf_path))
+    _write_pdf_text_entry(_pdf_text_entry(digest, version), {
+        "text_ref": put_blob(text),
+        "pages": pages,
+        "files": {_source_key(pdf_path): stamp} if stamp else {},
+    })
+    for old in config.PDF_TEXT_DIR.glob(f"{digest}.v*.json"):
+        if old.name != _pdf_text_entry(digest, version).name:
+            old.unlink(missing_ok=True)   # output of another extractor version
+
+
+def evict_pdf_texts(pdf_paths: list[Path]):
+    """Drop these PDFs from the cache entries; entries left without a PDF are deleted."""
+    keys = {_source_key(p) for p in pdf_paths}
+    if not keys:
+        return
+    for path in config.PDF_TEXT_DIR.glob("*.json"):
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        files = entry.get("files", {})
+        if not keys & files.keys():
+            continue
+        entry["files"] = {k: v for k, v in files.items() if k not in keys}
+        if entry["files"]:
+            _write_pdf_text_entry(path, entry)
+        else:
+            path.unlink(missing_ok=True)
+
+
+def _sweep_pdf_texts() -> set[str]:
+    """Delete cache entries whose PDFs are gone or changed; returns the live text blob keys."""
+    live = set()
+    for path in config.PDF_TEXT_DIR.glob("*.json"):
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue   # being written right now – looked at again next time
+        files = {k: v for k, v in entry.get("files", {}).items() if _source_stamp(_source_path(k)) == v}
+        if not files:
+            path.unlink(missing_ok=True)
+            continue
+        if files != entry["files"]:
+            entry["files"] = files
+            _write_pdf_text_entry(path, entry)
+        live.add(entry["text_ref"])
+    return live
+
+
+# ── OCR page cache ────────────────────────────────────────────────────────────
+#
+# OCR of one scanned page takes seconds, so its text is kept per rendered page
+# image: data/ocr/<aa>/<sha256 of the image>.<languages>.txt.  Entries are never
+# evicted – they are small, and a page seen again (re-download, the same
+# Gutachten for another Edikt, a new extractor version) is not OCR'd twice.
+# Written from the PDF worker processes; content-addressed, so racing writers
+# produce the same file.
+
+def _ocr_entry(digest: str, languages: str) -> Path:
+    return config.OCR_DIR / digest[:2] / f"{digest[2:]}.{languages}.txt"
+
+
+def get_ocr_text(digest: str, languages: str) -> Optional[str]:
+    """Cached OCR text of the page image with hash `digest`, or None."""
+    try:
+        return _ocr_entry(digest, languages).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def put_ocr_text(digest: str, languages: str, text: str):
+    path = _ocr_entry(digest, languages)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
 
 
 # ── PDF path helper ───────────────────────────────────────────────────────────
@@ -130,26 +1770,171 @@ def has_pdf(edikt_id: str) -> bool:
     return pdf_path_for(edikt_id).exists()
 
 
+# ── Archive ───────────────────────────────────────────────────────────────────
+#
+# Edikte whose auction is over are moved out of the live store into monthly
+# partitions data/archive/<YYYY-MM>/ (edikte.json, analyses.json, downloads/),
+# by versteigerung date.  Partitions are self-contained – cold and blob fields
+# are stored inline – and are only read on demand, so the working set the
+# GUI loads stays bounded however long the history grows.
+
+_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+
+
+def _archive_dir(month: str) -> Path:
+    return config.ARCHIVE_DIR / month
+
+
+def archived_months() -> list[str]:
+    """Archive partitions ("YYYY-MM"), oldest first."""
+    if not config.ARCHIVE_DIR.exists():
+        return []
+    return sorted(p.name for p in config.ARCHIVE_DIR.iterdir()
+                  if p.is_dir() and _MONTH_RE.fullmatch(p.name))
+
+
+def archived_pdf_path(month: str, edikt_id: str) -> Path:
+    return _archive_dir(month) / "downloads" / f"gutachten_{edikt_id}.pdf"
+
+
+def load_archive(month: str) -> tuple[tuple[Mapping, ...], Mapping]:
+    """Read one archive partition: (edikte, analyses keyed by edikt_id), read-only."""
+    d = _archive_dir(month)
+    with _lock, _file_lock:
+        edikte, _   = _read(d / "edikte.json")
+        analyses, _ = _read(d / "analyses.json")
+    return (tuple(MappingProxyType(e) for e in edikte or []),
+            MappingProxyType({k: MappingProxyType(v) for k, v in (analyses or {}).items()}))
+
+
+def _full_record(backend, kind: str, key: str, rec: dict) -> dict:
+    """Copy of a cached record with its cold fields loaded and blob fields inlined."""
+    for field, value in (backend.load_cold(kind, key) or {}).items():
+        rec.setdefault(field, value)
+    full = dict(rec)
+    for field in _BLOB_FIELDS[kind]:
+        ref = full.pop(field + "_ref", None)
+        if ref:
+            try:
+                full.setdefault(field, get_blob(ref).decode("utf-8"))
+            except (KeyError, StorageCorruptError) as e:
+                logger.warning("Archiving %s without %s: %s", key, field, e)
+    return full
+
+
+def _archive_partition(cache: "_Cache", backend, month: str, ids: list[str]):
+    d = _archive_dir(month)
+    (d / "downloads").mkdir(parents=True, exist_ok=True)
+    edikte, _   = _read(d / "edikte.json")
+    analyses, _ = _read(d / "analyses.json")
+    edikte, analyses = edikte or [], analyses or {}
+    pos = {e.get("id"): i for i, e in enumerate(edikte)}
+    for eid in ids:
+        # Keyed by id, so re-running after an interrupted job is harmless
+        rec = _full_record(backend, "edikt", eid, cache.by_id[eid])
+        if eid in pos:
+            edikte[pos[eid]] = rec
+        else:
+            pos[eid] = len(edikte)
+            edikte.append(rec)
+        analysis = cache.analyses.get(eid)
+        if analysis is not None:
+            analyses[eid] = _full_record(backend, "analysis", eid, analysis)
+    _write(d / "edikte.json", _dump_json(edikte))
+    _write(d / "analyses.json", _dump_json(analyses))
+    moved = [eid for eid in ids if has_pdf(eid)]
+    # The archived records keep their full text inline – no cache entries needed
+    evict_pdf_texts([pdf_path_for(eid) for eid in moved])
+    for eid in moved:
+        shutil.move(pdf_path_for(eid), archived_pdf_path(month, eid))
+        cache.stats.pdf_files.discard(eid)
+
+
+def archive_expired(retention_days: Optional[int] = None) -> dict[str, int]:
+    """
+    Move edikte whose auction lies more than `retention_days` (default
+    config.ARCHIVE_AFTER_DAYS; 0 disables) in the past into their monthly
+    archive partition, together with their analyses and PDFs.  Edikte
+    without a parseable auction date stay live.
+    Returns {month: number of edikte archived}.
+    """
+    days = config.ARCHIVE_AFTER_DAYS if retention_days is None else retention_days
+    if days <= 0:
+        return {}
+    cutoff = date.today().toordinal() - days
+    with _transaction() as (cache, backend):
+        expired = cache.by_date[:bisect.bisect_left(cache.by_date, (cutoff, ""))]
+        partitions: dict[str, list[str]] = {}
+        for ordinal, eid in expired:
+            d = date.fromordinal(ordinal)
+            partitions.setdefault(f"{d.year:04d}-{d.month:02d}", []).append(eid)
+        # Partitions (and PDFs) first: a crash before the live store is
+        # updated only means the next run archives the same edikte again
+        for month, ids in sorted(partitions.items()):
+            _archive_partition(cache, backend, month, ids)
+        ops = []
+        for eid in cache.remove_many([eid for _, eid in expired]):
+            ops.append(("delete_edikt", eid))
+            if cache.pop_analysis(eid) is not None:
+                ops.append(("delete_analysis", eid))
+        cache.commit(backend, ops)
+    if partitions:
+        logger.info("Archived %d expired edikte into %d partitions", len(expired), len(partitions))
+    return {month: len(ids) for month, ids in partitions.items()}
+
+
+def purge_archive(keep_months: Optional[int] = None) -> list[str]:
+    """
+    Delete archive partitions (records, analyses and PDFs) whose month is
+    more than `keep_months` (default config.PURGE_AFTER_MONTHS; 0 disables)
+    before the current one.  Returns the purged months.
+    """
+    months = config.PURGE_AFTER_MONTHS if keep_months is None else keep_months
+    if months <= 0:
+        return []
+    today = date.today()
+    limit = today.year * 12 + today.month - 1 - months
+    purged = []
+    with _lock, _file_lock:
+        for month in archived_months():
+            year, mon = map(int, month.split("-"))
+            if year * 12 + mon - 1 < limit:
+                shutil.rmtree(_archive_dir(month))
+                purged.append(month)
+    if purged:
+        logger.info("Purged archive months %s", ", ".join(purged))
+    return purged
+
+
 # ── Statistics ────────────────────────────────────────────────────────────────
 
 def get_stats() -> dict:
-    edikte   = load_all_edikte()
-    analyses = load_all_analyses()
-    with_pdf = sum(1 for e in edikte if has_pdf(e.get("id", "")))
-    scores   = [
-        a.get("investitions_score", 0)
-        for a in analyses.values()
-        if isinstance(a.get("investitions_score"), (int, float))
-    ]
-    return {
-        "total_edikte":   len(edikte),
-        "total_analyses": len(analyses),
-        "with_pdf":       with_pdf,
-        "avg_score":      round(sum(scores) / len(scores), 1) if scores else 0,
-        "top_score":      max(scores, default=0),
-        "empfehlungen": {
-            "KAUFEN": sum(1 for a in analyses.values() if a.get("empfehlung") == "KAUFEN"),
-            "PRÜFEN": sum(1 for a in analyses.values() if a.get("empfehlung") == "PRÜFEN"),
-            "MEIDEN": sum(1 for a in analyses.values() if a.get("empfehlung") == "MEIDEN"),
-        },
-    }
+    """KPIs for the overview tab, from the cache's running aggregates (O(1))."""
+    with _lock:
+        cache, _ = _fresh_cache()
+        return cache.stats.as_dict(len(cache.edikte), len(cache.analyses))
+
+
+def recount_stats() -> dict:
+    """
+    Recompute the statistics from scratch – one has_pdf() per edikt, one
+    pass over the analyses – and compare them with the running aggregates.
+    Differences are logged and the aggregates are reset to the recount.
+    Returns the recounted statistics.
+    """
+    with _transaction() as (cache, _):
+        fresh = _Stats()
+        for a in cache.analyses.values():
+            fresh.add_analysis(a)
+        fresh.pdf_files = {e.get("id") for e in cache.edikte if has_pdf(e.get("id", ""))}
+        fresh.pdf_ids = set(fresh.pdf_files)
+        expected = fresh.as_dict(len(cache.edikte), len(cache.analyses))
+        actual = cache.stats.as_dict(len(cache.edikte), len(cache.analyses))
+        for key, value in expected.items():
+            if actual[key] != value:
+                logger.warning("Statistics drift in %s: running %r, recount %r", key, actual[key], value)
+        cache.stats.scores, cache.stats.score_sum = fresh.scores, fresh.score_sum
+        cache.stats.empfehlungen = fresh.empfehlungen
+        cache.stats.pdf_files |= fresh.pdf_files
+        cache.stats.pdf_ids = fresh.pdf_ids
+        return expected